@@ -0,0 +1,74 @@
+"""
+Synthetic API payloads shaped like the responses of the Football API, used by the benchmarks.
+"""
+import json
+from datetime import datetime, timedelta, timezone
+
+LEAGUE_ID = 39
+SEASON = 2023
+
+
+def _team(team_id):
+    return {"id": team_id, "name": f"Team {team_id}", "logo": f"https://media.api-sports.io/football/teams/{team_id}.png"}
+
+
+def season_fixtures(teams: int = 20):
+    """
+    :return: The items of the fixtures response of a double round-robin season
+    """
+    team_ids = list(range(33, 33 + teams))
+    kickoff = datetime(SEASON, 8, 11, 19, tzinfo=timezone.utc)
+    items = []
+    fixture_id = 1035000
+    for home in team_ids:
+        for away in team_ids:
+            if home == away:
+                continue
+            fixture_id += 1
+            date = kickoff + timedelta(hours=fixture_id % 900)
+            home_goals, away_goals = fixture_id % 4, (fixture_id // 4) % 3
+            items.append({
+                "fixture": {
+                    "id": fixture_id,
+                    "referee": f"Referee {fixture_id % 25}",
+                    "timezone": "UTC",
+                    "date": date.isoformat(),
+                    "timestamp": int(date.timestamp()),
+                    "periods": {"first": int(date.timestamp()), "second": int(date.timestamp()) + 3600},
+                    "venue": {"id": 500 + home, "name": f"Stadium {home}", "city": f"City {home}"},
+                    "status": {"long": "Match Finished", "short": "FT", "elapsed": 90},
+                },
+                "league": {
+                    "id": LEAGUE_ID,
+                    "name": "Premier League",
+                    "country": "England",
+                    "logo": "https://media.api-sports.io/football/leagues/39.png",
+                    "flag": "https://media.api-sports.io/flags/gb.svg",
+                    "season": SEASON,
+                    "round": f"Regular Season - {fixture_id % 38 + 1}",
+                },
+                "teams": {
+                    "home": dict(_team(home), winner=home_goals > away_goals if home_goals != away_goals else None),
+                    "away": dict(_team(away), winner=away_goals > home_goals if home_goals != away_goals else None),
+                },
+                "goals": {"home": home_goals, "away": away_goals},
+                "score": {
+                    "halftime": {"home": home_goals // 2, "away": away_goals // 2},
+                    "fulltime": {"home": home_goals, "away": away_goals},
+                    "extratime": {"home": None, "away": None},
+                    "penalty": {"home": None, "away": None},
+                },
+            })
+    return items
+
+
+def response(path: str, items):
+    return {"get": path, "parameters": {}, "errors": [], "results": len(items),
+            "paging": {"current": 1, "total": 1}, "response": items}
+
+
+def season_fixtures_body(teams: int = 20):
+    """
+    :return: The JSON body of the fixtures response of a season
+    """
+    return json.dumps(response("fixtures", season_fixtures(teams))).encode("utf-8")
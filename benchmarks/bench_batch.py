@@ -0,0 +1,73 @@
+"""
+Latency of the seven calls of a match page, one after another and with FootballAPI.batch, over a
+transport answering each request after a fixed delay.
+
+Run from the repository root:
+
+    python benchmarks/bench_batch.py
+"""
+import json
+import time
+
+from footballAPIClient.footballAPI import FootballAPI
+
+CALLS = [
+    ("get_fixtures", {"id": 1035037}),
+    ("get_fixture_events", {"fixture": 1035037}),
+    ("get_fixture_lineups", {"fixture": 1035037}),
+    ("get_fixture_statistics", {"fixture": 1035037}),
+    ("get_fixture_player_statistics", {"fixture": 1035037}),
+    ("get_predictions", {"fixture": 1035037}),
+    ("get_head_to_head", {"h2h": "33-34"}),
+]
+
+
+class Response:
+
+    def __init__(self, body: dict):
+        self.status_code = 200
+        self.headers = {"x-ratelimit-requests-limit": "75000", "x-ratelimit-requests-remaining": "70000"}
+        self.content = json.dumps(body).encode("utf-8")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class SlowTransport:
+    """
+    Answers every request after ``latency`` seconds, like a remote API would.
+    """
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def request(self, method, url, headers=None, params=None, data=None):
+        time.sleep(self.latency)
+        if url.endswith("/status"):
+            return Response({"errors": [], "response": {"requests": {"current": 0, "limit_day": 75000}}})
+        return Response({"get": url, "parameters": params, "errors": [], "results": 0,
+                         "paging": {"current": 1, "total": 1}, "response": []})
+
+    def close(self):
+        pass
+
+
+def main(latency: float = 0.08):
+    fp = FootballAPI("api-sports", api_key="benchmark", transport=SlowTransport(latency), cache_size=0)
+
+    started = time.perf_counter()
+    for name, kwargs in CALLS:
+        getattr(fp, name)(**kwargs)
+    sequential = (time.perf_counter() - started) * 1e3
+
+    started = time.perf_counter()
+    fp.batch(CALLS)
+    batched = (time.perf_counter() - started) * 1e3
+
+    print(f"{len(CALLS)} calls, {latency * 1e3:.0f} ms each")
+    print(f"one after another   {sequential:8.1f} ms")
+    print(f"batch               {batched:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
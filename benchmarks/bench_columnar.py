@@ -0,0 +1,50 @@
+"""
+Goals per team over seasons of fixtures: walking the decoded JSON, and with the columnar export.
+
+Run from the repository root:
+
+    python benchmarks/bench_columnar.py
+"""
+import json
+import timeit
+from collections import defaultdict
+
+from _payloads import season_fixtures_body
+from footballAPIClient.columnar import TableBuilder, goals_per_team
+
+
+def goals_per_team_dicts(responses):
+    teams = defaultdict(lambda: [0, 0, 0])
+    for response in responses:
+        for item in response["response"]:
+            home, away = item["goals"]["home"], item["goals"]["away"]
+            if home is None or away is None:
+                continue
+            for team, scored, conceded in ((item["teams"]["home"]["id"], home, away),
+                                           (item["teams"]["away"]["id"], away, home)):
+                totals = teams[team]
+                totals[0] += 1
+                totals[1] += scored
+                totals[2] += conceded
+    return teams
+
+
+def main(seasons: int = 10):
+    responses = [json.loads(season_fixtures_body()) for _ in range(seasons)]
+    rows = sum(len(response["response"]) for response in responses)
+    table = TableBuilder("fixtures").extend(responses).build()
+
+    def best(fn, number=20):
+        return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e3
+
+    walk = best(lambda: goals_per_team_dicts(responses))
+    build = best(lambda: TableBuilder("fixtures").extend(responses).build(), number=3)
+    aggregate = best(lambda: goals_per_team(table))
+    print(f"{rows} fixtures")
+    print(f"dict walking                 {walk:8.2f} ms")
+    print(f"columnar aggregate           {aggregate:8.2f} ms ({walk / aggregate:.0f}x faster)")
+    print(f"building the table, once     {build:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
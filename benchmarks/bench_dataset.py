@@ -0,0 +1,60 @@
+"""
+Reloading a decade of fixtures of a league: from JSON files, and from a partitioned Dataset.
+
+Run from the repository root:
+
+    python benchmarks/bench_dataset.py
+"""
+import json
+import os
+import tempfile
+import timeit
+
+from _payloads import response, season_fixtures
+from footballAPIClient.columnar import TableBuilder
+from footballAPIClient.dataset import Dataset
+
+YEAR = 365 * 24 * 3600
+
+
+def decade(seasons):
+    for offset in range(seasons):
+        items = season_fixtures()
+        for item in items:
+            item["league"]["season"] += offset - seasons + 1
+            item["fixture"]["timestamp"] += (offset - seasons + 1) * YEAR
+        yield response("fixtures", items)
+
+
+def main(seasons: int = 10):
+    with tempfile.TemporaryDirectory() as root:
+        files = []
+        for season, data in enumerate(decade(seasons)):
+            files.append(os.path.join(root, f"fixtures-{season}.json"))
+            with open(files[-1], "w") as file:
+                json.dump(data, file)
+        dataset = Dataset(os.path.join(root, "dataset"))
+        for data in decade(seasons):
+            dataset.write("fixtures", data)
+
+        def reload_json():
+            builder = TableBuilder("fixtures")
+            for name in files:
+                with open(name) as file:
+                    builder.append(json.load(file))
+            return builder.build()
+
+        def best(fn, number=5):
+            return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e3
+
+        rows = len(dataset.read("fixtures"))
+        print(f"{rows} fixtures over {seasons} seasons")
+        print(f"JSON files to a table        {best(reload_json):8.2f} ms")
+        print(f"dataset, whole               {best(lambda: dataset.read('fixtures')):8.2f} ms")
+        print(f"dataset, one team, 2 columns "
+              f"{best(lambda: dataset.read('fixtures', team=33, columns=('fixture_id', 'goals_home'))):8.2f} ms")
+        print(f"dataset, last 3 seasons      {best(lambda: dataset.read('fixtures', date_from='2021-07-01')):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Memory held by a season of fixtures kept as decoded JSON and in an EntityStore.
+
+Run from the repository root:
+
+    python benchmarks/bench_entity_store.py
+"""
+import json
+import tracemalloc
+
+from _payloads import season_fixtures_body
+from footballAPIClient.entityStore import EntityStore
+
+
+def held_memory(build):
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main():
+    body = season_fixtures_body()
+
+    def as_json():
+        return json.loads(body)
+
+    def as_store():
+        store = EntityStore()
+        store.add("fixtures", json.loads(body))
+        return store
+
+    json_size = held_memory(as_json)
+    store_size = held_memory(as_store)
+    store = as_store()
+    print(f"{len(json.loads(body)['response'])} fixtures, {store.stats()}")
+    print(f"decoded JSON  {json_size / 2 ** 20:6.2f} MiB")
+    print(f"EntityStore   {store_size / 2 ** 20:6.2f} MiB ({json_size / store_size:.1f}x less)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Import-time benchmark, based on ``python -X importtime``.
+
+Run from the repository root:
+
+    python benchmarks/bench_import.py
+
+Results are recorded in benchmarks/README.md.
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STATEMENTS = (
+    ("import footballAPIClient", "footballAPIClient"),
+    ("import footballAPIClient.footballAPI", "footballAPIClient.footballAPI"),
+    ("from footballAPIClient.helpers.ParameterValidator import ParameterValidator",
+     "footballAPIClient.helpers.ParameterValidator"),
+)
+
+
+def cumulative_us(statement, module, runs=7):
+    """
+    :return: The best cumulative import time in microseconds of ``module`` when running ``statement``
+    """
+    env = dict(os.environ, PYTHONPATH=ROOT, PYTHONDONTWRITEBYTECODE="")
+    best = None
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                                env=env, capture_output=True, text=True, check=True)
+        for line in result.stderr.splitlines():
+            parts = [part.strip() for part in line.split("|")]
+            if len(parts) == 3 and parts[2] == module:
+                value = int(parts[1])
+                best = value if best is None else min(best, value)
+    return best
+
+
+def main():
+    print(f"{'statement':<80}{'ms':>8}")
+    for statement, module in STATEMENTS:
+        print(f"{statement:<80}{cumulative_us(statement, module) / 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Wall time of the ingestion of 12 seasons into a Dataset, with one worker process and with one per core,
+over a transport serving canned bodies.
+
+Run from the repository root:
+
+    python benchmarks/bench_ingestion.py
+"""
+import json
+import os
+import tempfile
+import time
+
+from _payloads import response, season_fixtures
+from footballAPIClient.dataset import Dataset
+from footballAPIClient.ingestion import IngestionRunner
+
+HEADERS = {"x-ratelimit-requests-limit": "75000", "x-ratelimit-requests-remaining": "70000"}
+
+
+class Response:
+
+    def __init__(self, content: bytes):
+        self.status_code = 200
+        self.headers = HEADERS
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content)
+
+
+def _details(item):
+    home, away = item["teams"]["home"], item["teams"]["away"]
+    event = {"time": {"elapsed": 10, "extra": None}, "team": home, "player": {"id": 7, "name": "Player 7"},
+             "assist": {"id": 8, "name": "Player 8"}, "type": "Goal", "detail": "Normal Goal", "comments": None}
+    players = [{"player": {"id": team["id"] * 100 + number, "name": f"Player {number}", "number": number,
+                           "pos": "M", "grid": None}} for team in (home, away) for number in range(1, 12)]
+    statistics = [{"type": name, "value": value} for name, value in
+                  (("Shots on Goal", 5), ("Total Shots", 12), ("Ball Possession", "55%"), ("expected_goals", "1.3"))]
+    return dict(
+        item,
+        events=[event] * 8,
+        lineups=[{"team": team, "formation": "4-3-3", "coach": {"id": team["id"]},
+                  "startXI": players[:11], "substitutes": players[11:]} for team in (home, away)],
+        statistics=[{"team": team, "statistics": statistics} for team in (home, away)],
+        players=[{"team": team, "players": [{"player": entry["player"], "statistics": [
+            {"games": {"minutes": 90, "rating": "7.1"}, "goals": {"total": 0}, "passes": {"total": 40}}]}
+            for entry in players]} for team in (home, away)])
+
+
+class CannedTransport:
+    """
+    Serves the teams, the fixtures and the fixtures by id of a season, encoded once per process.
+    """
+
+    _bodies = None
+
+    def request(self, method, url, headers=None, params=None, data=None):
+        if CannedTransport._bodies is None:
+            items = season_fixtures()
+            CannedTransport._bodies = {
+                "status": json.dumps({"errors": [], "response": {"requests": {"current": 0, "limit_day": 75000}}}),
+                "teams": json.dumps(response("teams", [{"team": item["teams"]["home"], "venue": item["fixture"]["venue"]}
+                                                       for item in items[::19]])),
+                "fixtures": json.dumps(response("fixtures", items)),
+                "ids": {item["fixture"]["id"]: _details(item) for item in items},
+            }
+        bodies = CannedTransport._bodies
+        path = url.rsplit("/", 1)[-1]
+        if path == "fixtures" and "ids" in params:
+            items = [bodies["ids"][int(fixture_id)] for fixture_id in params["ids"].split("-")]
+            return Response(json.dumps(response("fixtures", items)).encode("utf-8"))
+        return Response(bodies[path].encode("utf-8"))
+
+    def close(self):
+        pass
+
+
+def ingest(workers: int, seasons: int):
+    with tempfile.TemporaryDirectory() as root:
+        runner = IngestionRunner("api-sports", api_key="benchmark", sink=Dataset(os.path.join(root, "mirror")),
+                                 checkpoint=os.path.join(root, "checkpoint.jsonl"), max_workers=workers,
+                                 client_options={"transport": CannedTransport()})
+        started = time.perf_counter()
+        results = list(runner.run([(39, season) for season in range(2024 - seasons, 2024)]))
+        return time.perf_counter() - started, sum(result["requests"] for result in results)
+
+
+def main(seasons: int = 12):
+    cores = os.cpu_count()
+    single, requests = ingest(1, seasons)
+    parallel, _ = ingest(cores, seasons)
+    # teams, fixtures, then events, lineups and player statistics one fixture at a time
+    one_by_one = seasons * (2 + 3 * len(season_fixtures()))
+    print(f"{seasons} seasons, {requests} requests ({one_by_one} fetching the details one fixture at a time)")
+    print(f"1 worker            {single:8.2f} s")
+    print(f"{cores} workers{' ' * (12 - len(str(cores)))}{parallel:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
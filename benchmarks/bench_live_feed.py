@@ -0,0 +1,64 @@
+"""
+Bytes handed downstream while following live fixtures: the full live payload every poll, and the deltas of a LiveFeed.
+
+Run from the repository root:
+
+    python benchmarks/bench_live_feed.py
+"""
+import json
+
+from _payloads import response, season_fixtures
+from footballAPIClient.liveFeed import LiveFeed
+
+
+class LiveClient:
+    """
+    Serves live fixtures whose minute advances every poll, with a goal every 30 polls and a card every 17.
+    """
+
+    def __init__(self, fixtures: int):
+        self.items = season_fixtures()[:fixtures]
+        for item in self.items:
+            item["fixture"]["status"] = {"long": "First Half", "short": "1H", "elapsed": 0}
+            item["goals"] = {"home": 0, "away": 0}
+            item["events"] = []
+        self.polls = 0
+        self.body = b""
+
+    def get_fixtures(self, live=None, ids=None):
+        self.polls += 1
+        for item in self.items:
+            status = item["fixture"]["status"]
+            status["elapsed"] += 1
+            if status["elapsed"] == 46:
+                status.update(long="Second Half", short="2H")
+            team = item["teams"]["home"]
+            if (self.polls + item["fixture"]["id"]) % 30 == 0:
+                item["goals"]["home"] += 1
+                item["events"].append({"time": {"elapsed": status["elapsed"], "extra": None}, "team": team,
+                                       "player": {"id": 7, "name": "Player 7"}, "assist": {"id": None, "name": None},
+                                       "type": "Goal", "detail": "Normal Goal", "comments": None})
+            if (self.polls + item["fixture"]["id"]) % 17 == 0:
+                item["events"].append({"time": {"elapsed": status["elapsed"], "extra": None}, "team": team,
+                                       "player": {"id": 8, "name": "Player 8"}, "assist": {"id": None, "name": None},
+                                       "type": "Card", "detail": "Yellow Card", "comments": None})
+        self.body = json.dumps(response("fixtures", self.items)).encode("utf-8")
+        return json.loads(self.body)
+
+
+def main(fixtures: int = 40, polls: int = 90):
+    client = LiveClient(fixtures)
+    feed = LiveFeed(client, statistics_interval=None)
+    payload_bytes = delta_bytes = deltas = 0
+    for _ in range(polls):
+        polled = feed.poll()
+        payload_bytes += len(client.body)
+        deltas += len(polled)
+        delta_bytes += len(json.dumps([delta.to_dict() for delta in polled]))
+    print(f"{fixtures} live fixtures, {polls} polls")
+    print(f"full payloads     {payload_bytes / 2 ** 20:8.2f} MiB")
+    print(f"deltas            {delta_bytes / 2 ** 10:8.1f} KiB ({deltas} deltas)")
+
+
+if __name__ == "__main__":
+    main()
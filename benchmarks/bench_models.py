@@ -0,0 +1,51 @@
+"""
+Memory held by a season of fixtures decoded as dicts and as response models.
+
+Run from the repository root:
+
+    python benchmarks/bench_models.py
+"""
+import json
+import timeit
+import tracemalloc
+
+from _payloads import season_fixtures_body
+from footballAPIClient.responseModels import ApiResponse
+
+
+def held_memory(build, copies):
+    tracemalloc.start()
+    kept = [build() for _ in range(copies)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def build_time(build, number=20):
+    return min(timeit.repeat(build, number=number, repeat=5)) / number
+
+
+def main(copies: int = 10):
+    body = season_fixtures_body()
+
+    def as_dict():
+        return json.loads(body)
+
+    def as_models():
+        data = ApiResponse.from_dict("fixtures", json.loads(body))
+        data.response
+        return data
+
+    dict_size, dict_time = held_memory(as_dict, copies), build_time(as_dict)
+    model_size, model_time = held_memory(as_models, copies), build_time(as_models)
+    print(f"{copies} cached season responses of {len(json.loads(body)['response'])} fixtures "
+          f"({len(body) / 1024:.0f} KiB of JSON each)")
+    print(f"{'':<8}{'MiB held':>10}{'ms per response':>18}")
+    print(f"{'dicts':<8}{dict_size / 2 ** 20:>10.1f}{dict_time * 1e3:>18.1f}")
+    print(f"{'models':<8}{model_size / 2 ** 20:>10.1f}{model_time * 1e3:>18.1f}")
+    print(f"models hold {dict_size / model_size:.1f}x less memory")
+
+
+if __name__ == "__main__":
+    main()
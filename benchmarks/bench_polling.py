@@ -0,0 +1,69 @@
+"""
+Credits spent to follow a simulated match day: fixed timers, and the PollingScheduler with and without a budget.
+
+Run from the repository root:
+
+    python benchmarks/bench_polling.py
+"""
+from footballAPIClient.pollingScheduler import DEFAULT_INTERVALS, PollingScheduler
+
+KICKOFF = 1_700_000_000
+DAY_START = KICKOFF - 3600
+DAY_END = KICKOFF + 5 * 3600
+
+
+class MatchDay:
+    """
+    Fixtures kicking off in three waves an hour apart, whose status follows the clock of the simulation.
+    """
+
+    def __init__(self, fixtures: int):
+        self.now = DAY_START
+        self.kickoffs = {fixture_id: KICKOFF + 3600 * (fixture_id % 3) for fixture_id in range(1, fixtures + 1)}
+
+    def item(self, fixture_id: int):
+        elapsed = self.now - self.kickoffs[fixture_id]
+        status = "NS" if elapsed < 0 else "1H" if elapsed < 2700 else "HT" if elapsed < 3600 \
+            else "2H" if elapsed < 6300 else "FT"
+        return {"fixture": {"id": fixture_id, "timestamp": self.kickoffs[fixture_id], "status": {"short": status}}}
+
+    def get_fixtures(self, ids: str):
+        return {"errors": [], "response": [self.item(int(fixture_id)) for fixture_id in ids.split("-")]}
+
+    def get_fixture_lineups(self, fixture: int):
+        published = self.now >= self.kickoffs[fixture] - 1800
+        return {"errors": [], "response": [{}] if published else []}
+
+    def get_fixture_events(self, fixture: int):
+        return {"errors": [], "response": []}
+
+    get_fixture_statistics = get_in_play_odds = get_fixture_events
+
+
+def scheduled(fixtures: int, budget: int = None):
+    day = MatchDay(fixtures)
+    scheduler = PollingScheduler(day, budget=budget, clock=lambda: day.now)
+    scheduler.add([day.item(fixture_id) for fixture_id in day.kickoffs])
+    while True:
+        scheduler.run_pending()
+        due = scheduler.next_due()
+        if due is None or budget is not None and scheduler.spent >= budget:
+            break
+        day.now = max(day.now + 1, due)
+    return scheduler.stats()
+
+
+def main(fixtures: int = 30):
+    # every endpoint of every fixture at its interval, from an hour before the first kickoff to the end of the day
+    fixed = sum((DAY_END - DAY_START) // DEFAULT_INTERVALS[task] * fixtures
+                for task in ("lineups", "events", "statistics", "odds"))
+    print(f"{fixtures} fixtures")
+    print(f"fixed timers                 {fixed:6d} credits")
+    for budget in (None, 3000, 1000):
+        stats = scheduled(fixtures, budget)
+        polls = ", ".join(f"{task} {count}" for task, count in stats["polls"].items())
+        print(f"scheduler, budget {str(budget):<10} {stats['spent']:6d} credits ({polls})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Credits spent to keep 30 league seasons up to date for a week: full re-syncs, and the SeasonSync.
+
+Run from the repository root:
+
+    python benchmarks/bench_season_sync.py
+"""
+import os
+import tempfile
+
+from footballAPIClient._constants import MAX_FIXTURE_IDS
+from footballAPIClient.seasonSync import SeasonSync
+
+LEAGUES = 30
+ROUNDS = 38
+SEASON_START = 1_690_000_000
+WEEK = 7 * 86400
+DAY = 86400
+
+
+class Season:
+    """
+    Leagues of 380 fixtures, 10 per weekly round played on the Saturday in three waves, half of the
+    season played, whose status and score follow the clock of the simulation.
+    """
+
+    def __init__(self):
+        self.now = SEASON_START + ROUNDS // 2 * WEEK
+        self.credits = 0
+        self.kickoffs = {}
+        for league in range(1, LEAGUES + 1):
+            for number in range(ROUNDS * 10):
+                kickoff = SEASON_START + number // 10 * WEEK + 5 * DAY + 3600 * (12 + 2 * (number % 3))
+                self.kickoffs[league * 1000 + number] = (league, kickoff)
+
+    def item(self, fixture_id: int):
+        league, kickoff = self.kickoffs[fixture_id]
+        elapsed = self.now - kickoff
+        status = "NS" if elapsed < 0 else "1H" if elapsed < 2700 else "HT" if elapsed < 3600 \
+            else "2H" if elapsed < 6300 else "FT"
+        goals = None if elapsed < 0 else min(elapsed // 1800, 3)
+        return {"fixture": {"id": fixture_id, "timestamp": kickoff, "status": {"short": status}},
+                "league": {"id": league, "season": 2023}, "goals": {"home": goals, "away": 0 if goals else goals},
+                "events": [], "lineups": [], "statistics": [], "players": []}
+
+    def get_fixtures(self, league: int, season: int):
+        self.credits += 1
+        return {"errors": [], "response": [self.item(fixture_id) for fixture_id, (other, _) in self.kickoffs.items()
+                                           if other == league]}
+
+    def get_fixtures_bulk(self, ids):
+        ids = list(ids)
+        self.credits += -(-len(ids) // MAX_FIXTURE_IDS)
+        return {fixture_id: self.item(fixture_id) for fixture_id in ids}
+
+
+class NullSink:
+
+    def write(self, path, responses, league=None, season=None):
+        pass
+
+
+def full_resync(season: Season, syncs: int, step: float, by_id: bool):
+    for _ in range(syncs):
+        for league in range(1, LEAGUES + 1):
+            finished = [item["fixture"]["id"] for item in season.get_fixtures(league, 2023)["response"]
+                        if item["fixture"]["status"]["short"] != "NS"]
+            if by_id:
+                season.get_fixtures_bulk(finished)
+            else:
+                # events, lineups, statistics and player statistics one fixture at a time
+                season.credits += 4 * len(finished)
+        season.now += step
+    return season.credits
+
+
+def incremental(season: Season, syncs: int, step: float):
+    with tempfile.TemporaryDirectory() as root:
+        sync = SeasonSync(season, NullSink(), state=os.path.join(root, "sync.json"), clock=lambda: season.now)
+        shards = [(league, 2023) for league in range(1, LEAGUES + 1)]
+        # the first sync fetches the finished fixtures once, it is not counted
+        sync.sync(shards)
+        season.credits = 0
+        for _ in range(syncs):
+            season.now += step
+            sync.sync(shards)
+    return season.credits
+
+
+def main():
+    print(f"{LEAGUES} leagues, one week from the middle of the season")
+    print(f"full re-sync daily, per-fixture endpoints {full_resync(Season(), 7, DAY, False):8d} credits")
+    print(f"full re-sync daily, fixtures by id        {full_resync(Season(), 7, DAY, True):8d} credits")
+    print(f"SeasonSync daily                          {incremental(Season(), 7, DAY):8d} credits")
+    print(f"SeasonSync every 15 minutes               {incremental(Season(), 7 * 96, 900):8d} credits")
+
+
+if __name__ == "__main__":
+    main()
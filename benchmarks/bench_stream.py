@@ -0,0 +1,65 @@
+"""
+Decoding a large response body: whole body with each JSON backend, and streamed item by item.
+
+Run from the repository root:
+
+    python benchmarks/bench_stream.py
+"""
+import time
+import timeit
+import tracemalloc
+
+from _payloads import season_fixtures_body
+from footballAPIClient.helpers.JsonBackend import get_json_backend
+from footballAPIClient.helpers.JsonStream import ResponseStream
+
+CHUNK_SIZE = 65536
+
+
+def chunks(body):
+    for i in range(0, len(body), CHUNK_SIZE):
+        yield body[i:i + CHUNK_SIZE]
+
+
+def whole_body(loads, body):
+    return loads(body)["response"]
+
+
+def streamed(body):
+    count = 0
+    for _ in ResponseStream(chunks(body)):
+        count += 1
+    return count
+
+
+def peak_memory(fn, *args):
+    tracemalloc.start()
+    fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    body = season_fixtures_body(teams=40)
+    print(f"body of {len(body) / 2 ** 20:.1f} MiB, {CHUNK_SIZE // 1024} KiB chunks")
+    print(f"{'':<16}{'total ms':>10}{'first item ms':>15}{'peak MiB':>10}")
+    for name in ("json", "orjson"):
+        try:
+            loads = get_json_backend(name).loads
+        except ImportError:
+            continue
+        total = min(timeit.repeat(lambda: whole_body(loads, body), number=5, repeat=3)) / 5
+        peak = peak_memory(whole_body, loads, body)
+        print(f"{'whole ' + name:<16}{total * 1e3:>10.1f}{total * 1e3:>15.1f}{peak / 2 ** 20:>10.1f}")
+
+    total = min(timeit.repeat(lambda: streamed(body), number=5, repeat=3)) / 5
+    start = time.perf_counter()
+    next(iter(ResponseStream(chunks(body))))
+    first = time.perf_counter() - start
+    peak = peak_memory(streamed, body)
+    print(f"{'streamed':<16}{total * 1e3:>10.1f}{first * 1e3:>15.1f}{peak / 2 ** 20:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
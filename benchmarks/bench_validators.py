@@ -0,0 +1,61 @@
+"""
+Micro-benchmark of the per-call cost of ParameterValidator.
+
+Run from the repository root:
+
+    python benchmarks/bench_validators.py
+"""
+import re
+import timeit
+
+from footballAPIClient._constants import FIXTURE_STATUSES
+from footballAPIClient.helpers.ParameterValidator import ParameterValidator
+
+
+def _legacy_validate_status_field(status):
+    # implementation before the validators were precompiled, kept for comparison
+    pattern = r'^({})(?:-({}))*$'.format('|'.join(FIXTURE_STATUSES), '|'.join(FIXTURE_STATUSES))
+    if not re.match(pattern, status):
+        raise ValueError("Incorrect status value provided. ")
+
+
+def _legacy_validate_ids_field(ids):
+    if not re.match(r'^\d{1,}(?:-\d{1,}){0,19}$', ids):
+        raise ValueError("not a valid ids format.")
+
+
+def _legacy_validate_season_field(season):
+    if not re.match(r'^\d{4}$', str(season)):
+        raise ValueError("Invalid season format.")
+
+
+CASES = (
+    ("status", _legacy_validate_status_field, ParameterValidator.validate_status_field, "NS-1H-HT-2H-FT"),
+    ("ids", _legacy_validate_ids_field, ParameterValidator.validate_ids_field, "-".join(str(i) for i in range(20))),
+    ("season", _legacy_validate_season_field, ParameterValidator.validate_season_field, 2023),
+    ("live", None, ParameterValidator.validate_live_field, "all"),
+    ("h2h", None, ParameterValidator.validate_h2h_field, "33-34"),
+    ("date", None, ParameterValidator.validate_date_field, "2023-08-11"),
+)
+
+
+def per_call_ns(fn, value, number=100000):
+    best = min(timeit.repeat(lambda: fn(value), number=number, repeat=5))
+    return best / number * 1e9
+
+
+def main():
+    print(f"{'validator':<10}{'legacy ns/call':>16}{'current ns/call':>17}")
+    for name, legacy, current, value in CASES:
+        legacy_ns = f"{per_call_ns(legacy, value):.0f}" if legacy else "-"
+        print(f"{name:<10}{legacy_ns:>16}{per_call_ns(current, value):>17.0f}")
+
+    dates = [f"2023-{month:02d}-{day:02d}" for month in range(1, 13) for day in range(1, 29)] * 30
+    number = 20
+    best = min(timeit.repeat(lambda: ParameterValidator.validate_many(ParameterValidator.validate_date_field, dates),
+                             number=number, repeat=5))
+    print(f"validate_many: {len(dates)} dates in {best / number * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,4 +5,24 @@ __maintainer__ = "Rishav Ganguly"
 __email__ = "rishav.ganguly07@gmail.com"
 __status__ = "Beta"
 
-from footballAPIClient.footballAPI import FootballAPI
+__all__ = ["FootballAPI", "AsyncFootballAPI"]
+
+# The clients are imported on first access, so importing the package stays cheap
+# for the CLI and short-lived workers.
+_LAZY_ATTRIBUTES = {
+    "FootballAPI": "footballAPIClient.footballAPI",
+    "AsyncFootballAPI": "footballAPIClient.asyncFootballAPI",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
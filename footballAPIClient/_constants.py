@@ -4,3 +4,36 @@ FOOTBALL_API = "api-sports"
 # Base URIs
 RAPID_API_URI = "https://api-football-v1.p.rapidapi.com/v3"
 FOOTBALL_API_URI = "http://v3.football.api-sports.io"
+
+# Maximum number of fixture ids accepted by the ids parameter of the fixtures endpoint
+MAX_FIXTURE_IDS = 20
+
+# Fixture status short codes
+FIXTURE_STATUSES = (
+    'TBD',
+    'NS',
+    '1H',
+    'HT',
+    '2H',
+    'ET',
+    'BT',
+    'P',
+    'SUSP',
+    'INT',
+    'FT',
+    'AET',
+    'PEN',
+    'PST',
+    'CANC',
+    'ABD',
+    'AWD',
+    'WO',
+    'LIVE'
+)
+
+# Fixture statuses grouped by what can still change
+SCHEDULED_STATUSES = ('TBD', 'NS')
+IN_PLAY_STATUSES = ('1H', '2H', 'ET', 'P', 'LIVE')
+BREAK_STATUSES = ('HT', 'BT', 'SUSP', 'INT')
+FINISHED_STATUSES = ('FT', 'AET', 'PEN', 'AWD', 'WO')
+STOPPED_STATUSES = ('PST', 'CANC', 'ABD')
@@ -0,0 +1,382 @@
+import asyncio
+from collections import deque
+from typing import Iterable
+
+from footballAPIClient.footballAPI import FootballAPI, _BatchError
+from footballAPIClient.Exceptions.InternalApiException import InternalApiException
+from footballAPIClient.helpers.Endpoints import ENDPOINTS
+from footballAPIClient.helpers.AsyncHttpTransport import AsyncHttpTransport
+from footballAPIClient.helpers.JsonStream import AsyncResponseStream
+from footballAPIClient.helpers.FixtureDetails import chunk_fixture_ids
+from footballAPIClient.responseModels import MODELS
+
+
+class AsyncFootballAPI(FootballAPI):
+    """
+    Asyncio binding for the Football API. (https://www.api-football.com/documentation-v3)
+    It exposes every ``get_*`` method of FootballAPI as an awaitable, sharing the same parameter
+    validation, response cache and quota accounting. Invalid parameters raise as soon as the
+    method is called, before the returned awaitable is awaited.
+
+    Usage::
+
+        async with AsyncFootballAPI("api-sports", api_key="YOUR_API_KEY") as api:
+            fixtures = await api.get_fixtures(live="all")
+    """
+
+    def __init__(self,
+                 account_type: str,
+                 api_key: str = None,
+                 transport=None,
+                 max_concurrency: int = 100,
+                 limit_per_host: int = 0,
+                 timeout: float = 30,
+                 credit_resync_interval: float = 3600,
+                 credit_drift_tolerance: int = 5,
+                 cache_size: int = 1024,
+                 cache_ttls: dict = None,
+                 cache_backend=None,
+                 rate_limiter=None,
+                 rate_limit_timeout: float = None,
+                 retry_policy=None,
+                 coalesce_requests: bool = True,
+                 models: bool = False,
+                 entity_store=None,
+                 json_backend="auto",
+                 scheduler=None
+                 ):
+
+        """
+
+        :param account_type: Indicates weather the account is used from Rapid-API or from dashboard.
+        it consists of values: rapid-api, and api-sports
+        :param api_key: It uses API keys to allow access to the API.
+        :param transport: (optional) A custom asynchronous transport exposing ``request`` and ``close``
+        coroutines. By default an AsyncHttpTransport is created and owned by the client.
+        :param max_concurrency: The maximum number of requests in flight at once.
+        :param limit_per_host: The maximum number of connections per host of the default transport,
+        0 for no limit.
+        :param timeout: The total timeout of a request in seconds used by the default transport.
+        :param credit_resync_interval: Seconds between two syncs of the daily quota with the status endpoint.
+        :param credit_drift_tolerance: The number of responses without rate-limit headers tolerated
+        before the quota is synced again.
+        :param cache_size: The maximum number of responses kept in the response cache, 0 disables it.
+        :param cache_ttls: (optional) Time to live in seconds per endpoint path.
+        :param cache_backend: (optional) A persistent cache backend.
+        :param rate_limiter: (optional) A RateLimiter enforcing the per-minute and per-day limits of the plan.
+        :param rate_limit_timeout: The maximum number of seconds a request waits for the rate limiter
+        before raising APILimitExceededError, None to wait as long as needed.
+        :param retry_policy: (optional) The RetryPolicy applied to network errors and to 429/5xx responses.
+        :param coalesce_requests: Share one in-flight request between identical concurrent calls.
+        :param models: Return ApiResponse objects holding typed models instead of dicts.
+        :param entity_store: (optional) An EntityStore every response fetched from the API is merged into.
+        :param json_backend: The JSON decoder of the responses: "orjson", "json" or "auto".
+        :param scheduler: (optional) A RequestScheduler ordering the billable calls by priority class and tenant.
+
+        """
+
+        owns_transport = transport is None
+        if transport is None:
+            transport = AsyncHttpTransport(limit=max_concurrency, limit_per_host=limit_per_host, timeout=timeout)
+        super().__init__(account_type,
+                         api_key=api_key,
+                         transport=transport,
+                         credit_resync_interval=credit_resync_interval,
+                         credit_drift_tolerance=credit_drift_tolerance,
+                         cache_size=cache_size,
+                         cache_ttls=cache_ttls,
+                         cache_backend=cache_backend,
+                         rate_limiter=rate_limiter,
+                         rate_limit_timeout=rate_limit_timeout,
+                         retry_policy=retry_policy,
+                         coalesce_requests=coalesce_requests,
+                         models=models,
+                         entity_store=entity_store,
+                         json_backend=json_backend,
+                         scheduler=scheduler,
+                         lazy=True)
+        self._owns_transport = owns_transport
+        self._max_concurrency = max_concurrency
+        self._semaphore = None
+        self._credit_lock = None
+
+    async def connect(self):
+        """
+        Sync the daily quota with the status endpoint, verifying the API key.
+        """
+        await self._update_credit()
+
+    async def close(self):
+        """
+        Release the pooled connections held by the client's transport.
+        A transport passed in by the caller is left open.
+        """
+        if self._owns_transport:
+            await self._transport.close()
+
+    def __enter__(self):
+        raise TypeError("AsyncFootballAPI must be used with 'async with'.")
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _ensure_credit(self):
+        if self._credit.needs_sync():
+            if self._credit_lock is None:
+                self._credit_lock = asyncio.Lock()
+            async with self._credit_lock:
+                if self._credit.needs_sync():
+                    await self._update_credit()
+
+    async def _update_credit(self):
+        self._logger.info("Updating credits")
+        data = await self.get_status()
+        self._credit.sync(data["response"]["requests"]["limit_day"], data["response"]["requests"]["current"])
+        self._logger.info(f"{self._credit.available_credit} credit(s) available.")
+
+    async def _send_requests(self, method, url, headers, params=None, data=None, billable=False):
+        response = await self._send_raw_requests(method, url, headers, params=params, data=data, billable=billable)
+        return self._json.loads(response.content)
+
+    async def _send_raw_requests(self, method, url, headers, params=None, data=None, billable=False, stream=False):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        stream_kwargs = {"stream": True} if stream else {}
+
+        deadline = self._retry_policy.start()
+        attempt = 1
+        while True:
+            try:
+                async with self._semaphore:
+                    response = await self._transport.request(
+                        method,
+                        url,
+                        headers=headers,
+                        params=params,
+                        data=data,
+                        **stream_kwargs
+                    )
+            except self._request_errors as e:
+                delay = self._retry_policy.next_delay(method, attempt, deadline, error=True)
+                if delay is None:
+                    self._logger.error(f"Request error: {e}")
+                    raise
+                self._logger.warning(f"Request error: {e}, retrying in {delay:.2f}s")
+            else:
+                retryable = self._retry_policy.is_retryable_status(response.status_code)
+                delay = None
+                if retryable:
+                    delay = self._retry_policy.next_delay(method, attempt, deadline, headers=response.headers)
+                if delay is None:
+                    if stream and response.status_code not in (200, 304):
+                        # the body of an error response is read for the exception raised
+                        await response.read()
+                        response.close()
+                    return self._handle_response(response, billable)
+                self._logger.warning(f"Status {response.status_code} from {url}, retrying in {delay:.2f}s")
+                if stream:
+                    response.close()
+            await asyncio.sleep(delay)
+            attempt += 1
+            if billable:
+                # a retry is another request, for the rate limiter and the quota too
+                await self._ensure_credit()
+                await self._acquire()
+                self._check_credit()
+
+    async def _fetch(self, path: str, params: dict):
+        url = f"{self._base_url}/{path}"
+        headers = self._get_headers()
+
+        if not ENDPOINTS[path].billable:
+            response_data = await self._send_requests('GET', url, headers, params=params)
+            return self._decode(path, response_data)
+
+        cached, cache_key, cache_ttl, stale = self._lookup_cache(path, params, headers)
+        if cached is not None:
+            return cached
+
+        if self._single_flight is None:
+            return await self._fetch_billable(url, headers, params, cache_key, cache_ttl, stale)
+        return await self._single_flight.do_async(
+            cache_key, lambda: self._fetch_billable(url, headers, params, cache_key, cache_ttl, stale))
+
+    async def _fetch_billable(self, url: str, headers: dict, params: dict, cache_key, cache_ttl, stale):
+        await self._ensure_credit()
+        await self._acquire()
+        self._check_credit()
+
+        response = await self._send_raw_requests('GET', url, headers, params=params, billable=True)
+        return self._cache_response(cache_key, cache_ttl, stale, response)
+
+    async def _acquire(self):
+        if self._scheduler is None:
+            acquired = await self._rate_limiter.acquire_async(self._rate_limit_timeout)
+        else:
+            acquired = await self._scheduler.admit_async(self._credit, self._rate_limiter, self._rate_limit_timeout,
+                                                         refresh=self._ensure_credit)
+        if not acquired:
+            self._raise_rate_limited()
+
+    def stream(self, path: str, chunk_size: int = 65536, **kwargs):
+        """
+        Stream the items of the response of an endpoint, decoded while the body is received.
+        Streamed responses are not cached.
+
+        Usage::
+
+            async for fixture in api.stream("fixtures", league=39, season=2023):
+                ...
+
+        :param path: The endpoint path, e.g. "fixtures"
+        :param chunk_size: The number of bytes read from the connection at once
+        :param kwargs: The parameters of the endpoint, as accepted by its get_* method
+        :return: An AsyncResponseStream yielding the items of the response, models when enabled
+        """
+        chunks = self._stream_chunks(path, ENDPOINTS[path].build(kwargs), chunk_size)
+        return AsyncResponseStream(chunks, model=MODELS.get(path) if self._models else None)
+
+    def stream_raw(self, path: str, chunk_size: int = 65536, **kwargs):
+        """
+        Get the body of an endpoint response as received, without decoding it, for callers forwarding it.
+
+        :param path: The endpoint path, e.g. "fixtures"
+        :param chunk_size: The number of bytes read from the connection at once
+        :param kwargs: The parameters of the endpoint, as accepted by its get_* method
+        :return: An asynchronous generator of the bytes of the body
+        """
+        return self._stream_chunks(path, ENDPOINTS[path].build(kwargs), chunk_size)
+
+    async def _stream_chunks(self, path: str, params: dict, chunk_size: int):
+        url = f"{self._base_url}/{path}"
+        billable = ENDPOINTS[path].billable
+        if billable:
+            await self._ensure_credit()
+            await self._acquire()
+            self._check_credit()
+        response = await self._send_raw_requests('GET', url, self._get_headers(), params=params,
+                                                 billable=billable, stream=True)
+        try:
+            async for chunk in response.iter_content(chunk_size):
+                yield chunk
+        finally:
+            response.close()
+
+    async def get_fixtures_bulk(self, ids: Iterable[int]):
+
+        """
+        Get any number of fixtures by id. The ids are de-duplicated and split into
+        requests of up to 20 ids, which are sent concurrently.
+
+        :param ids: The ids of the fixtures
+        :return: Returns a dict of the fixtures keyed by fixture id
+        """
+
+        chunks = chunk_fixture_ids(ids)
+        if not chunks:
+            return {}
+        await self._ensure_credit()
+        self._reserve_credit(len(chunks))
+
+        fixtures = {}
+        for data in await asyncio.gather(*(self.get_fixtures(ids=chunk) for chunk in chunks)):
+            for item in data["response"]:
+                fixtures[item["fixture"]["id"]] = item
+        return fixtures
+
+    async def batch(self, calls, return_exceptions: bool = True):
+
+        """
+        Run several get_* calls concurrently, within the max_concurrency of the client. The calls go through
+        the response cache, the rate limiter and the quota like any other call.
+
+        :param calls: The calls, each the name of a get_* method and optionally a dict of its arguments
+        :param return_exceptions: Whether the exception raised by a call is returned in its place,
+        or raised once every call is done
+        :return: Returns the list of the results, in the order of the calls
+        """
+
+        calls = self._batch_calls(calls)
+        if not calls:
+            return []
+        await self._ensure_credit()
+        self._reserve_credit(sum(method.__name__ != "get_status" for method, _ in calls))
+
+        async def run(method, kwargs):
+            try:
+                return await method(**kwargs)
+            except Exception as e:
+                return _BatchError(e)
+
+        results = await asyncio.gather(*(run(method, kwargs) for method, kwargs in calls))
+        return self._batch_results(results, return_exceptions)
+
+    async def get_status(self):
+        """
+        It allows you to:
+        - To follow your consumption in real time
+        - Check the status of our servers
+        Note: This call does not count against the daily quota.
+        :return: Returns the status json schema
+        """
+        data = await self._get('status')
+        if data["errors"]:
+            raise InternalApiException(data["errors"])
+        return data
+
+    async def iter_players(self,
+                           id: int = None,
+                           team: int = None,
+                           league: int = None,
+                           season: int = None,
+                           search: str = None,
+                           prefetch: int = 0
+                           ):
+
+        """
+        Iterate lazily over the players statistics of every page.
+
+        :param id: The id of the player
+        :param team: The id of the team
+        :param league: The id of the league
+        :param season: The season of the league
+        :param search: The name of the player
+        :param prefetch: The number of following pages fetched concurrently once the total
+        number of pages is known. Default: 0, pages are fetched one after another
+        :return: Yields the items of the response of each page
+        """
+
+        kwargs = dict(id=id, team=team, league=league, season=season, search=search)
+        data = await self.get_player(page=1, **kwargs)
+        for item in data["response"]:
+            yield item
+        total = data["paging"]["total"]
+
+        if prefetch <= 0:
+            for page in range(2, total + 1):
+                data = await self.get_player(page=page, **kwargs)
+                for item in data["response"]:
+                    yield item
+            return
+
+        pages = iter(range(2, total + 1))
+        pending = deque()
+        try:
+            for page in pages:
+                pending.append(asyncio.ensure_future(self.get_player(page=page, **kwargs)))
+                if len(pending) >= prefetch:
+                    break
+            while pending:
+                data = await pending.popleft()
+                for page in pages:
+                    pending.append(asyncio.ensure_future(self.get_player(page=page, **kwargs)))
+                    break
+                for item in data["response"]:
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
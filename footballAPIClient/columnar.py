@@ -0,0 +1,633 @@
+# Column types, and the dtype and missing value of their arrays
+ID = "id"       # int64, -1 when missing
+NUM = "num"     # float64, NaN when missing; strings such as "55%" or "7.3" are parsed
+STR = "str"     # object, None when missing
+BOOL = "bool"   # float64, 1.0, 0.0 or NaN when missing
+
+# The dtype of the arrays of each column type
+DTYPES = {ID: "int64", NUM: "float64", STR: "object", BOOL: "float64"}
+
+
+class Column:
+    """
+    A column of a schema: the path of its value in a row, and its type.
+    """
+
+    __slots__ = ("name", "type", "path")
+
+    def __init__(self, name: str, type_: str, *path):
+
+        """
+
+        :param name: The name of the column
+        :param type_: The type of the column: ID, NUM, STR or BOOL
+        :param path: The keys leading to the value in a row
+
+        """
+
+        self.name = name
+        self.type = type_
+        self.path = path
+
+
+class Schema:
+    """
+    The columns of the table of an endpoint, and how its responses are split into rows.
+    """
+
+    def __init__(self, path: str, rows, columns, key=()):
+
+        """
+
+        :param path: The endpoint path
+        :param rows: A function returning the rows of a response, as dicts
+        :param columns: The Column of the table
+        :param key: The names of the ID columns identifying the rows fetched together, e.g. the
+        fixture_id of the events of a fixture. Newer rows of a key replace all the older ones.
+
+        """
+
+        self.path = path
+        self.rows = rows
+        self.columns = tuple(columns)
+        self.key = tuple(key)
+        self.names = tuple(column.name for column in self.columns)
+        self._getters = tuple(_getter(column.path) for column in self.columns)
+        self._converters = tuple(_CONVERTERS[column.type] for column in self.columns)
+
+    def extract(self, response):
+        """
+        :param response: The response of the endpoint
+        :return: The list of the values of each column, one value per row
+        """
+        values = tuple([] for _ in self.columns)
+        fields = tuple((column_values.append, get, convert)
+                       for column_values, get, convert in zip(values, self._getters, self._converters))
+        for row in self.rows(response):
+            for append, get, convert in fields:
+                append(convert(get(row)))
+        return values
+
+
+class Table:
+    """
+    Columns of equal length, each held in a NumPy array.
+    """
+
+    __slots__ = ("path", "columns")
+
+    def __init__(self, path: str, columns: dict):
+
+        """
+
+        :param path: The endpoint path of the rows
+        :param columns: The NumPy array of each column, by name
+
+        """
+
+        self.path = path
+        self.columns = columns
+
+    def __len__(self):
+        for array in self.columns.values():
+            return len(array)
+        return 0
+
+    def __getitem__(self, name: str):
+        return self.columns[name]
+
+    def __contains__(self, name: str):
+        return name in self.columns
+
+    @property
+    def names(self):
+        return tuple(self.columns)
+
+    def filter(self, mask):
+        """
+        :param mask: A boolean array, or an array of row indices
+        :return: A Table of the selected rows
+        """
+        return Table(self.path, {name: array[mask] for name, array in self.columns.items()})
+
+    def to_pandas(self):
+        """
+        :return: A pandas DataFrame of the table
+        """
+        try:
+            import pandas
+        except ImportError:
+            raise ImportError("Table.to_pandas requires pandas, install it with: pip install pandas")
+        return pandas.DataFrame(self.columns, copy=False)
+
+    def to_arrow(self):
+        """
+        :return: A pyarrow Table of the table
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("Table.to_arrow requires pyarrow, install it with: pip install pyarrow")
+        return pyarrow.table({name: pyarrow.array(array, from_pandas=True) for name, array in self.columns.items()})
+
+    def __repr__(self):
+        return f"Table({self.path!r}, rows={len(self)}, columns={len(self.columns)})"
+
+
+class TableBuilder:
+    """
+    Appends the responses of an endpoint, then builds their Table. Each supported endpoint has a
+    fixed schema (see SCHEMAS) flattening its items into typed columns, and the Table holds one NumPy
+    array per column, which the aggregate helpers of this module work on without looping over rows.
+
+    NumPy is required, pandas and pyarrow only for Table.to_pandas and Table.to_arrow.
+
+    Usage::
+
+        builder = TableBuilder("fixtures")
+        for league in (39, 140, 135):
+            builder.append(fp.get_fixtures(league=league, season=2023))
+        fixtures = builder.build()
+    """
+
+    def __init__(self, path: str):
+
+        """
+
+        :param path: The endpoint path of the responses, one of SCHEMAS
+
+        """
+
+        if path not in SCHEMAS:
+            raise ValueError(f"No columnar schema for {path}, expected one of: {', '.join(SCHEMAS)}")
+        self.schema = SCHEMAS[path]
+        self._values = tuple([] for _ in self.schema.columns)
+
+    def append(self, response):
+        """
+        :param response: A response of the endpoint, as returned by the client
+        :return: The number of rows appended
+        """
+        if hasattr(response, "to_dict"):
+            response = response.to_dict()
+        extracted = self.schema.extract(response)
+        for values, new_values in zip(self._values, extracted):
+            values.extend(new_values)
+        return len(extracted[0]) if extracted else 0
+
+    def extend(self, responses):
+        for response in responses:
+            self.append(response)
+        return self
+
+    def __len__(self):
+        return len(self._values[0]) if self._values else 0
+
+    def build(self):
+        """
+        :return: The Table of every row appended so far
+        """
+        np = require_numpy()
+        return Table(self.schema.path, {
+            column.name: np.array(values, dtype=DTYPES[column.type])
+            for column, values in zip(self.schema.columns, self._values)
+        })
+
+
+def to_table(path: str, responses):
+    """
+    Build the Table of one or many responses of an endpoint.
+
+    :param path: The endpoint path of the responses, one of SCHEMAS
+    :param responses: A response, or an iterable of responses
+    :return: The Table
+    """
+    if isinstance(responses, dict) or hasattr(responses, "to_dict"):
+        responses = (responses,)
+    return TableBuilder(path).extend(responses).build()
+
+
+def goals_per_team(fixtures: Table):
+    """
+    Aggregate the goals of the finished fixtures of a fixtures Table per team.
+
+    :param fixtures: A Table of the fixtures endpoint
+    :return: A Table with one row per team: team_id, played, goals_for, goals_against, goal_difference,
+    goals_for_per_match and goals_against_per_match
+    """
+    np = require_numpy()
+    played = ~(np.isnan(fixtures["goals_home"]) | np.isnan(fixtures["goals_away"]))
+    home, away = fixtures["home_id"][played], fixtures["away_id"][played]
+    goals_home, goals_away = fixtures["goals_home"][played], fixtures["goals_away"][played]
+
+    teams, index = np.unique(np.concatenate((home, away)), return_inverse=True)
+    goals_for = np.bincount(index, weights=np.concatenate((goals_home, goals_away)), minlength=len(teams))
+    goals_against = np.bincount(index, weights=np.concatenate((goals_away, goals_home)), minlength=len(teams))
+    matches = np.bincount(index, minlength=len(teams))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return Table("goals_per_team", {
+            "team_id": teams,
+            "played": matches,
+            "goals_for": goals_for,
+            "goals_against": goals_against,
+            "goal_difference": goals_for - goals_against,
+            "goals_for_per_match": goals_for / matches,
+            "goals_against_per_match": goals_against / matches,
+        })
+
+
+def shot_ratios(statistics: Table):
+    """
+    Aggregate the shooting and possession statistics of a fixtures/statistics Table per team.
+
+    :param statistics: A Table of the fixtures/statistics endpoint
+    :return: A Table with one row per team: team_id, matches, total_shots, shots_on_goal, on_target_ratio,
+    average possession, shots_per_possession (shots per 10% of possession), expected_goals and
+    expected_goals_per_shot (NaN when the API gave no expected goals)
+    """
+    np = require_numpy()
+    teams, index = np.unique(statistics["team_id"], return_inverse=True)
+
+    def total(name):
+        return np.bincount(index, weights=np.nan_to_num(statistics[name]), minlength=len(teams))
+
+    def counted(name):
+        return np.bincount(index, weights=~np.isnan(statistics[name]), minlength=len(teams))
+
+    shots, on_goal = total("total_shots"), total("shots_on_goal")
+    possession, possession_count = total("ball_possession"), counted("ball_possession")
+    expected_goals, expected_goals_count = total("expected_goals"), counted("expected_goals")
+    with np.errstate(invalid="ignore", divide="ignore"):
+        average_possession = possession / possession_count
+        expected_goals = np.where(expected_goals_count > 0, expected_goals, np.nan)
+        return Table("shot_ratios", {
+            "team_id": teams,
+            "matches": np.bincount(index, minlength=len(teams)),
+            "total_shots": shots,
+            "shots_on_goal": on_goal,
+            "on_target_ratio": on_goal / shots,
+            "possession": average_possession,
+            "shots_per_possession": shots / possession * 10,
+            "expected_goals": expected_goals,
+            "expected_goals_per_shot": expected_goals / shots,
+        })
+
+
+def player_minutes(players: Table):
+    """
+    Aggregate the minutes, goals and assists of a fixtures/players or players Table per player.
+
+    :param players: A Table of the fixtures/players or players endpoint
+    :return: A Table with one row per player: player_id, appearances, minutes, minutes_per_appearance,
+    goals, assists, goals_per_90 and goal_involvements_per_90
+    """
+    np = require_numpy()
+    players_ids, index = np.unique(players["player_id"], return_inverse=True)
+    minutes_column = np.nan_to_num(players["minutes"])
+    if "appearances" in players:
+        appearances = np.bincount(index, weights=np.nan_to_num(players["appearances"]), minlength=len(players_ids))
+    else:
+        appearances = np.bincount(index, weights=minutes_column > 0, minlength=len(players_ids))
+    minutes = np.bincount(index, weights=minutes_column, minlength=len(players_ids))
+    goals = np.bincount(index, weights=np.nan_to_num(players["goals_total"]), minlength=len(players_ids))
+    assists = np.bincount(index, weights=np.nan_to_num(players["assists"]), minlength=len(players_ids))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return Table("player_minutes", {
+            "player_id": players_ids,
+            "appearances": appearances,
+            "minutes": minutes,
+            "minutes_per_appearance": minutes / appearances,
+            "goals": goals,
+            "assists": assists,
+            "goals_per_90": goals / minutes * 90,
+            "goal_involvements_per_90": (goals + assists) / minutes * 90,
+        })
+
+
+def require_numpy():
+    """
+    :return: The numpy module, with an error telling how to install it when missing
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("The columnar export requires numpy, install it with: pip install numpy")
+    return numpy
+
+
+def _getter(path):
+    # the values are nearly always present, so the lookups are not guarded one by one
+    if len(path) == 1:
+        key = path[0]
+
+        def get(row):
+            return row.get(key)
+    elif len(path) == 2:
+        first, second = path
+
+        def get(row):
+            try:
+                return row[first][second]
+            except (KeyError, TypeError):
+                return None
+    elif len(path) == 3:
+        first, second, third = path
+
+        def get(row):
+            try:
+                return row[first][second][third]
+            except (KeyError, TypeError):
+                return None
+    else:
+        def get(row):
+            try:
+                for key in path:
+                    row = row[key]
+            except (KeyError, TypeError):
+                return None
+            return row
+    return get
+
+
+def _to_id(value):
+    if value is None:
+        return -1
+    return value if type(value) is int else int(value)
+
+
+def _to_number(value):
+    if value is None or type(value) is int or type(value) is float:
+        return value
+    if type(value) is bool:
+        return int(value)
+    try:
+        return float(value.rstrip("%")) if isinstance(value, str) else None
+    except ValueError:
+        return None
+
+
+def _to_bool(value):
+    if value is None:
+        return None
+    return 1.0 if value else 0.0
+
+
+def _identity(value):
+    return value
+
+
+_CONVERTERS = {ID: _to_id, NUM: _to_number, STR: _identity, BOOL: _to_bool}
+
+
+def _items(response):
+    return response.get("response") or ()
+
+
+def _fixture_parameter(response):
+    return (response.get("parameters") or {}).get("fixture")
+
+
+def _fixture_statistics_rows(response):
+    fixture = _fixture_parameter(response)
+    for item in _items(response):
+        yield {"fixture": fixture,
+               "team": item.get("team"),
+               "statistics": {statistic.get("type"): statistic.get("value")
+                              for statistic in item.get("statistics") or ()}}
+
+
+def _fixture_players_rows(response):
+    fixture = _fixture_parameter(response)
+    for item in _items(response):
+        team = item.get("team")
+        for player in item.get("players") or ():
+            for statistics in player.get("statistics") or ({},):
+                yield {"fixture": fixture, "team": team, "player": player.get("player"), "statistics": statistics}
+
+
+def _players_rows(response):
+    for item in _items(response):
+        for statistics in item.get("statistics") or ({},):
+            yield {"player": item.get("player"), "statistics": statistics}
+
+
+def _team_statistics_rows(response):
+    data = response.get("response")
+    if data:
+        yield data
+
+
+def _fixture_events_rows(response):
+    fixture = _fixture_parameter(response)
+    for item in _items(response):
+        yield dict(item, fixture=fixture)
+
+
+def _fixture_lineups_rows(response):
+    fixture = _fixture_parameter(response)
+    for item in _items(response):
+        base = {"fixture": fixture, "team": item.get("team"), "coach": item.get("coach"),
+                "formation": item.get("formation")}
+        for starter, key in ((True, "startXI"), (False, "substitutes")):
+            for entry in item.get(key) or ():
+                yield dict(base, player=entry.get("player"), starter=starter)
+
+
+def _standings_rows(response):
+    for item in _items(response):
+        league = item.get("league") or {}
+        for group in league.get("standings") or ():
+            for row in group:
+                yield dict(row, league=league)
+
+
+def _counts(prefix, *path):
+    return (Column(f"{prefix}_home", NUM, *path, "home"),
+            Column(f"{prefix}_away", NUM, *path, "away"),
+            Column(f"{prefix}_total", NUM, *path, "total"))
+
+
+_SHOTS_AND_GOALS = (
+    Column("shots_total", NUM, "statistics", "shots", "total"),
+    Column("shots_on", NUM, "statistics", "shots", "on"),
+    Column("goals_total", NUM, "statistics", "goals", "total"),
+    Column("goals_conceded", NUM, "statistics", "goals", "conceded"),
+    Column("assists", NUM, "statistics", "goals", "assists"),
+    Column("saves", NUM, "statistics", "goals", "saves"),
+    Column("passes_total", NUM, "statistics", "passes", "total"),
+    Column("passes_key", NUM, "statistics", "passes", "key"),
+    Column("passes_accuracy", NUM, "statistics", "passes", "accuracy"),
+    Column("tackles_total", NUM, "statistics", "tackles", "total"),
+    Column("tackles_blocks", NUM, "statistics", "tackles", "blocks"),
+    Column("tackles_interceptions", NUM, "statistics", "tackles", "interceptions"),
+    Column("duels_total", NUM, "statistics", "duels", "total"),
+    Column("duels_won", NUM, "statistics", "duels", "won"),
+    Column("dribbles_attempts", NUM, "statistics", "dribbles", "attempts"),
+    Column("dribbles_success", NUM, "statistics", "dribbles", "success"),
+    Column("fouls_drawn", NUM, "statistics", "fouls", "drawn"),
+    Column("fouls_committed", NUM, "statistics", "fouls", "committed"),
+    Column("yellow_cards", NUM, "statistics", "cards", "yellow"),
+    Column("red_cards", NUM, "statistics", "cards", "red"),
+    Column("penalty_scored", NUM, "statistics", "penalty", "scored"),
+    Column("penalty_missed", NUM, "statistics", "penalty", "missed"),
+)
+
+# The schema of each supported endpoint, by path
+SCHEMAS = {schema.path: schema for schema in (
+    Schema("fixtures", _items, key=("fixture_id",), columns=(
+        Column("fixture_id", ID, "fixture", "id"),
+        Column("date", STR, "fixture", "date"),
+        Column("timestamp", ID, "fixture", "timestamp"),
+        Column("referee", STR, "fixture", "referee"),
+        Column("venue_id", ID, "fixture", "venue", "id"),
+        Column("venue_name", STR, "fixture", "venue", "name"),
+        Column("status", STR, "fixture", "status", "short"),
+        Column("elapsed", NUM, "fixture", "status", "elapsed"),
+        Column("league_id", ID, "league", "id"),
+        Column("season", ID, "league", "season"),
+        Column("round", STR, "league", "round"),
+        Column("home_id", ID, "teams", "home", "id"),
+        Column("home_name", STR, "teams", "home", "name"),
+        Column("home_winner", BOOL, "teams", "home", "winner"),
+        Column("away_id", ID, "teams", "away", "id"),
+        Column("away_name", STR, "teams", "away", "name"),
+        Column("away_winner", BOOL, "teams", "away", "winner"),
+        Column("goals_home", NUM, "goals", "home"),
+        Column("goals_away", NUM, "goals", "away"),
+        Column("halftime_home", NUM, "score", "halftime", "home"),
+        Column("halftime_away", NUM, "score", "halftime", "away"),
+        Column("fulltime_home", NUM, "score", "fulltime", "home"),
+        Column("fulltime_away", NUM, "score", "fulltime", "away"),
+        Column("extratime_home", NUM, "score", "extratime", "home"),
+        Column("extratime_away", NUM, "score", "extratime", "away"),
+        Column("penalty_home", NUM, "score", "penalty", "home"),
+        Column("penalty_away", NUM, "score", "penalty", "away"),
+    )),
+    Schema("teams", _items, key=("team_id",), columns=(
+        Column("team_id", ID, "team", "id"),
+        Column("name", STR, "team", "name"),
+        Column("code", STR, "team", "code"),
+        Column("country", STR, "team", "country"),
+        Column("founded", NUM, "team", "founded"),
+        Column("national", BOOL, "team", "national"),
+        Column("venue_id", ID, "venue", "id"),
+        Column("venue_name", STR, "venue", "name"),
+        Column("venue_city", STR, "venue", "city"),
+        Column("venue_capacity", NUM, "venue", "capacity"),
+    )),
+    Schema("fixtures/statistics", _fixture_statistics_rows, key=("fixture_id",), columns=(
+        Column("fixture_id", ID, "fixture"),
+        Column("team_id", ID, "team", "id"),
+        Column("team_name", STR, "team", "name"),
+        Column("shots_on_goal", NUM, "statistics", "Shots on Goal"),
+        Column("shots_off_goal", NUM, "statistics", "Shots off Goal"),
+        Column("total_shots", NUM, "statistics", "Total Shots"),
+        Column("blocked_shots", NUM, "statistics", "Blocked Shots"),
+        Column("shots_insidebox", NUM, "statistics", "Shots insidebox"),
+        Column("shots_outsidebox", NUM, "statistics", "Shots outsidebox"),
+        Column("fouls", NUM, "statistics", "Fouls"),
+        Column("corner_kicks", NUM, "statistics", "Corner Kicks"),
+        Column("offsides", NUM, "statistics", "Offsides"),
+        Column("ball_possession", NUM, "statistics", "Ball Possession"),
+        Column("yellow_cards", NUM, "statistics", "Yellow Cards"),
+        Column("red_cards", NUM, "statistics", "Red Cards"),
+        Column("goalkeeper_saves", NUM, "statistics", "Goalkeeper Saves"),
+        Column("total_passes", NUM, "statistics", "Total passes"),
+        Column("passes_accurate", NUM, "statistics", "Passes accurate"),
+        Column("passes_percentage", NUM, "statistics", "Passes %"),
+        Column("expected_goals", NUM, "statistics", "expected_goals"),
+    )),
+    Schema("fixtures/players", _fixture_players_rows, key=("fixture_id",), columns=(
+        Column("fixture_id", ID, "fixture"),
+        Column("team_id", ID, "team", "id"),
+        Column("team_name", STR, "team", "name"),
+        Column("player_id", ID, "player", "id"),
+        Column("player_name", STR, "player", "name"),
+        Column("minutes", NUM, "statistics", "games", "minutes"),
+        Column("number", NUM, "statistics", "games", "number"),
+        Column("position", STR, "statistics", "games", "position"),
+        Column("rating", NUM, "statistics", "games", "rating"),
+        Column("captain", BOOL, "statistics", "games", "captain"),
+        Column("substitute", BOOL, "statistics", "games", "substitute"),
+        Column("offsides", NUM, "statistics", "offsides"),
+    ) + _SHOTS_AND_GOALS),
+    Schema("players", _players_rows, key=("player_id", "team_id", "league_id", "season"), columns=(
+        Column("player_id", ID, "player", "id"),
+        Column("player_name", STR, "player", "name"),
+        Column("age", NUM, "player", "age"),
+        Column("nationality", STR, "player", "nationality"),
+        Column("team_id", ID, "statistics", "team", "id"),
+        Column("team_name", STR, "statistics", "team", "name"),
+        Column("league_id", ID, "statistics", "league", "id"),
+        Column("season", ID, "statistics", "league", "season"),
+        Column("appearances", NUM, "statistics", "games", "appearences"),
+        Column("lineups", NUM, "statistics", "games", "lineups"),
+        Column("minutes", NUM, "statistics", "games", "minutes"),
+        Column("position", STR, "statistics", "games", "position"),
+        Column("rating", NUM, "statistics", "games", "rating"),
+    ) + _SHOTS_AND_GOALS),
+    Schema("teams/statistics", _team_statistics_rows, key=("team_id", "league_id", "season"), columns=(
+        Column("league_id", ID, "league", "id"),
+        Column("season", ID, "league", "season"),
+        Column("team_id", ID, "team", "id"),
+        Column("team_name", STR, "team", "name"),
+        Column("form", STR, "form"),
+        *_counts("played", "fixtures", "played"),
+        *_counts("wins", "fixtures", "wins"),
+        *_counts("draws", "fixtures", "draws"),
+        *_counts("loses", "fixtures", "loses"),
+        *_counts("goals_for", "goals", "for", "total"),
+        *_counts("goals_against", "goals", "against", "total"),
+        *_counts("clean_sheet", "clean_sheet"),
+        *_counts("failed_to_score", "failed_to_score"),
+        Column("penalty_scored", NUM, "penalty", "scored", "total"),
+        Column("penalty_missed", NUM, "penalty", "missed", "total"),
+    )),
+    Schema("fixtures/events", _fixture_events_rows, key=("fixture_id",), columns=(
+        Column("fixture_id", ID, "fixture"),
+        Column("elapsed", NUM, "time", "elapsed"),
+        Column("extra", NUM, "time", "extra"),
+        Column("team_id", ID, "team", "id"),
+        Column("team_name", STR, "team", "name"),
+        Column("player_id", ID, "player", "id"),
+        Column("player_name", STR, "player", "name"),
+        Column("assist_id", ID, "assist", "id"),
+        Column("assist_name", STR, "assist", "name"),
+        Column("type", STR, "type"),
+        Column("detail", STR, "detail"),
+        Column("comments", STR, "comments"),
+    )),
+    Schema("fixtures/lineups", _fixture_lineups_rows, key=("fixture_id",), columns=(
+        Column("fixture_id", ID, "fixture"),
+        Column("team_id", ID, "team", "id"),
+        Column("team_name", STR, "team", "name"),
+        Column("formation", STR, "formation"),
+        Column("coach_id", ID, "coach", "id"),
+        Column("player_id", ID, "player", "id"),
+        Column("player_name", STR, "player", "name"),
+        Column("number", NUM, "player", "number"),
+        Column("position", STR, "player", "pos"),
+        Column("grid", STR, "player", "grid"),
+        Column("starter", BOOL, "starter"),
+    )),
+    Schema("standings", _standings_rows, key=("league_id", "season"), columns=(
+        Column("league_id", ID, "league", "id"),
+        Column("season", ID, "league", "season"),
+        Column("group", STR, "group"),
+        Column("rank", NUM, "rank"),
+        Column("team_id", ID, "team", "id"),
+        Column("team_name", STR, "team", "name"),
+        Column("points", NUM, "points"),
+        Column("goals_diff", NUM, "goalsDiff"),
+        Column("form", STR, "form"),
+        Column("status", STR, "status"),
+        Column("description", STR, "description"),
+        Column("played", NUM, "all", "played"),
+        Column("win", NUM, "all", "win"),
+        Column("draw", NUM, "all", "draw"),
+        Column("lose", NUM, "all", "lose"),
+        Column("goals_for", NUM, "all", "goals", "for"),
+        Column("goals_against", NUM, "all", "goals", "against"),
+        Column("update", STR, "update"),
+    )),
+)}
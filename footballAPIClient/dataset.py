@@ -0,0 +1,370 @@
+import datetime
+import json
+import os
+import shutil
+import time
+
+from footballAPIClient.columnar import DTYPES, SCHEMAS, STR, Table, TableBuilder, require_numpy
+
+_METADATA = "_part.json"
+_TEAM_COLUMNS = ("team_id", "home_id", "away_id")
+
+
+class Dataset:
+    """
+    On-disk mirror of API responses, stored as columnar files partitioned by endpoint, league and season::
+
+        root/endpoint=fixtures/league=39/season=2023/part-<time>-<pid>/<column>.npy
+
+    Every write appends a new part holding one NumPy file per column of the endpoint schema (see
+    columnar.SCHEMAS), so a partition is never rewritten while it is read. When a newer part holds rows
+    of the same key as an older one, e.g. the events of a fixture fetched again, the newer rows replace
+    the older ones on read, and ``compact`` merges the parts of a partition into one.
+
+    Reads memory-map the column files and only load the rows matching the league, season, team and
+    fixture date filters. Parts whose metadata cannot match the filters are not opened at all.
+
+    Usage::
+
+        dataset = Dataset("mirror")
+        for season in range(2014, 2024):
+            dataset.write("fixtures", fp.get_fixtures(league=39, season=season))
+            dataset.write("standings", fp.get_standings(league=39, season=season))
+        fixtures = dataset.read("fixtures", league=39, team=33, date_from="2020-01-01")
+    """
+
+    def __init__(self, root: str):
+
+        """
+
+        :param root: The directory of the dataset, created on the first write
+
+        """
+
+        self.root = root
+
+    def write(self, path: str, responses, league: int = None, season: int = None):
+        """
+        Append the rows of one or many responses of an endpoint.
+
+        :param path: The endpoint path of the responses, one of columnar.SCHEMAS
+        :param responses: A response, or an iterable of responses, as returned by the client
+        :param league: The league of the rows, required for the endpoints without a league_id column
+        :param season: The season of the rows, required for the endpoints without a season column
+        :return: The number of rows written
+        """
+        if isinstance(responses, dict) or hasattr(responses, "to_dict"):
+            responses = (responses,)
+        return self.write_table(TableBuilder(path).extend(responses).build(), league=league, season=season)
+
+    def write_table(self, table: Table, league: int = None, season: int = None):
+        """
+        Append the rows of a Table, split into one part per league and season.
+
+        :param table: A Table built by the columnar module
+        :param league: The league of the rows, required when the table has no league_id column
+        :param season: The season of the rows, required when the table has no season column
+        :return: The number of rows written
+        """
+        np = require_numpy()
+        if not len(table):
+            return 0
+        leagues = _partition_column(np, table, "league_id", league, "league")
+        seasons = _partition_column(np, table, "season", season, "season")
+        pairs, index = np.unique(np.stack((leagues, seasons), axis=1), axis=0, return_inverse=True)
+        index = index.reshape(-1)
+        for i, (league_id, season_id) in enumerate(pairs):
+            rows = table if len(pairs) == 1 else table.filter(index == i)
+            self._write_part(self._partition(table.path, league_id, season_id), rows)
+        return len(table)
+
+    def read(self, path: str, league=None, season=None, team=None, date_from=None, date_to=None, columns=None):
+        """
+        Read the rows of an endpoint matching the filters, with the newer rows of a key replacing the older ones.
+
+        :param path: The endpoint path, one of columnar.SCHEMAS
+        :param league: (optional) A league id or an iterable of league ids
+        :param season: (optional) A season or an iterable of seasons
+        :param team: (optional) A team id or an iterable of team ids, matching the team_id, home_id or away_id column
+        :param date_from: (optional) The first fixture date, as a datetime, a date or an ISO 8601 string
+        :param date_to: (optional) The last fixture date, included. The endpoints without a timestamp column
+        are filtered on the dates of the fixtures of the dataset.
+        :param columns: (optional) The names of the columns to read, all by default
+        :return: The Table of the rows
+        """
+        np = require_numpy()
+        schema = _schema(path)
+        names = tuple(column.name for column in schema.columns)
+        if columns is not None:
+            unknown = set(columns) - set(names)
+            if unknown:
+                raise ValueError(f"Unknown columns for {path}: {', '.join(sorted(unknown))}")
+            names = tuple(columns)
+        teams = _id_set(team)
+        start, end = _timestamp(date_from), _timestamp(date_to, end=True)
+        dated = start is not None or end is not None
+
+        selected = {name: [] for name in names}
+        for league_id, season_id, directory in self._partitions(path, _id_set(league), _id_set(season)):
+            fixtures = None
+            if dated and all(column.name != "timestamp" for column in schema.columns):
+                fixtures = self._fixture_ids(league_id, season_id, start, end)
+            parts = _parts(directory)
+            for part, keep in zip(parts, _latest_rows(np, parts, schema.key)):
+                metadata = part[1]
+                if not metadata["rows"] or not keep.any() or not _may_match(metadata, teams, start, end, fixtures):
+                    continue
+                mask = keep
+                if teams is not None:
+                    mask = mask & _team_mask(np, part, teams)
+                if start is not None or end is not None:
+                    if fixtures is None:
+                        mask = mask & _range_mask(_load(np, part, "timestamp"), start, end)
+                    else:
+                        mask = mask & np.isin(_load(np, part, "fixture_id"), fixtures)
+                rows = np.flatnonzero(mask)
+                if not len(rows):
+                    continue
+                for name in names:
+                    selected[name].append(_load(np, part, name)[rows])
+
+        types = {column.name: column.type for column in schema.columns}
+        table = {}
+        for name in names:
+            if selected[name]:
+                array = np.concatenate(selected[name])
+            else:
+                array = np.empty(0, dtype=DTYPES[types[name]])
+            table[name] = _from_strings(np, array) if types[name] == STR else np.asarray(array)
+        return Table(path, table)
+
+    def partitions(self, path: str = None):
+        """
+        :param path: (optional) An endpoint path, all the endpoints by default
+        :return: The list of the (path, league, season, parts) of the partitions of the dataset
+        """
+        paths = (path,) if path is not None else SCHEMAS
+        return [(name, league, season, len(_part_directories(directory)))
+                for name in paths
+                for league, season, directory in self._partitions(name, None, None)]
+
+    def compact(self, path: str, league=None, season=None):
+        """
+        Merge the parts of the partitions of an endpoint into one part each, dropping the replaced rows.
+
+        :param path: The endpoint path, one of columnar.SCHEMAS
+        :param league: (optional) A league id or an iterable of league ids, all by default
+        :param season: (optional) A season or an iterable of seasons, all by default
+        :return: The number of parts removed
+        """
+        removed = 0
+        for league_id, season_id, directory in self._partitions(path, _id_set(league), _id_set(season)):
+            parts = _part_directories(directory)
+            if len(parts) < 2:
+                continue
+            table = self.read(path, league=league_id, season=season_id)
+            self._write_part(directory, table)
+            for part in parts:
+                shutil.rmtree(os.path.join(directory, part))
+            removed += len(parts) - 1
+        return removed
+
+    def _partition(self, path: str, league: int, season: int):
+        return os.path.join(self.root, "endpoint=" + path.replace("/", "_"), f"league={league}", f"season={season}")
+
+    def _partitions(self, path: str, leagues, seasons):
+        _schema(path)
+        base = os.path.join(self.root, "endpoint=" + path.replace("/", "_"))
+        for league_name in _listdir(base):
+            league = _partition_value(league_name, "league")
+            if league is None or leagues is not None and league not in leagues:
+                continue
+            for season_name in _listdir(os.path.join(base, league_name)):
+                season = _partition_value(season_name, "season")
+                if season is None or seasons is not None and season not in seasons:
+                    continue
+                yield league, season, os.path.join(base, league_name, season_name)
+
+    def _fixture_ids(self, league: int, season: int, start, end):
+        """
+        :return: The ids of the fixtures of a partition played between start and end
+        """
+        np = require_numpy()
+        fixtures = self.read("fixtures", league=league, season=season, date_from=start, date_to=end,
+                             columns=("fixture_id",))
+        return np.asarray(fixtures["fixture_id"])
+
+    @staticmethod
+    def _write_part(directory: str, table: Table):
+        """
+        Write a Table into a new part of a partition. The files are written in a temporary directory
+        renamed once complete, so the readers never see a partial part.
+        """
+        np = require_numpy()
+        name = f"part-{time.time_ns():020d}-{os.getpid()}"
+        os.makedirs(directory, exist_ok=True)
+        temporary = os.path.join(directory, "." + name)
+        os.mkdir(temporary)
+        try:
+            dtypes = {}
+            for column, array in table.columns.items():
+                if array.dtype == object:
+                    array = _to_strings(np, array)
+                np.save(os.path.join(temporary, column + ".npy"), array, allow_pickle=False)
+                dtypes[column] = array.dtype.str
+            metadata = {"path": table.path, "rows": len(table), "dtypes": dtypes, "teams": _teams(np, table)}
+            if "timestamp" in table and len(table):
+                timestamps = table["timestamp"][table["timestamp"] >= 0]
+                if len(timestamps):
+                    metadata["timestamp"] = [int(timestamps.min()), int(timestamps.max())]
+            with open(os.path.join(temporary, _METADATA), "w") as file:
+                json.dump(metadata, file)
+            os.rename(temporary, os.path.join(directory, name))
+        except BaseException:
+            shutil.rmtree(temporary, ignore_errors=True)
+            raise
+        return name
+
+
+def _schema(path: str):
+    if path not in SCHEMAS:
+        raise ValueError(f"No columnar schema for {path}, expected one of: {', '.join(SCHEMAS)}")
+    return SCHEMAS[path]
+
+
+def _listdir(directory: str):
+    try:
+        return sorted(os.listdir(directory))
+    except FileNotFoundError:
+        return []
+
+
+def _part_directories(directory: str):
+    return [name for name in _listdir(directory) if name.startswith("part-")]
+
+
+def _parts(directory: str):
+    """
+    :return: The list of the (directory, metadata) of the parts of a partition, oldest first
+    """
+    parts = []
+    for name in _part_directories(directory):
+        part = os.path.join(directory, name)
+        with open(os.path.join(part, _METADATA)) as file:
+            parts.append((part, json.load(file)))
+    return parts
+
+
+def _partition_value(name: str, key: str):
+    prefix, _, value = name.partition("=")
+    if prefix != key:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _partition_column(np, table: Table, column: str, value, name: str):
+    if value is not None:
+        return np.full(len(table), int(value), dtype="int64")
+    if column not in table:
+        raise ValueError(f"The {table.path} rows have no {column} column, the {name} must be given.")
+    return np.asarray(table[column], dtype="int64")
+
+
+def _load(np, part, name: str):
+    return np.load(os.path.join(part[0], name + ".npy"), mmap_mode="r", allow_pickle=False)
+
+
+def _latest_rows(np, parts, key):
+    """
+    :return: For each part, the boolean mask of its rows not replaced by the rows of a newer part with the same key
+    """
+    sizes = [part[1]["rows"] for part in parts]
+    if not key or len(parts) < 2:
+        return [np.ones(size, dtype=bool) for size in sizes]
+    keys = np.stack([np.concatenate([_load(np, part, name) for part in parts]) for name in key], axis=1)
+    owners = np.repeat(np.arange(len(parts)), sizes)
+    _, index = np.unique(keys, axis=0, return_inverse=True)
+    index = index.reshape(-1)
+    latest = np.full(index.max() + 1 if len(index) else 0, -1)
+    np.maximum.at(latest, index, owners)
+    return np.split(latest[index] == owners, np.cumsum(sizes)[:-1])
+
+
+def _may_match(metadata, teams, start, end, fixtures):
+    if teams is not None and "teams" in metadata and not teams.intersection(metadata["teams"]):
+        return False
+    if fixtures is not None:
+        return len(fixtures) > 0
+    if (start is not None or end is not None) and "timestamp" in metadata:
+        low, high = metadata["timestamp"]
+        return (start is None or high >= start) and (end is None or low <= end)
+    return True
+
+
+def _team_mask(np, part, teams):
+    team_ids = np.fromiter(teams, dtype="int64", count=len(teams))
+    mask = None
+    for name in _TEAM_COLUMNS:
+        if name in part[1]["dtypes"]:
+            matches = np.isin(_load(np, part, name), team_ids)
+            mask = matches if mask is None else mask | matches
+    if mask is None:
+        raise ValueError(f"The {part[1]['path']} rows have no team column.")
+    return mask
+
+
+def _range_mask(values, start, end):
+    mask = values >= 0
+    if start is not None:
+        mask &= values >= start
+    if end is not None:
+        mask &= values <= end
+    return mask
+
+
+def _teams(np, table: Table):
+    teams = [table[name] for name in _TEAM_COLUMNS if name in table]
+    if not teams:
+        return []
+    return [int(team) for team in np.unique(np.concatenate(teams)) if team >= 0]
+
+
+def _id_set(value):
+    if value is None:
+        return None
+    if isinstance(value, (int, str)) or not hasattr(value, "__iter__"):
+        return {int(value)}
+    return {int(item) for item in value}
+
+
+def _timestamp(value, end: bool = False):
+    """
+    :return: The UTC timestamp of a datetime, a date (its end when end is True) or an ISO 8601 string
+    """
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value) if "T" in value or " " in value \
+            else datetime.date.fromisoformat(value)
+    if not isinstance(value, datetime.datetime):
+        value = datetime.datetime.combine(value, datetime.time.max if end else datetime.time.min)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return int(value.timestamp())
+
+
+def _to_strings(np, array):
+    """
+    Strings are stored as fixed width unicode arrays, which can be memory-mapped, with None stored as "".
+    """
+    values = ["" if value is None else str(value) for value in array]
+    return np.array(values, dtype=str) if values else np.empty(0, dtype="<U1")
+
+
+def _from_strings(np, array):
+    strings = array.astype(object)
+    strings[array == ""] = None
+    return strings
@@ -0,0 +1,386 @@
+import threading
+
+from footballAPIClient.responseModels import intern_json
+
+# Fields describing the entity itself, stored once per id. The other fields of a nested object
+# (e.g. the winner of a team, the round of a league) depend on the response and stay in it.
+TEAM_FIELDS = frozenset({"name", "code", "country", "founded", "national", "logo"})
+LEAGUE_FIELDS = frozenset({"name", "type", "country", "logo", "flag"})
+VENUE_FIELDS = frozenset({"name", "address", "city", "country", "capacity", "surface", "image"})
+PLAYER_FIELDS = frozenset({"name", "firstname", "lastname", "age", "birth", "nationality", "height", "weight",
+                           "photo"})
+
+# Objects of up to this many scalar fields are shared between equal values
+SHARED_MAX_KEYS = 4
+
+# The number of distinct shared objects kept before the table of shared objects is started again
+SHARED_MAX_ENTRIES = 65536
+
+
+class EntityStore:
+    """
+    In-memory store of API responses normalized into per-entity tables.
+
+    Teams, leagues, venues and players are kept once in their table, keyed by their API id, and
+    the responses only keep references to them. Strings are interned, so the values repeated
+    across responses (names, logos, status codes) are stored once as well, like the small objects
+    holding scalars only (scores, statuses, periods) which are shared between equal values. Adding a response
+    merges it into the tables: newer values of an entity replace the older ones, and fixtures,
+    injuries, standings and player statistics are updated in place.
+
+    Every read returns the denormalized JSON, shaped like the API response.
+    """
+
+    def __init__(self, max_shared: int = SHARED_MAX_ENTRIES):
+
+        """
+
+        :param max_shared: The number of distinct small objects remembered for sharing. When it is reached the
+        table starts again, the objects already shared stay shared.
+
+        """
+
+        self.max_shared = max_shared
+        self._lock = threading.Lock()
+        self.teams = {}
+        self.leagues = {}
+        self.venues = {}
+        self.players = {}
+        self._fixtures = {}
+        self._standings = {}
+        self._injuries = {}
+        self._player_statistics = {}
+        self._shared = {}
+        self._adders = {
+            "fixtures": self._add_fixture,
+            "fixtures/headtohead": self._add_fixture,
+            "standings": self._add_standings,
+            "injuries": self._add_injury,
+            "players": self._add_player_statistics,
+            "players/topscorers": self._add_player_statistics,
+            "players/topassists": self._add_player_statistics,
+            "players/topyellowcards": self._add_player_statistics,
+            "players/topredcards": self._add_player_statistics,
+            "players/squads": self._add_squad,
+            "teams": self._add_team,
+            "leagues": self._add_league,
+            "venues": self._add_venue,
+        }
+
+    def add(self, path: str, data):
+        """
+        Merge a response into the store.
+
+        :param path: The endpoint path of the response, e.g. "fixtures"
+        :param data: The response, as returned by the client
+        :return: The number of items merged, 0 for the endpoints the store does not keep
+        """
+        adder = self._adders.get(path)
+        if adder is None:
+            return 0
+        if hasattr(data, "to_dict"):
+            data = data.to_dict()
+        items = data.get("response") or ()
+        with self._lock:
+            for item in items:
+                adder(item)
+        return len(items)
+
+    def _add_fixture(self, item):
+        item = dict(item)
+        fixture = item["fixture"] = dict(item["fixture"])
+        if fixture.get("venue"):
+            fixture["venue"] = self._merge(self.venues, fixture["venue"], VENUE_FIELDS)
+        for key in ("periods", "status"):
+            if fixture.get(key):
+                fixture[key] = self._share(fixture[key])
+        if item.get("league"):
+            item["league"] = self._merge(self.leagues, item["league"], LEAGUE_FIELDS)
+        if item.get("teams"):
+            item["teams"] = {side: self._merge(self.teams, team, TEAM_FIELDS) for side, team in item["teams"].items()}
+        for key in ("goals", "score"):
+            if key in item:
+                item[key] = self._share(item[key])
+        self._fixtures[fixture["id"]] = item
+
+    def _add_standings(self, item):
+        league = item["league"]
+        groups = [[self._standing_row(row) for row in group] for group in league.get("standings") or ()]
+        reference = self._merge(self.leagues, {k: v for k, v in league.items() if k != "standings"}, LEAGUE_FIELDS)
+        self._standings[(league["id"], league.get("season"))] = (reference, groups)
+
+    def _standing_row(self, row):
+        row = self._share(row)
+        row["team"] = self._merge(self.teams, row["team"], TEAM_FIELDS)
+        return row
+
+    def _add_injury(self, item):
+        player = self._merge(self.players, item["player"], PLAYER_FIELDS)
+        team = self._merge(self.teams, item["team"], TEAM_FIELDS)
+        league = self._merge(self.leagues, item["league"], LEAGUE_FIELDS)
+        fixture = self._share(item.get("fixture"))
+        key = (_id(player), fixture["id"] if fixture else None)
+        self._injuries[key] = {"player": player, "team": team, "fixture": fixture, "league": league}
+
+    def _add_player_statistics(self, item):
+        player = self._merge(self.players, item["player"], PLAYER_FIELDS)
+        for statistics in item.get("statistics") or ():
+            statistics = self._share(statistics)
+            statistics["team"] = self._merge(self.teams, statistics["team"], TEAM_FIELDS)
+            statistics["league"] = self._merge(self.leagues, statistics["league"], LEAGUE_FIELDS)
+            league = statistics["league"]
+            key = (_id(player), _id(statistics["team"]), _id(league),
+                   league.get("season") if isinstance(league, dict) else None)
+            self._player_statistics[key] = (player, statistics)
+
+    def _add_squad(self, item):
+        self._merge(self.teams, item["team"], TEAM_FIELDS)
+        for player in item.get("players") or ():
+            self._merge(self.players, player, PLAYER_FIELDS)
+
+    def _add_team(self, item):
+        self._merge(self.teams, item["team"], TEAM_FIELDS)
+        if item.get("venue"):
+            self._merge(self.venues, item["venue"], VENUE_FIELDS)
+
+    def _add_league(self, item):
+        league = dict(item["league"])
+        country = item.get("country") or {}
+        league.setdefault("country", country.get("name"))
+        league.setdefault("flag", country.get("flag"))
+        self._merge(self.leagues, league, LEAGUE_FIELDS)
+
+    def _add_venue(self, item):
+        self._merge(self.venues, item, VENUE_FIELDS)
+
+    def _share(self, value):
+        """
+        Intern the strings of a JSON value and replace its objects holding scalars only by a
+        shared equal object. Shared objects are never modified, reads return copies.
+        """
+        if type(value) is str:
+            return intern_json(value)
+        if type(value) is list:
+            return [self._share(item) for item in value]
+        if type(value) is not dict:
+            return value
+        return self._dedupe({key: self._share(item) for key, item in value.items()})
+
+    def _dedupe(self, value: dict):
+        if len(value) > SHARED_MAX_KEYS:
+            return value
+        typed = False
+        for item in value.values():
+            kind = type(item)
+            if kind is dict or kind is list:
+                return value
+            if kind is bool or kind is float:
+                typed = True
+        key = tuple(value.items())
+        if typed:
+            # 1, 1.0 and True are equal, their types tell them apart
+            key = key, tuple(type(item) for item in value.values())
+        shared = self._shared.get(key)
+        if shared is not None:
+            return shared
+        if len(self._shared) >= self.max_shared:
+            self._shared.clear()
+        self._shared[key] = value
+        return value
+
+    def _merge(self, table: dict, obj: dict, fields: frozenset):
+        """
+        Merge the entity fields of a nested object into its table.
+
+        :return: The reference replacing the object: its id, or a dict of its id and of the fields
+        which do not belong to the entity
+        """
+        entity_id = obj.get("id") if obj else None
+        if entity_id is None:
+            return self._share(obj)
+        record = table.get(entity_id)
+        if record is None:
+            record = table[entity_id] = {"id": entity_id}
+        reference = None
+        for key, value in obj.items():
+            if key in fields:
+                if value is not None or key not in record:
+                    record[key] = self._share(value)
+            elif key != "id":
+                if reference is None:
+                    reference = {"id": entity_id}
+                reference[key] = self._share(value)
+        return entity_id if reference is None else self._dedupe(reference)
+
+    @staticmethod
+    def _join(table: dict, reference):
+        if type(reference) is int:
+            record = table.get(reference)
+            return _copy_json(record) if record is not None else {"id": reference}
+        if isinstance(reference, dict) and reference.get("id") in table:
+            joined = _copy_json(table[reference["id"]])
+            joined.update(_copy_json(reference))
+            return joined
+        return _copy_json(reference)
+
+    def team(self, id: int):
+        """
+        :param id: The id of the team
+        :return: The team, or None when it is not in the store
+        """
+        with self._lock:
+            return self._copy(self.teams, id)
+
+    def league(self, id: int):
+        with self._lock:
+            return self._copy(self.leagues, id)
+
+    def venue(self, id: int):
+        with self._lock:
+            return self._copy(self.venues, id)
+
+    def player(self, id: int):
+        with self._lock:
+            return self._copy(self.players, id)
+
+    @staticmethod
+    def _copy(table, id):
+        record = table.get(id)
+        return None if record is None else _copy_json(record)
+
+    def fixture(self, id: int):
+        """
+        :param id: The id of the fixture
+        :return: The fixture shaped like an item of the fixtures response, or None
+        """
+        with self._lock:
+            item = self._fixtures.get(id)
+            return None if item is None else self._fixture_json(item)
+
+    def fixtures(self, league: int = None, season: int = None, team: int = None, status=None):
+        """
+        Get the stored fixtures matching every given filter.
+
+        :param league: The id of the league
+        :param season: The season of the league
+        :param team: The id of a team playing the fixture
+        :param status: A status short code, or a collection of them
+        :return: A list of the fixtures shaped like the items of the fixtures response
+        """
+        statuses = {status} if isinstance(status, str) else status
+        with self._lock:
+            fixtures = []
+            for item in self._fixtures.values():
+                item_league = item.get("league")
+                if league is not None and _id(item_league) != league:
+                    continue
+                if season is not None and (not isinstance(item_league, dict) or item_league.get("season") != season):
+                    continue
+                if team is not None and team not in {_id(side) for side in (item.get("teams") or {}).values()}:
+                    continue
+                if statuses is not None and (item["fixture"].get("status") or {}).get("short") not in statuses:
+                    continue
+                fixtures.append(self._fixture_json(item))
+            return fixtures
+
+    def _fixture_json(self, item):
+        item = _copy_json(item)
+        fixture = item["fixture"]
+        if "venue" in fixture:
+            fixture["venue"] = self._join(self.venues, fixture["venue"])
+        if "league" in item:
+            item["league"] = self._join(self.leagues, item["league"])
+        if "teams" in item:
+            item["teams"] = {side: self._join(self.teams, team) for side, team in item["teams"].items()}
+        return item
+
+    def standings(self, league: int, season: int):
+        """
+        :param league: The id of the league
+        :param season: The season of the league
+        :return: The standings shaped like an item of the standings response, or None
+        """
+        with self._lock:
+            stored = self._standings.get((league, season))
+            if stored is None:
+                return None
+            reference, groups = stored
+            league_json = self._join(self.leagues, reference)
+            league_json["standings"] = [[dict(_copy_json(row), team=self._join(self.teams, row["team"]))
+                                         for row in group] for group in groups]
+            return {"league": league_json}
+
+    def injuries(self, team: int = None, player: int = None, fixture: int = None, league: int = None):
+        """
+        Get the stored injuries matching every given filter.
+
+        :return: A list of the injuries shaped like the items of the injuries response
+        """
+        with self._lock:
+            injuries = []
+            for item in self._injuries.values():
+                if team is not None and _id(item["team"]) != team:
+                    continue
+                if player is not None and _id(item["player"]) != player:
+                    continue
+                if fixture is not None and (item["fixture"] or {}).get("id") != fixture:
+                    continue
+                if league is not None and _id(item["league"]) != league:
+                    continue
+                injuries.append({"player": self._join(self.players, item["player"]),
+                                 "team": self._join(self.teams, item["team"]),
+                                 "fixture": _copy_json(item["fixture"]),
+                                 "league": self._join(self.leagues, item["league"])})
+            return injuries
+
+    def player_statistics(self, player: int, season: int = None):
+        """
+        :param player: The id of the player
+        :param season: (optional) The season of the statistics
+        :return: The player shaped like an item of the players response, or None
+        """
+        with self._lock:
+            if player not in self.players:
+                return None
+            statistics = []
+            for (player_id, _, _, stats_season), (_, stats) in self._player_statistics.items():
+                if player_id != player or (season is not None and stats_season != season):
+                    continue
+                statistics.append(dict(_copy_json(stats),
+                                       team=self._join(self.teams, stats["team"]),
+                                       league=self._join(self.leagues, stats["league"])))
+            return {"player": _copy_json(self.players[player]), "statistics": statistics}
+
+    def stats(self):
+        with self._lock:
+            return {
+                "teams": len(self.teams),
+                "leagues": len(self.leagues),
+                "venues": len(self.venues),
+                "players": len(self.players),
+                "fixtures": len(self._fixtures),
+                "standings": len(self._standings),
+                "injuries": len(self._injuries),
+                "player_statistics": len(self._player_statistics),
+                "shared": len(self._shared)
+            }
+
+    def clear(self):
+        with self._lock:
+            for table in (self.teams, self.leagues, self.venues, self.players, self._fixtures, self._standings,
+                          self._injuries, self._player_statistics, self._shared):
+                table.clear()
+
+
+def _id(reference):
+    if isinstance(reference, dict):
+        return reference.get("id")
+    return reference
+
+
+def _copy_json(value):
+    if type(value) is dict:
+        return {key: _copy_json(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_copy_json(item) for item in value]
+    return value
@@ -1,17 +1,42 @@
+import contextvars
 import os
-from http.client import HTTPException
+import threading
+import time
+from collections import deque
+from typing import Iterable
 
-import requests
 import logging
 
 from footballAPIClient.Exceptions.InternalApiException import InternalApiException
-from footballAPIClient.Exceptions.MissingParametersError import MissingParametersError
 from footballAPIClient.Exceptions.ApiKeyMissingError import ApiKeyMissingError
 from footballAPIClient.helpers.ParameterValidator import ParameterValidator
+from footballAPIClient.helpers.Endpoints import ENDPOINTS
+from footballAPIClient.helpers.HttpTransport import HttpTransport
+from footballAPIClient.helpers.CreditTracker import CreditTracker
+from footballAPIClient.helpers.RateLimiter import RateLimiter
+from footballAPIClient.helpers.RequestScheduler import RequestScheduler, priority as _priority
+from footballAPIClient.helpers.RetryPolicy import RetryPolicy
+from footballAPIClient.helpers.SingleFlight import SingleFlight
+from footballAPIClient.helpers.ResponseCache import ResponseCache, response_validators, conditional_headers
+from footballAPIClient.helpers.JsonBackend import get_json_backend
+from footballAPIClient.helpers.JsonStream import ResponseStream
+from footballAPIClient.helpers.FixtureDetails import chunk_fixture_ids
 from footballAPIClient.Exceptions.APILimitExceededError import APILimitExceededError
+from footballAPIClient.responseModels import ApiResponse, MODELS
 from footballAPIClient._constants import RAPID_API, FOOTBALL_API, FOOTBALL_API_URI, RAPID_API_URI
 
 
+class _BatchError:
+    """
+    The exception raised by a call of a batch, told apart from a result.
+    """
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
 class FootballAPI:
     """
     Python Binding (API wrapper) for the Football API. (https://www.api-football.com/documentation-v3)
@@ -20,7 +45,26 @@ class FootballAPI:
 
     def __init__(self,
                  account_type: str,
-                 api_key: str = None
+                 api_key: str = None,
+                 transport=None,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 timeout=(3.05, 30),
+                 credit_resync_interval: float = 3600,
+                 credit_drift_tolerance: int = 5,
+                 cache_size: int = 1024,
+                 cache_ttls: dict = None,
+                 cache_backend=None,
+                 rate_limiter: RateLimiter = None,
+                 rate_limit_timeout: float = None,
+                 retry_policy: RetryPolicy = None,
+                 coalesce_requests: bool = True,
+                 lazy: bool = False,
+                 prefetch_status: bool = False,
+                 models: bool = False,
+                 entity_store=None,
+                 json_backend="auto",
+                 scheduler: RequestScheduler = None
                  ):
 
         """
@@ -29,14 +73,62 @@ class FootballAPI:
         it consists of values: rapid-api, and api-sports
         :param api_key: It uses API keys to allow access to the API. You can register a new API
         key in rapidapi or directly on the dashboard.
+        :param transport: (optional) A custom transport exposing ``request`` and ``close``.
+        By default a pooled HttpTransport is created and owned by the client.
+        :param pool_connections: The number of per-host connection pools to cache.
+        :param pool_maxsize: The maximum number of keep-alive connections per host.
+        :param timeout: The (connect, read) timeout in seconds used by the default transport.
+        :param credit_resync_interval: Seconds between two syncs of the daily quota with the status
+        endpoint. In between, the quota is tracked from the rate-limit headers of each response.
+        :param credit_drift_tolerance: The number of responses without rate-limit headers tolerated
+        before the quota is synced again.
+        :param cache_size: The maximum number of responses kept in the response cache, 0 disables it.
+        :param cache_ttls: (optional) Time to live in seconds per endpoint path, e.g. {"venues": 3600}.
+        Near-static endpoints such as countries and timezone are cached by default.
+        :param cache_backend: (optional) A persistent cache backend, e.g. SqliteCache("cache.db"),
+        shared across restarts and by the processes of one host.
+        :param rate_limiter: (optional) A RateLimiter enforcing the per-minute and per-day limits of the plan,
+        possibly shared with other clients. By default the per-minute limit is learned from the responses.
+        :param rate_limit_timeout: The maximum number of seconds a request waits for the rate limiter
+        before raising APILimitExceededError, None to wait as long as needed.
+        :param retry_policy: (optional) The RetryPolicy applied to network errors and to 429/5xx responses.
+        By default a call is attempted up to 3 times with exponential backoff.
+        :param coalesce_requests: Share one in-flight request between identical concurrent calls.
+        :param lazy: When True the constructor does no network I/O, the API key and the daily quota
+        are verified on first use or by calling connect().
+        :param prefetch_status: With lazy, fetch the status in a background thread right away.
+        :param models: Return ApiResponse objects holding typed, compact models (see responseModels)
+        instead of dicts. The response cache then holds the models too.
+        :param entity_store: (optional) An EntityStore every response fetched from the API is merged into.
+        :param json_backend: The JSON decoder of the responses: "orjson", "json", "auto" for orjson when
+        installed, or a function decoding a bytes body.
+        :param scheduler: (optional) A RequestScheduler ordering the billable calls by priority class and tenant,
+        and keeping credit floors for the most important classes. It can be shared by several clients.
 
         """
 
         self._logger = logging.getLogger(__name__)
         self._parameter_validator = ParameterValidator()
         self._api_key = api_key
-        self._max_credit = None
-        self._available_credit = None
+        self._credit = CreditTracker(resync_interval=credit_resync_interval,
+                                     drift_tolerance=credit_drift_tolerance)
+        self._cache = ResponseCache(maxsize=cache_size, ttls=cache_ttls, backend=cache_backend)
+        self._rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self._rate_limit_timeout = rate_limit_timeout
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self._models = models
+        self._entity_store = entity_store
+        self._json = get_json_backend(json_backend)
+        self._scheduler = scheduler
+        self._credit_sync_lock = threading.Lock()
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = HttpTransport(pool_connections=pool_connections,
+                                      pool_maxsize=pool_maxsize,
+                                      timeout=timeout)
+        self._transport = transport
+        self._request_errors = tuple(getattr(transport, "request_errors", ()))
         try:
             self._parameter_validator.validate_account_header_type(account_type)
             self.account_type = account_type
@@ -48,23 +140,59 @@ class FootballAPI:
             if self._api_key is None:
                 self._api_key = os.environ["API_KEY"]
 
-            self._update_credit()
+            if not lazy:
+                self._update_credit()
+            elif prefetch_status:
+                threading.Thread(target=self._prefetch_status, name="footballAPI-status", daemon=True).start()
         except Exception as e:
+            if self._owns_transport:
+                self._transport.close()
             if isinstance(e, KeyError):
                 raise ApiKeyMissingError("No API_KEY set as environment variable or provided.")
             else:
                 raise
 
+    def close(self):
+        """
+        Release the pooled connections held by the client's transport.
+        A transport passed in by the caller is left open.
+        """
+        if self._owns_transport:
+            self._transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def connect(self):
+        """
+        Sync the daily quota with the status endpoint, verifying the API key.
+        Only needed with lazy=True, to fail early instead of on the first call.
+        """
+        self._update_credit()
+
+    def _prefetch_status(self):
+        try:
+            self._ensure_credit()
+        except Exception as e:
+            self._logger.warning(f"Status prefetch failed, retrying on first use: {e}")
+
+    def _ensure_credit(self):
+        if self._credit.needs_sync():
+            with self._credit_sync_lock:
+                if self._credit.needs_sync():
+                    self._update_credit()
+
     def _update_credit(self):
         self._logger.info("Updating credits")
         try:
             data = self.get_status()
         except Exception as e:
             raise
-        self._max_credit = data["response"]["requests"]["limit_day"]
-        current_used_credit = data["response"]["requests"]["current"] + 1  # as a fail-safe situation added 1
-        self._available_credit = self._max_credit - current_used_credit
-        self._logger.info(f"{self._available_credit} credit(s) available.")
+        self._credit.sync(data["response"]["requests"]["limit_day"], data["response"]["requests"]["current"])
+        self._logger.info(f"{self._credit.available_credit} credit(s) available.")
 
     def _get_headers(self):
         headers = {}
@@ -79,179 +207,233 @@ class FootballAPI:
 
     @property
     def max_credits(self):
-        return self._max_credit
+        return self._credit.max_credit
 
     @property
     def available_credits(self):
-        return self._available_credit
+        return self._credit.available_credit
 
-    def _send_requests(self, method, url, headers, params=None, data=None):
+    @property
+    def cache(self):
+        return self._cache
 
-        try:
+    @property
+    def rate_limiter(self):
+        return self._rate_limiter
+
+    @property
+    def retry_policy(self):
+        return self._retry_policy
+
+    @property
+    def single_flight(self):
+        return self._single_flight
 
-            response = requests.request(
-                method,
-                url,
-                headers=headers,
-                params=params,
-                json=data
-            )
-            status_code = response.status_code
-            self._logger.log(level=logging.INFO, msg="Request Successful: {}".format(status_code))
-            if response.status_code != 200:
-                raise HTTPException(response.status_code, response.json())
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            # Handle request exceptions or errors
-            print(f"Request error: {e}")
-            return None
-
-    def _get(self, path: str, id: int = None,
-             name: str = None,
-             country: str = None,
-             code: str = None,
-             season: int = None,
-             team: int = None,
-             type: str = None,
-             current: str = None,
-             search: str = None,
-             last: int = None,
-             league: int = None,
-             venue: str = None,
-             date: str = None,
-             city: str = None,
-             ids: str = None,
-             live: str = None,
-             next_: int = None,
-             from_: str = None,
-             to: str = None,
-             round_: str = None,
-             status: str = None,
-             timezone: str = None,
-             h2h: str = None,
-             fixture: int = None,
-             player: int = None,
-             page: int = None,
-             coach: int = None,
-             bet: int = None
-             ):
+    @property
+    def entity_store(self):
+        return self._entity_store
+
+    @property
+    def json_backend(self):
+        return self._json
+
+    @property
+    def scheduler(self):
+        return self._scheduler
+
+    @staticmethod
+    def priority(priority_class: str, tenant=None):
+        """
+        Set the priority class and tenant of the calls made inside a ``with`` block, in this thread or task.
+        They only matter to the RequestScheduler of the client.
+
+        :param priority_class: "live", "interactive" or "backfill"
+        :param tenant: (optional) The hashable id of the tenant
+        """
+        return _priority(priority_class, tenant)
+
+    def _send_requests(self, method, url, headers, params=None, data=None, billable=False):
+        response = self._send_raw_requests(method, url, headers, params=params, data=data, billable=billable)
+        return self._json.loads(response.content)
+
+    def _send_raw_requests(self, method, url, headers, params=None, data=None, billable=False, stream=False):
+        # the stream argument is only passed when needed, for custom transports without streaming
+        stream_kwargs = {"stream": True} if stream else {}
+        deadline = self._retry_policy.start()
+        attempt = 1
+        while True:
+            try:
+                response = self._transport.request(
+                    method,
+                    url,
+                    headers=headers,
+                    params=params,
+                    data=data,
+                    **stream_kwargs
+                )
+            except self._request_errors as e:
+                delay = self._retry_policy.next_delay(method, attempt, deadline, error=True)
+                if delay is None:
+                    self._logger.error(f"Request error: {e}")
+                    raise
+                self._logger.warning(f"Request error: {e}, retrying in {delay:.2f}s")
+            else:
+                if not self._retry_policy.is_retryable_status(response.status_code):
+                    return self._handle_response(response, billable, stream)
+                delay = self._retry_policy.next_delay(method, attempt, deadline, headers=response.headers)
+                if delay is None:
+                    return self._handle_response(response, billable, stream)
+                self._logger.warning(f"Status {response.status_code} from {url}, retrying in {delay:.2f}s")
+                if stream:
+                    response.close()
+            time.sleep(delay)
+            attempt += 1
+            if billable:
+                # a retry is another request, for the rate limiter and the quota too
+                self._ensure_credit()
+                self._acquire()
+                self._check_credit()
+
+    def _handle_response(self, response, billable, stream=False):
+        status_code = response.status_code
+        self._logger.log(level=logging.INFO, msg="Request Successful: {}".format(status_code))
+        if response.status_code not in (200, 304):
+            from http.client import HTTPException
+            try:
+                body = response.json()
+            finally:
+                if stream:
+                    # nobody will read the stream, give the connection back to the pool
+                    response.close()
+            raise HTTPException(response.status_code, body)
+        if billable:
+            self._credit.record(response.headers)
+            self._rate_limiter.observe(response.headers)
+        return response
+
+    def _get(self, path: str, **kwargs):
+        params = ENDPOINTS[path].build(kwargs)
+        return self._fetch(path, params)
+
+    def _fetch(self, path: str, params: dict):
         url = f"{self._base_url}/{path}"
         headers = self._get_headers()
 
-        try:
-            # preparing the query parameter
-            params = {}
-            if id:
-                self._parameter_validator.validate_type_int(id, "id")
-                params["id"] = id
-            if name:
-                self._parameter_validator.validate_type_str(name, 'name')
-                params["name"] = name
-            if code:
-                self._parameter_validator.validate_type_str(code, "code")
-                params["code"] = code
-            if search:
-                self._parameter_validator.validate_type_str(search, "search")
-                params["search"] = search
-            if season:
-                self._parameter_validator.validate_type_int(season, "season")
-                params['season'] = season
-            if team:
-                self._parameter_validator.validate_type_int(team, "team")
-                params['team'] = team
-            if type:
-                self._parameter_validator.validate_type_str(type, "type")
-                params['type'] = type
-            if current:
-                self._parameter_validator.validate_type_str(current, "current")
-                params['current'] = current
-            if last:
-                self._parameter_validator.validate_type_int(last, "last")
-                params['last'] = last
-            if league:
-                self._parameter_validator.validate_type_int(league, "league")
-                params['league'] = league
-            if venue:
-                self._parameter_validator.validate_type_str(venue, "venue")
-                params["venue"] = venue
-            if date:
-                self._parameter_validator.validate_type_str(date, "date")
-                params["date"] = date
-            if country:
-                self._parameter_validator.validate_type_str(country, "country")
-                params['country'] = country
-            if city:
-                self._parameter_validator.validate_type_str(city, "city")
-                params['city'] = city
-            if ids:
-                self._parameter_validator.validate_type_str(ids, "ids")
-                params["ids"] = ids
-            if live:
-                self._parameter_validator.validate_type_str(live, "live")
-                params["live"] = live
-            if next_:
-                self._parameter_validator.validate_type_int(next_, "next")
-                params["next"] = next_
-
-            if from_:
-                self._parameter_validator.validate_type_str(from_, "from")
-                params["from"] = from_
-
-            if to:
-                self._parameter_validator.validate_type_str(to, "to")
-                params["to"] = to
-
-            if round_:
-                self._parameter_validator.validate_type_str(round_, "round")
-                params["round"] = round_
-
-            if status:
-                self._parameter_validator.validate_type_str(status, "status`")
-                params["status"] = status
-
-            if timezone:
-                self._parameter_validator.validate_type_str(timezone, "timezone")
-                params["timezone"] = timezone
-
-            if h2h:
-                self._parameter_validator.validate_type_str(h2h, "h2h")
-                params["h2h"] = h2h
-
-            if fixture:
-                self._parameter_validator.validate_type_int(fixture, "fixture")
-                params["fixture"] = fixture
-
-            if player:
-                self._parameter_validator.validate_type_int(player, "player")
-                params["player"] = player
-
-            if page:
-                self._parameter_validator.validate_type_int(page, "page")
-                params["page"] = page
-
-            if coach:
-                self._parameter_validator.validate_type_int(coach, "coach")
-                params["coach"] = coach
-
-            if bet:
-                self._parameter_validator.validate_type_int(bet, "bet")
-                params["bet"] = bet
-
-            if path == 'status':
-                response_data = self._send_requests('GET', url, headers, params=params)
-                return response_data
-
-            if self._available_credit <= 0:
-                self._logger.info(f"API limit exceed the daily quota of {self._max_credit}. Please try next "
-                                  f"day.")
-                raise APILimitExceededError(f"API limit exceed the daily quota of {self._max_credit}. Please try next "
-                                            f"day.")
-
+        if not ENDPOINTS[path].billable:
             response_data = self._send_requests('GET', url, headers, params=params)
-            self._update_credit()
+            return self._decode(path, response_data)
+
+        cached, cache_key, cache_ttl, stale = self._lookup_cache(path, params, headers)
+        if cached is not None:
+            return cached
+
+        if self._single_flight is None:
+            return self._fetch_billable(url, headers, params, cache_key, cache_ttl, stale)
+        return self._single_flight.do(
+            cache_key, lambda: self._fetch_billable(url, headers, params, cache_key, cache_ttl, stale))
+
+    def _fetch_billable(self, url: str, headers: dict, params: dict, cache_key, cache_ttl, stale):
+        self._ensure_credit()
+        self._acquire()
+        self._check_credit()
+
+        response = self._send_raw_requests('GET', url, headers, params=params, billable=True)
+        return self._cache_response(cache_key, cache_ttl, stale, response)
+
+    def _lookup_cache(self, path: str, params: dict, headers: dict):
+        cache_key = self._cache.make_key(path, params)
+        cache_ttl = self._cache.ttl_for(path, params)
+        stale = None
+        if cache_ttl:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return self._decode(path, cached), cache_key, cache_ttl, stale
+            stale = self._cache.get_stale(cache_key)
+            if stale is not None:
+                headers.update(conditional_headers(stale[1]))
+        return None, cache_key, cache_ttl, stale
+
+    def _acquire(self):
+        if self._scheduler is None:
+            acquired = self._rate_limiter.acquire(self._rate_limit_timeout)
+        else:
+            acquired = self._scheduler.admit(self._credit, self._rate_limiter, self._rate_limit_timeout,
+                                             refresh=self._ensure_credit)
+        if not acquired:
+            self._raise_rate_limited()
+
+    def _raise_rate_limited(self):
+        self._logger.info(f"Rate limit not available within {self._rate_limit_timeout} second(s).")
+        raise APILimitExceededError(f"Rate limit not available within {self._rate_limit_timeout} second(s).")
+
+    def _check_credit(self):
+        if not self._credit.reserve():
+            self._logger.info(f"API limit exceed the daily quota of {self._credit.max_credit}. Please try next "
+                              f"day.")
+            raise APILimitExceededError(f"API limit exceed the daily quota of {self._credit.max_credit}. Please "
+                                        f"try next day.")
+
+    def _cache_response(self, cache_key, cache_ttl, stale, response):
+        path = cache_key[0]
+        if response.status_code == 304 and stale is not None:
+            self._cache.refresh(cache_key, cache_ttl)
+            return self._decode(path, stale[0])
+
+        response_data = self._decode(path, self._json.loads(response.content))
+        if not response_data.get("errors"):
+            if cache_ttl:
+                self._cache.set(cache_key, response_data, cache_ttl, response_validators(response.headers))
+            if self._entity_store is not None:
+                self._entity_store.add(path, response_data)
+        return response_data
+
+    def _decode(self, path: str, response_data):
+        if not self._models or isinstance(response_data, ApiResponse):
             return response_data
-        except Exception as e:
-            raise
+        return ApiResponse.from_dict(path, response_data)
+
+    def stream(self, path: str, chunk_size: int = 65536, **kwargs):
+        """
+        Stream the items of the response of an endpoint, decoded while the body is received instead of
+        once it is complete. Use it for the large responses, e.g. the fixtures of a season or odds/live.
+        Streamed responses are not cached.
+
+        :param path: The endpoint path, e.g. "fixtures"
+        :param chunk_size: The number of bytes read from the connection at once
+        :param kwargs: The parameters of the endpoint, as accepted by its get_* method
+        :return: A ResponseStream yielding the items of the response, models when enabled
+        """
+        response = self._open_stream(path, ENDPOINTS[path].build(kwargs))
+        return ResponseStream(response.iter_content(chunk_size), close=response.close,
+                              model=MODELS.get(path) if self._models else None)
+
+    def stream_raw(self, path: str, chunk_size: int = 65536, **kwargs):
+        """
+        Get the body of an endpoint response as received, without decoding it, for callers forwarding it.
+
+        :param path: The endpoint path, e.g. "fixtures"
+        :param chunk_size: The number of bytes read from the connection at once
+        :param kwargs: The parameters of the endpoint, as accepted by its get_* method
+        :return: A generator of the bytes of the body
+        """
+        response = self._open_stream(path, ENDPOINTS[path].build(kwargs))
+        return self._iter_raw(response, chunk_size)
+
+    @staticmethod
+    def _iter_raw(response, chunk_size: int):
+        try:
+            yield from response.iter_content(chunk_size)
+        finally:
+            response.close()
+
+    def _open_stream(self, path: str, params: dict):
+        url = f"{self._base_url}/{path}"
+        billable = ENDPOINTS[path].billable
+        if billable:
+            self._ensure_credit()
+            self._acquire()
+            self._check_credit()
+        return self._send_raw_requests('GET', url, self._get_headers(), params=params, billable=billable, stream=True)
 
     def get_status(self):
         """
@@ -275,14 +457,8 @@ class FootballAPI:
         :param search: The name of the country
         :return: Returns the Country json schema
         """
-        try:
-            if search:
-                self._parameter_validator.validate_search_field(search)
-            if code:
-                self._parameter_validator.validate_code_field(code)
-            return self._get("countries", name=name, code=code, search=search)
-        except Exception as e:
-            raise
+
+        return self._get('countries', name=name, code=code, search=search)
 
     def get_timezone(self):
         """
@@ -290,10 +466,8 @@ class FootballAPI:
 
         :return: Returns the timezone json schema
         """
-        try:
-            return self._get("timezone")
-        except Exception as e:
-            raise
+
+        return self._get('timezone')
 
     def get_leagues(self, id: int = None,
                     name: str = None,
@@ -322,26 +496,17 @@ class FootballAPI:
         :return: Returns the Leagues json schema
         """
 
-        try:
-            if code:
-                self._parameter_validator.validate_code_field(code)
-
-            if search:
-                self._parameter_validator.validate_search_field(search)
-            if season:
-                self._parameter_validator.validate_season_field(season)
-            if type:
-                self._parameter_validator.validate_type_field(type)
-            if current:
-                self._parameter_validator.validate_current_field(current)
-            if last:
-                self._parameter_validator.validate_last_field(last)
-            return self._get("leagues", id=id, name=name, country=country, code=code,
-                             season=season, team=team, type=type, current=current,
-                             search=search, last=last)
-
-        except Exception as e:
-            raise
+        return self._get('leagues',
+                         id=id,
+                         name=name,
+                         country=country,
+                         code=code,
+                         season=season,
+                         team=team,
+                         type=type,
+                         current=current,
+                         search=search,
+                         last=last)
 
     def get_leagues_seasons(self):
 
@@ -350,7 +515,7 @@ class FootballAPI:
         :return: Returns Season json schema
         """
 
-        return self._get("leagues/seasons")
+        return self._get('leagues/seasons')
 
     def get_teams_information(self, id: int = None,
                               name: str = None,
@@ -375,26 +540,15 @@ class FootballAPI:
         :return: Returns the Teams json schema
         """
 
-        try:
-            if season:
-                self._parameter_validator.validate_season_field(season)
-            if search:
-                self._parameter_validator.validate_search_field(search)
-            if code:
-                self._parameter_validator.validate_team_code_field(code)
-            missing_params = self._parameter_validator.check_missing_params(id, name, league, season,
-                                                                            country, code,
-                                                                            venue, search)
-            # checks if it has at least one params
-            if missing_params:
-                raise MissingParametersError("At least one of the optional parameters is required.")
-
-            return self._get(path="teams", id=id, name=name, league=league, country=country,
-                             season=season, code=code, venue=venue,
-                             search=search
-                             )
-        except Exception as e:
-            raise
+        return self._get('teams',
+                         id=id,
+                         name=name,
+                         league=league,
+                         season=season,
+                         country=country,
+                         code=code,
+                         venue=venue,
+                         search=search)
 
     def get_team_statistics(self, league: int,
                             season: int,
@@ -411,15 +565,11 @@ class FootballAPI:
         :return: Returns Team statistics json schema
         """
 
-        try:
-            if season:
-                self._parameter_validator.validate_season_field(season)
-            if date:
-                self._parameter_validator.validate_date_field(date)
-
-            return self._get('teams/statistics', league=league, season=season, team=team, date=date)
-        except Exception as e:
-            raise
+        return self._get('teams/statistics',
+                         league=league,
+                         season=season,
+                         team=team,
+                         date=date)
 
     def get_teams_seasons(self, team: int):
 
@@ -460,23 +610,12 @@ class FootballAPI:
         :return: Returns Venue json schema
         """
 
-        try:
-            if search:
-                self._parameter_validator.validate_search_field(search)
-
-            missing_params = self._parameter_validator.check_missing_params(id, name, city, country,
-                                                                            search)
-            if missing_params:
-                raise MissingParametersError("At least one of the optional parameters is required.")
-
-            return self._get('venues',
-                             id=id,
-                             name=name,
-                             city=city,
-                             country=country,
-                             search=search)
-        except Exception as e:
-            raise
+        return self._get('venues',
+                         id=id,
+                         name=name,
+                         city=city,
+                         country=country,
+                         search=search)
 
     def get_standings(self,
                       season: int,
@@ -492,19 +631,7 @@ class FootballAPI:
         :return: Returns the standings json schema
         """
 
-        try:
-            if season:
-                self._parameter_validator.validate_season_field(season)
-            missing_params = self._parameter_validator.check_missing_params(league, team)
-            if missing_params:
-                raise MissingParametersError("At least one of the optional parameters is required.")
-
-            return self._get('standings',
-                             league=league,
-                             season=season,
-                             team=team)
-        except Exception as e:
-            raise
+        return self._get('standings', season=season, league=league, team=team)
 
     def get_fixtures(self,
                      id: int = None,
@@ -544,70 +671,120 @@ class FootballAPI:
         :return: Returns fixture json schema
         """
 
-        try:
-            missing_params = self._parameter_validator.check_missing_params(id, ids, live, date, league, season,
-                                                                            team, last, next_, from_,
-                                                                            to, round_, status, venue,
-                                                                            timezone)
-            if missing_params:
-                raise MissingParametersError("At least one of the optional parameters is required.")
-
-            if id and not self._parameter_validator.check_missing_params(ids, season, live, date, league,
-                                                                         team, last, next_, from_,
-                                                                         to, round_, status, venue,
-                                                                         timezone):
-                raise MissingParametersError("The id field must be used alone.")
-
-            if ids:
-                self._parameter_validator.validate_ids_field(ids)
-
-            if ids and not self._parameter_validator.check_missing_params(id, season, live, date, league,
-                                                                          team, last, next_, from_,
-                                                                          to, round_, status, venue,
-                                                                          timezone):
-                raise MissingParametersError("The ids field must be used alone.")
-
-            if live:
-                self._parameter_validator.validate_live_field(live)
-            if date:
-                self._parameter_validator.validate_date_field(date)
-            if season:
-                self._parameter_validator.validate_season_field(season)
-            if season and self._parameter_validator.check_missing_params(live, date, league,
-                                                                         team, last, next_, from_,
-                                                                         to, round_, status, venue,
-                                                                         timezone):
-                raise MissingParametersError("The Season field need another parameter other than id ans ids. ")
-            if last:
-                self._parameter_validator.validate_last_field(last)
-            if next_:
-                self._parameter_validator.validate_next_field(next_)
-            if from_:
-                self._parameter_validator.validate_date_field(from_)
-            if to:
-                self._parameter_validator.validate_date_field(to)
-            if status:
-                self._parameter_validator.validate_status_field(status)
-
-            return self._get('fixtures',
-                             id=id,
-                             ids=ids,
-                             live=live,
-                             date=date,
-                             league=league,
-                             season=season,
-                             team=team,
-                             last=last,
-                             next_=next_,
-                             from_=from_,
-                             to=to,
-                             round_=round_,
-                             status=status,
-                             venue=venue,
-                             timezone=timezone
-                             )
-        except Exception as e:
-            raise
+        return self._get('fixtures',
+                         id=id,
+                         ids=ids,
+                         live=live,
+                         date=date,
+                         league=league,
+                         season=season,
+                         team=team,
+                         last=last,
+                         next_=next_,
+                         from_=from_,
+                         to=to,
+                         round_=round_,
+                         status=status,
+                         venue=venue,
+                         timezone=timezone)
+
+    def get_fixtures_bulk(self, ids: Iterable[int], max_workers: int = 4):
+
+        """
+        Get any number of fixtures by id. The ids are de-duplicated and split into
+        requests of up to 20 ids, which are sent concurrently.
+
+        :param ids: The ids of the fixtures
+        :param max_workers: The maximum number of requests in flight at once
+        :return: Returns a dict of the fixtures keyed by fixture id
+        """
+
+        chunks = chunk_fixture_ids(ids)
+        if not chunks:
+            return {}
+        self._ensure_credit()
+        self._reserve_credit(len(chunks))
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        fixtures = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+            get_fixtures = self._in_context(self.get_fixtures)
+            for data in executor.map(lambda chunk: get_fixtures(ids=chunk), chunks):
+                for item in data["response"]:
+                    fixtures[item["fixture"]["id"]] = item
+        return fixtures
+
+    def batch(self, calls, max_workers: int = 8, return_exceptions: bool = True):
+
+        """
+        Run several get_* calls concurrently, over the connection pool of the client. The calls go through
+        the response cache, the rate limiter and the quota like any other call.
+
+        Usage::
+
+            fixture, events, lineups = fp.batch([
+                ("get_fixtures", {"id": 1035037}),
+                ("get_fixture_events", {"fixture": 1035037}),
+                ("get_fixture_lineups", {"fixture": 1035037}),
+            ])
+
+        :param calls: The calls, each the name of a get_* method and optionally a dict of its arguments
+        :param max_workers: The maximum number of calls in flight at once
+        :param return_exceptions: Whether the exception raised by a call is returned in its place,
+        or raised once every call is done
+        :return: Returns the list of the results, in the order of the calls
+        """
+
+        calls = self._batch_calls(calls)
+        if not calls:
+            return []
+        self._ensure_credit()
+        self._reserve_credit(sum(method.__name__ != "get_status" for method, _ in calls))
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        def run(call):
+            method, kwargs = call
+            try:
+                return method(**kwargs)
+            except Exception as e:
+                return _BatchError(e)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(calls)))) as executor:
+            results = list(executor.map(self._in_context(run), calls))
+        return self._batch_results(results, return_exceptions)
+
+    def _batch_calls(self, calls):
+        checked = []
+        for call in calls:
+            name, kwargs = (call, None) if isinstance(call, str) else (call[0], call[1] if len(call) > 1 else None)
+            method = getattr(self, name, None) if isinstance(name, str) and name.startswith("get_") else None
+            if method is None or name == "get_fixtures_bulk":
+                raise ValueError(f"Invalid batch call {name!r}, expected the name of a get_* method.")
+            checked.append((method, dict(kwargs or {})))
+        return checked
+
+    @staticmethod
+    def _batch_results(results, return_exceptions: bool):
+        errors = [result.error for result in results if isinstance(result, _BatchError)]
+        if errors and not return_exceptions:
+            raise errors[0]
+        return [result.error if isinstance(result, _BatchError) else result for result in results]
+
+    @staticmethod
+    def _in_context(fn):
+        """
+        :return: A function running fn in a copy of the current context, so that the calls made from
+        worker threads keep the priority class of the caller
+        """
+        context = contextvars.copy_context()
+        return lambda *args, **kwargs: context.copy().run(fn, *args, **kwargs)
+
+    def _reserve_credit(self, count: int):
+        if self._credit.available_credit < count:
+            raise APILimitExceededError(f"{count} requests needed but only {self._credit.available_credit} "
+                                        f"credit(s) left of the daily quota of {self._credit.max_credit}.")
 
     def get_rounds(self,
                    league: int,
@@ -622,16 +799,8 @@ class FootballAPI:
         :param current: The current round only. Enum: "true" "false"
         :return: Returns Round json schema
         """
-        try:
-            self._parameter_validator.validate_season_field(season)
-            if current:
-                self._parameter_validator.validate_current_field(current)
-            return self._get('fixtures/rounds',
-                             league=league,
-                             season=season,
-                             current=current)
-        except Exception as e:
-            raise
+
+        return self._get('fixtures/rounds', league=league, season=season, current=current)
 
     def get_head_to_head(self,
                          h2h: str,
@@ -663,30 +832,18 @@ class FootballAPI:
         :return: Returns Head to head json schema
         """
 
-        try:
-            self._parameter_validator.validate_h2h_field(h2h)
-            if season:
-                self._parameter_validator.validate_season_field(season)
-            if from_:
-                self._parameter_validator.validate_date_field(from_)
-            if to:
-                self._parameter_validator.validate_date_field(to)
-            if status:
-                self._parameter_validator.validate_status_field(status)
-            return self._get('fixtures/headtohead',
-                             h2h=h2h,
-                             date=date,
-                             league=league,
-                             season=season,
-                             last=last,
-                             next_=next_,
-                             from_=from_,
-                             to=to,
-                             venue=venue,
-                             status=status,
-                             timezone=timezone)
-        except Exception as e:
-            raise
+        return self._get('fixtures/headtohead',
+                         h2h=h2h,
+                         date=date,
+                         league=league,
+                         season=season,
+                         last=last,
+                         next_=next_,
+                         from_=from_,
+                         to=to,
+                         venue=venue,
+                         status=status,
+                         timezone=timezone)
 
     def get_fixture_statistics(self,
                                fixture: int,
@@ -702,15 +859,7 @@ class FootballAPI:
         :return: Returns statistics json schema
         """
 
-        try:
-            if type:
-                self._parameter_validator.validate_fixture_statistics_type_field(type)
-            return self._get('fixtures/statistics',
-                             fixture=fixture,
-                             team=team,
-                             type=type)
-        except Exception as e:
-            raise
+        return self._get('fixtures/statistics', fixture=fixture, team=team, type=type)
 
     def get_fixture_events(self,
                            fixture: int,
@@ -727,17 +876,12 @@ class FootballAPI:
         :param type: The type
         :return: Returns event fixture json schema
         """
-        try:
-            if type:
-                self._parameter_validator.validate_fixture_events_type_field(type)
-
-            return self._get('fixtures/events',
-                             fixture=fixture,
-                             team=team,
-                             player=player,
-                             type=type)
-        except Exception as e:
-            raise
+
+        return self._get('fixtures/events',
+                         fixture=fixture,
+                         team=team,
+                         player=player,
+                         type=type)
 
     def get_fixture_lineups(self,
                             fixture: int,
@@ -754,16 +898,12 @@ class FootballAPI:
         :param type: The type
         :return: Returns lineups json schema
         """
-        try:
-            if type:
-                self._parameter_validator.validate_fixture_lineups_type_field(type)
-            return self._get('fixtures/lineups',
-                             fixture=fixture,
-                             team=team,
-                             player=player,
-                             type=type)
-        except Exception as e:
-            raise
+
+        return self._get('fixtures/lineups',
+                         fixture=fixture,
+                         team=team,
+                         player=player,
+                         type=type)
 
     def get_fixture_player_statistics(self,
                                       fixture: int,
@@ -777,9 +917,7 @@ class FootballAPI:
         :return: Returns fixture player statistics json schema
         """
 
-        return self._get('fixtures/players',
-                         fixture=fixture,
-                         team=team)
+        return self._get('fixtures/players', fixture=fixture, team=team)
 
     def get_injuries(self,
                      league: int = None,
@@ -803,30 +941,14 @@ class FootballAPI:
         :return: Returns injury json schema
         """
 
-        try:
-            missing_params = self._parameter_validator.check_missing_params(league, season, fixture,
-                                                                            team, player, date, timezone)
-            if missing_params:
-                raise MissingParametersError("At least one of the optional parameters is required.")
-
-            if season:
-                self._parameter_validator.validate_season_field(season)
-            if season and self._parameter_validator.check_missing_params(league, season, fixture,
-                                                                            team, player, date, timezone):
-                raise MissingParametersError("At least one of the optional parameters is required with season field.")
-
-            if date:
-                self._parameter_validator.validate_date_field(date)
-            return self._get('injuries',
-                             league=league,
-                             season=season,
-                             fixture=fixture,
-                             team=team,
-                             player=player,
-                             date=date,
-                             timezone=timezone)
-        except Exception as e:
-            raise
+        return self._get('injuries',
+                         league=league,
+                         season=season,
+                         fixture=fixture,
+                         team=team,
+                         player=player,
+                         date=date,
+                         timezone=timezone)
 
     def get_predictions(self, fixture: int):
 
@@ -854,17 +976,7 @@ class FootballAPI:
         :return: Returns coach json schema
         """
 
-        try:
-            missing_params = self._parameter_validator.check_missing_params(id, search, team)
-            if missing_params:
-                raise MissingParametersError("At least one of the optional parameters is required.")
-
-            if search:
-                self._parameter_validator.validate_search_field(search)
-
-            return self._get('coachs', id=id, search=search, team=team)
-        except Exception as e:
-            raise
+        return self._get('coachs', id=id, team=team, search=search)
 
     def get_player_seasons(self, player: int = None):
 
@@ -875,10 +987,7 @@ class FootballAPI:
         :return: Returns Player season json schema
         """
 
-        try:
-            return self._get('players/seasons', player=player)
-        except Exception as e:
-            raise
+        return self._get('players/seasons', player=player)
 
     def get_player(self,
                    id: int = None,
@@ -901,26 +1010,71 @@ class FootballAPI:
         :return: Returns player json schema
         """
 
-        try:
-            self._parameter_validator.check_missing_params(id, team, league, season, search)
-            self._parameter_validator.validate_player_fields(id=id, team=team, league=league, season=season,
-                                                             search=search, page=page)
-            if season:
-                self._parameter_validator.validate_season_field(season)
-            if search:
-                self._parameter_validator.validate_player_search_field(search)
-            return self._get('players',
-                             id=id,
-                             team=team,
-                             league=league,
-                             search=search,
-                             season=season,
-                             page=page)
+        return self._get('players',
+                         id=id,
+                         team=team,
+                         league=league,
+                         season=season,
+                         search=search,
+                         page=page)
 
-        except Exception as e:
-            if e == ValueError:
-                print(f"Validation error: {str(e)}")
-            raise
+    def iter_players(self,
+                     id: int = None,
+                     team: int = None,
+                     league: int = None,
+                     season: int = None,
+                     search: str = None,
+                     prefetch: int = 0
+                     ):
+
+        """
+        Iterate lazily over the players statistics of every page.
+
+        :param id: The id of the player
+        :param team: The id of the team
+        :param league: The id of the league
+        :param season: The season of the league
+        :param search: The name of the player
+        :param prefetch: The number of following pages fetched concurrently once the total
+        number of pages is known. Default: 0, pages are fetched one after another
+        :return: Yields the items of the response of each page
+        """
+
+        return self._iter_pages(self.get_player, prefetch,
+                                id=id, team=team, league=league, season=season, search=search)
+
+    @staticmethod
+    def _iter_pages(getter, prefetch: int, **kwargs):
+        data = getter(page=1, **kwargs)
+        yield from data["response"]
+        total = data["paging"]["total"]
+
+        if prefetch <= 0:
+            for page in range(2, total + 1):
+                yield from getter(page=page, **kwargs)["response"]
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        getter = FootballAPI._in_context(getter)
+        pages = iter(range(2, total + 1))
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=prefetch)
+        try:
+            for page in pages:
+                pending.append(executor.submit(getter, page=page, **kwargs))
+                if len(pending) >= prefetch:
+                    break
+            while pending:
+                data = pending.popleft().result()
+                for page in pages:
+                    pending.append(executor.submit(getter, page=page, **kwargs))
+                    break
+                yield from data["response"]
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
 
     def get_players_squads(self, team, player):
 
@@ -933,14 +1087,7 @@ class FootballAPI:
         :return: Returns players squads json schema
         """
 
-        try:
-            missing_para = self._parameter_validator.check_missing_params(team, player)
-            if missing_para:
-                raise MissingParametersError()
-            return self._get('players/squads', team=team, player=player)
-        except MissingParametersError as e:
-            print(f" Missing Parameter error")
-            raise
+        return self._get('players/squads', team=team, player=player)
 
     def get_player_top_scorers(self, league: int,
                                season: int  # validate: YYYY
@@ -954,11 +1101,7 @@ class FootballAPI:
         :return: Returns top scorers json schema
         """
 
-        try:
-            self._parameter_validator.validate_season_field(season)
-            return self._get('players/topscorers', league=league, season=season)
-        except Exception as e:
-            raise
+        return self._get('players/topscorers', league=league, season=season)
 
     def get_player_top_assist(self, league: int,
                               season: int
@@ -972,11 +1115,7 @@ class FootballAPI:
         :return: Returns player assists json schema
         """
 
-        try:
-            self._parameter_validator.validate_season_field(season)
-            return self._get('players/topassists', league=league, season=season)
-        except Exception as e:
-            raise
+        return self._get('players/topassists', league=league, season=season)
 
     def get_player_top_yellow_cards(self, league: int,
                                     season: int
@@ -990,11 +1129,7 @@ class FootballAPI:
         :return: Returns player yellow card json schema
         """
 
-        try:
-            self._parameter_validator.validate_season_field(season)
-            return self._get('players/topyellowcards', league=league, season=season)
-        except Exception as e:
-            raise
+        return self._get('players/topyellowcards', league=league, season=season)
 
     def get_player_top_red_cards(self, league: int,
                                  season: int
@@ -1008,11 +1143,7 @@ class FootballAPI:
         :return: Returns player red card json schema
         """
 
-        try:
-            self._parameter_validator.validate_season_field(season)
-            return self._get('players/topredcards', league=league, season=season)
-        except Exception as e:
-            raise
+        return self._get('players/topredcards', league=league, season=season)
 
     def get_transfers(self, player: int = None, team: int = None):
 
@@ -1024,14 +1155,7 @@ class FootballAPI:
         :return: Returns transfers json schema
         """
 
-        try:
-            missing_para = self._parameter_validator.check_missing_params(team, player)
-            if missing_para:
-                raise MissingParametersError()
-            return self._get('transfers', team=team, player=player)
-        except MissingParametersError as e:
-            print(f" Missing Parameter error")
-            raise
+        return self._get('transfers', player=player, team=team)
 
     def get_trophies(self, player: int = None, coach: int = None):
 
@@ -1043,14 +1167,7 @@ class FootballAPI:
         :return: Returns trophies json schema
         """
 
-        try:
-            missing_para = self._parameter_validator.check_missing_params(player, coach)
-            if missing_para:
-                raise MissingParametersError()
-            return self._get('trophies', player=player, coach=coach)
-        except MissingParametersError as e:
-            print(f" Missing Parameter error")
-            raise
+        return self._get('trophies', player=player, coach=coach)
 
     def get_sidelined(self, player: int = None, coach: int = None):
 
@@ -1062,14 +1179,7 @@ class FootballAPI:
         :return: Returns sidelined json schema
         """
 
-        try:
-            missing_para = self._parameter_validator.check_missing_params(player, coach)
-            if missing_para:
-                raise MissingParametersError()
-            return self._get('sidelined', player=player, coach=coach)
-        except MissingParametersError as e:
-            print(f" Missing Parameter error")
-            raise
+        return self._get('sidelined', player=player, coach=coach)
 
     def get_in_play_odds(self, fixture: int = None, league: int = None, bet: int = None):
 
@@ -1082,14 +1192,7 @@ class FootballAPI:
         :return: Returns in-play odd json schema
         """
 
-        try:
-            missing_para = self._parameter_validator.check_missing_params(fixture, league, bet)
-            if missing_para:
-                raise MissingParametersError()
-            return self._get('odds/live', fixture=fixture, league=league, bet=bet)
-        except MissingParametersError as e:
-            print(f" Missing Parameter error")
-            raise
+        return self._get('odds/live', fixture=fixture, league=league, bet=bet)
 
     def get_all_bets_in_play(self, id: str = None, search: str = None):
 
@@ -1101,13 +1204,5 @@ class FootballAPI:
         :return: Returns in play odds json schema
         """
 
-        try:
-            missing_para = self._parameter_validator.check_missing_params(id, search)
-            if missing_para:
-                raise MissingParametersError()
-            if search:
-                self._parameter_validator.validate_search_field(search)
-            return self._get('odds/bets', id=id, search=search)
-        except MissingParametersError as e:
-            print(f" Missing Parameter error")
-            raise
+        return self._get('odds/bets', id=id, search=search)
+
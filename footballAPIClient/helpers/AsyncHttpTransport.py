@@ -0,0 +1,99 @@
+import asyncio
+import json
+
+
+class AsyncHttpTransport:
+    """
+    Asynchronous keep-alive HTTP transport used by the AsyncFootballAPI client.
+    It owns a single aiohttp.ClientSession created on first use, inside the running event loop.
+    """
+
+    def __init__(self,
+                 limit: int = 100,
+                 limit_per_host: int = 0,
+                 timeout: float = 30
+                 ):
+
+        """
+
+        :param limit: The maximum number of simultaneous connections.
+        :param limit_per_host: The maximum number of simultaneous connections per host, 0 for no limit.
+        :param timeout: The total timeout of a request in seconds.
+
+        """
+
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError("AsyncFootballAPI requires aiohttp, install it with: pip install aiohttp")
+        self._aiohttp = aiohttp
+        self.request_errors = (aiohttp.ClientError, asyncio.TimeoutError)
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._timeout = timeout
+        self._session = None
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            aiohttp = self._aiohttp
+            connector = aiohttp.TCPConnector(limit=self._limit, limit_per_host=self._limit_per_host)
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  timeout=aiohttp.ClientTimeout(total=self._timeout))
+        return self._session
+
+    async def request(self, method, url, headers=None, params=None, data=None, stream=False):
+        if stream:
+            response = await self._get_session().request(method, url, headers=headers, params=params, json=data)
+            return AsyncStreamResponse(response)
+        async with self._get_session().request(method, url, headers=headers, params=params, json=data) as response:
+            content = await response.read()
+            return AsyncResponse(response.status, response.headers, content)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class AsyncResponse:
+    """
+    Fully read response, exposing the parts of the requests.Response interface used by the client.
+    """
+
+    __slots__ = ("status_code", "headers", "content")
+
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class AsyncStreamResponse:
+    """
+    Response whose body is read as it is received, with ``iter_content``.
+    The body of an error response is read by ``read`` before ``json`` is called.
+    """
+
+    __slots__ = ("status_code", "headers", "content", "_response")
+
+    def __init__(self, response):
+        self.status_code = response.status
+        self.headers = response.headers
+        self.content = None
+        self._response = response
+
+    async def read(self):
+        self.content = await self._response.read()
+        return self.content
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int = 65536):
+        return self._response.content.iter_chunked(chunk_size)
+
+    def close(self):
+        self._response.release()
@@ -0,0 +1,109 @@
+import threading
+import time
+
+# Daily quota headers returned by the API with every billable call.
+LIMIT_DAY_HEADER = "x-ratelimit-requests-limit"
+REMAINING_DAY_HEADER = "x-ratelimit-requests-remaining"
+
+
+class CreditTracker:
+    """
+    Keeps the daily quota of the account up to date locally.
+    The quota is read from the rate-limit headers of every response, and the `status`
+    endpoint is only queried again when the resync interval elapses or drift is detected.
+    """
+
+    def __init__(self, resync_interval: float = 3600, drift_tolerance: int = 5):
+
+        """
+
+        :param resync_interval: Seconds after which the quota is synced again with the status endpoint.
+        :param drift_tolerance: The number of calls answered without rate-limit headers
+        tolerated before a resync.
+
+        """
+
+        self._lock = threading.Lock()
+        self._resync_interval = resync_interval
+        self._drift_tolerance = drift_tolerance
+        self._max_credit = None
+        self._available_credit = None
+        self._last_sync = None
+        self._unconfirmed = 0
+        self._drift = False
+
+    @property
+    def max_credit(self):
+        return self._max_credit
+
+    @property
+    def available_credit(self):
+        return self._available_credit
+
+    def needs_sync(self):
+        with self._lock:
+            if self._available_credit is None or self._drift:
+                return True
+            return time.monotonic() - self._last_sync >= self._resync_interval
+
+    def sync(self, limit_day: int, current: int):
+        """
+        Reset the quota from the values of the status endpoint.
+
+        :param limit_day: The daily request limit of the account
+        :param current: The number of requests already used today
+        """
+        with self._lock:
+            self._max_credit = limit_day
+            self._available_credit = limit_day - (current + 1)  # as a fail-safe situation added 1
+            self._last_sync = time.monotonic()
+            self._unconfirmed = 0
+            self._drift = False
+
+    def reserve(self):
+        """
+        Take one credit for a billable call, atomically across threads.
+
+        :return: True if a credit was available
+        """
+        with self._lock:
+            if self._available_credit is None or self._available_credit <= 0:
+                return False
+            self._available_credit -= 1
+            return True
+
+    def record(self, headers):
+        """
+        Update the quota from the rate-limit headers of the response of a billable call.
+
+        :param headers: The response headers
+        """
+        limit = int_header(headers, LIMIT_DAY_HEADER)
+        remaining = int_header(headers, REMAINING_DAY_HEADER)
+        with self._lock:
+            if remaining is None:
+                self._unconfirmed += 1
+                if self._unconfirmed > self._drift_tolerance:
+                    self._drift = True
+                return
+
+            if limit is not None and self._max_credit is not None and limit != self._max_credit:
+                # the plan changed since the last sync
+                self._drift = True
+            if limit is not None:
+                self._max_credit = limit
+            # the reported quota also covers calls made by other clients sharing the key
+            self._available_credit = remaining
+            self._unconfirmed = 0
+
+
+def int_header(headers, name):
+    if headers is None:
+        return None
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
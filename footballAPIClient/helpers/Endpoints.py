@@ -0,0 +1,313 @@
+from footballAPIClient.Exceptions.MissingParametersError import MissingParametersError
+from footballAPIClient.helpers.ParameterValidator import ParameterValidator
+
+_MISSING_PARAMS_MESSAGE = "At least one of the optional parameters is required."
+
+
+class Param:
+    """
+    A query parameter of an endpoint.
+    """
+
+    __slots__ = ("name", "api_name", "type", "validator")
+
+    def __init__(self, name: str, type_: type, validator=None, api_name: str = None):
+
+        """
+
+        :param name: The keyword argument name used by the client methods
+        :param type_: The expected python type
+        :param validator: (optional) A function validating the value, raising on invalid values
+        :param api_name: The query parameter name sent to the API, defaults to name
+
+        """
+
+        self.name = name
+        self.api_name = api_name or name
+        self.type = type_
+        self.validator = validator
+
+
+class EndpointSpec:
+    """
+    Declarative definition of an endpoint: its path, query parameters and the rules between them.
+    The definition is compiled once into a validator and query parameter builder shared by the
+    sync, async and batch front-ends.
+    """
+
+    def __init__(self,
+                 path: str,
+                 params=(),
+                 required=(),
+                 at_least_one: bool = False,
+                 alone=(),
+                 requires: dict = None,
+                 checks=(),
+                 billable: bool = True
+                 ):
+
+        """
+
+        :param path: The endpoint path
+        :param params: The Param accepted by the endpoint
+        :param required: The names of the parameters which must be given
+        :param at_least_one: Whether at least one of the parameters must be given
+        :param alone: The names of the parameters which must be used without any other one
+        :param requires: Maps a parameter name to the names of which at least one must be given along with it
+        :param checks: Functions called with the given parameters (by name) validating the whole call
+        :param billable: Whether a call counts against the daily quota
+
+        """
+
+        self.path = path
+        self.params = tuple(params)
+        self.required = tuple(required)
+        self.at_least_one = at_least_one
+        self.alone = tuple(alone)
+        self.requires = {name: frozenset(others) for name, others in (requires or {}).items()}
+        self.checks = tuple(checks)
+        self.billable = billable
+        self.names = frozenset(param.name for param in self.params)
+        self._api_names = {param.name: param.api_name for param in self.params}
+        self._fields = tuple((param.name, param.api_name, _type_checker(param.type, param.name), param.validator)
+                             for param in self.params)
+
+    def build(self, values: dict):
+        """
+        Validate the parameters of a call and build its query parameters.
+
+        :param values: The parameters of the call by name, None for the ones not given
+        :return: The query parameters
+        """
+        unknown = values.keys() - self.names
+        if unknown:
+            raise TypeError(f"{self.path} got unexpected parameter(s): {', '.join(sorted(unknown))}")
+
+        params = {}
+        given = set()
+        for name, api_name, check_type, validator in self._fields:
+            value = values.get(name)
+            if not value:
+                continue
+            check_type(value)
+            if validator is not None:
+                validator(value)
+            params[api_name] = value
+            given.add(name)
+
+        for name in self.required:
+            if name not in given:
+                raise MissingParametersError(f"The {name} field is required.")
+        if self.at_least_one and not given:
+            raise MissingParametersError(_MISSING_PARAMS_MESSAGE)
+        for name in self.alone:
+            if name in given and len(given) > 1:
+                raise MissingParametersError(f"The {name} field must be used alone.")
+        for name, others in self.requires.items():
+            if name in given and given.isdisjoint(others):
+                raise MissingParametersError(f"The {name} field requires at least one of: "
+                                             f"{', '.join(sorted(self._api_names[o] for o in others))}.")
+        for check in self.checks:
+            check(values)
+        return params
+
+
+def _type_checker(type_, name):
+    if type_ is int:
+        return lambda value: ParameterValidator.validate_type_int(value, name)
+    if type_ is str:
+        return lambda value: ParameterValidator.validate_type_str(value, name)
+
+    def check(value):
+        if not isinstance(value, type_):
+            raise TypeError(f"{name} has an invalid type.")
+    return check
+
+
+def _player_fields(values):
+    ParameterValidator.validate_player_fields(**values)
+
+
+_v = ParameterValidator
+
+_FIXTURE_FILTERS = ("live", "date", "league", "team", "last", "next_", "from_", "to", "round_", "status",
+                    "venue", "timezone")
+
+
+def _top_players(path):
+    return EndpointSpec(path,
+                        params=(Param("league", int),
+                                Param("season", int, _v.validate_season_field)),
+                        required=("league", "season"))
+
+
+def _player_or_coach(path):
+    return EndpointSpec(path,
+                        params=(Param("player", int),
+                                Param("coach", int)),
+                        at_least_one=True)
+
+
+# Definition of every endpoint wrapped by the client, keyed by path.
+ENDPOINTS = {spec.path: spec for spec in (
+    EndpointSpec("status", billable=False),
+    EndpointSpec("countries",
+                 params=(Param("name", str),
+                         Param("code", str, _v.validate_code_field),
+                         Param("search", str, _v.validate_search_field))),
+    EndpointSpec("timezone"),
+    EndpointSpec("leagues",
+                 params=(Param("id", int),
+                         Param("name", str),
+                         Param("country", str),
+                         Param("code", str, _v.validate_code_field),
+                         Param("season", int, _v.validate_season_field),
+                         Param("team", int),
+                         Param("type", str, _v.validate_type_field),
+                         Param("current", str, _v.validate_current_field),
+                         Param("search", str, _v.validate_search_field),
+                         Param("last", int, _v.validate_last_field))),
+    EndpointSpec("leagues/seasons"),
+    EndpointSpec("teams",
+                 params=(Param("id", int),
+                         Param("name", str),
+                         Param("league", int),
+                         Param("season", int, _v.validate_season_field),
+                         Param("country", str),
+                         Param("code", str, _v.validate_team_code_field),
+                         Param("venue", (int, str)),
+                         Param("search", str, _v.validate_search_field)),
+                 at_least_one=True),
+    EndpointSpec("teams/statistics",
+                 params=(Param("league", int),
+                         Param("season", int, _v.validate_season_field),
+                         Param("team", int),
+                         Param("date", str, _v.validate_date_field)),
+                 required=("league", "season", "team")),
+    EndpointSpec("teams/seasons",
+                 params=(Param("team", int),),
+                 required=("team",)),
+    EndpointSpec("teams/countries"),
+    EndpointSpec("venues",
+                 params=(Param("id", int),
+                         Param("name", str),
+                         Param("city", str),
+                         Param("country", str),
+                         Param("search", str, _v.validate_search_field)),
+                 at_least_one=True),
+    EndpointSpec("standings",
+                 params=(Param("league", int),
+                         Param("season", int, _v.validate_season_field),
+                         Param("team", int)),
+                 required=("season",),
+                 requires={"season": ("league", "team")}),
+    EndpointSpec("fixtures",
+                 params=(Param("id", int),
+                         Param("ids", str, _v.validate_ids_field),
+                         Param("live", str, _v.validate_live_field),
+                         Param("date", str, _v.validate_date_field),
+                         Param("league", int),
+                         Param("season", int, _v.validate_season_field),
+                         Param("team", int),
+                         Param("last", int, _v.validate_last_field),
+                         Param("next_", int, _v.validate_next_field, api_name="next"),
+                         Param("from_", str, _v.validate_date_field, api_name="from"),
+                         Param("to", str, _v.validate_date_field),
+                         Param("round_", str, api_name="round"),
+                         Param("status", str, _v.validate_status_field),
+                         Param("venue", (int, str)),
+                         Param("timezone", str)),
+                 at_least_one=True,
+                 alone=("id", "ids"),
+                 requires={"season": _FIXTURE_FILTERS}),
+    EndpointSpec("fixtures/rounds",
+                 params=(Param("league", int),
+                         Param("season", int, _v.validate_season_field),
+                         Param("current", str, _v.validate_current_field)),
+                 required=("league", "season")),
+    EndpointSpec("fixtures/headtohead",
+                 params=(Param("h2h", str, _v.validate_h2h_field),
+                         Param("date", str, _v.validate_date_field),
+                         Param("league", int),
+                         Param("season", int, _v.validate_season_field),
+                         Param("last", int, _v.validate_last_field),
+                         Param("next_", int, _v.validate_next_field, api_name="next"),
+                         Param("from_", str, _v.validate_date_field, api_name="from"),
+                         Param("to", str, _v.validate_date_field),
+                         Param("venue", (int, str)),
+                         Param("status", str, _v.validate_status_field),
+                         Param("timezone", str)),
+                 required=("h2h",)),
+    EndpointSpec("fixtures/statistics",
+                 params=(Param("fixture", int),
+                         Param("team", int),
+                         Param("type", str, _v.validate_fixture_statistics_type_field)),
+                 required=("fixture",)),
+    EndpointSpec("fixtures/events",
+                 params=(Param("fixture", int),
+                         Param("team", int),
+                         Param("player", int),
+                         Param("type", str, _v.validate_fixture_events_type_field)),
+                 required=("fixture",)),
+    EndpointSpec("fixtures/lineups",
+                 params=(Param("fixture", int),
+                         Param("team", int),
+                         Param("player", int),
+                         Param("type", str, _v.validate_fixture_lineups_type_field)),
+                 required=("fixture",)),
+    EndpointSpec("fixtures/players",
+                 params=(Param("fixture", int),
+                         Param("team", int)),
+                 required=("fixture",)),
+    EndpointSpec("injuries",
+                 params=(Param("league", int),
+                         Param("season", int, _v.validate_season_field),
+                         Param("fixture", int),
+                         Param("team", int),
+                         Param("player", int),
+                         Param("date", str, _v.validate_date_field),
+                         Param("timezone", str)),
+                 at_least_one=True,
+                 requires={"season": ("league", "fixture", "team", "player", "date", "timezone")}),
+    EndpointSpec("predictions",
+                 params=(Param("fixture", int),),
+                 required=("fixture",)),
+    EndpointSpec("coachs",
+                 params=(Param("id", int),
+                         Param("team", int),
+                         Param("search", str, _v.validate_search_field)),
+                 at_least_one=True),
+    EndpointSpec("players/seasons",
+                 params=(Param("player", int),)),
+    EndpointSpec("players",
+                 params=(Param("id", int),
+                         Param("team", int),
+                         Param("league", int),
+                         Param("season", int, _v.validate_season_field),
+                         Param("search", str, _v.validate_player_search_field),
+                         Param("page", int)),
+                 checks=(_player_fields,)),
+    EndpointSpec("players/squads",
+                 params=(Param("team", int),
+                         Param("player", int)),
+                 at_least_one=True),
+    _top_players("players/topscorers"),
+    _top_players("players/topassists"),
+    _top_players("players/topyellowcards"),
+    _top_players("players/topredcards"),
+    EndpointSpec("transfers",
+                 params=(Param("player", int),
+                         Param("team", int)),
+                 at_least_one=True),
+    _player_or_coach("trophies"),
+    _player_or_coach("sidelined"),
+    EndpointSpec("odds/live",
+                 params=(Param("fixture", int),
+                         Param("league", int),
+                         Param("bet", int)),
+                 at_least_one=True),
+    EndpointSpec("odds/bets",
+                 params=(Param("id", int),
+                         Param("search", str, _v.validate_search_field)),
+                 at_least_one=True),
+)}
@@ -0,0 +1,41 @@
+from typing import Iterable
+
+from footballAPIClient._constants import MAX_FIXTURE_IDS
+
+# The parts of a fixtures item fetched by id, and the endpoint whose response they are
+FIXTURE_DETAILS = (
+    ("events", "fixtures/events"),
+    ("lineups", "fixtures/lineups"),
+    ("statistics", "fixtures/statistics"),
+    ("players", "fixtures/players"),
+)
+
+
+def detail_response(path: str, fixture_id: int, item, key: str):
+    """
+    Build the response of a per-fixture endpoint from the part of a fixtures item fetched by id holding it,
+    e.g. the response of fixtures/events from the events of the item.
+
+    :param path: The endpoint path, one of FIXTURE_DETAILS
+    :param fixture_id: The id of the fixture
+    :param item: The fixtures item
+    :param key: The key of the part of the item, one of FIXTURE_DETAILS
+    :return: The response of the endpoint
+    """
+    if hasattr(item, "to_dict"):
+        item = item.to_dict()
+    values = item[key] or []
+    return {"get": path, "parameters": {"fixture": str(fixture_id)}, "errors": [], "results": len(values),
+            "paging": {"current": 1, "total": 1}, "response": values}
+
+
+def chunk_fixture_ids(ids: Iterable[int]):
+    """
+    Group fixture ids into the values of the ids parameter of the fixtures endpoint.
+
+    :param ids: The fixture ids, duplicates are dropped
+    :return: The list of the groups, each holding at most MAX_FIXTURE_IDS ids joined with "-"
+    """
+    unique_ids = list(dict.fromkeys(int(fixture_id) for fixture_id in ids))
+    return ["-".join(str(fixture_id) for fixture_id in unique_ids[i:i + MAX_FIXTURE_IDS])
+            for i in range(0, len(unique_ids), MAX_FIXTURE_IDS)]
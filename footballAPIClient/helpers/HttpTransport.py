@@ -0,0 +1,65 @@
+class HttpTransport:
+    """
+    Keep-alive HTTP transport used by the FootballAPI client.
+    It owns a single requests.Session, so TCP/TLS connections are pooled and re-used
+    between calls instead of being opened again for every request.
+
+    Any object exposing the same ``request`` and ``close`` methods can be passed to
+    FootballAPI as a custom transport. Its optional ``request_errors`` attribute lists the
+    network exceptions the client retries. FootballAPI.stream requires ``request`` to accept
+    ``stream=True`` and to return a response exposing ``iter_content`` and ``close``.
+    """
+
+    def __init__(self,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 pool_block: bool = False,
+                 timeout=(3.05, 30)
+                 ):
+
+        """
+
+        :param pool_connections: The number of per-host connection pools to cache.
+        :param pool_maxsize: The maximum number of connections kept alive per host.
+        :param pool_block: When True, a request waits for a free connection instead of
+        opening one above the pool_maxsize limit.
+        :param timeout: The (connect, read) timeout in seconds, or a single value for both.
+
+        """
+
+        # imported here rather than at module level to keep `import footballAPIClient` fast
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self._timeout = timeout
+        self.request_errors = (requests.exceptions.RequestException,)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize,
+                              pool_block=pool_block)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    @property
+    def timeout(self):
+        return self._timeout
+
+    def request(self, method, url, headers=None, params=None, data=None, stream=False):
+        return self._session.request(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            json=data,
+            timeout=self._timeout,
+            stream=stream
+        )
+
+    def close(self):
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
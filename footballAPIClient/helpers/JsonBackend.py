@@ -0,0 +1,49 @@
+import json
+
+BACKENDS = ("auto", "orjson", "json")
+
+
+class JsonBackend:
+    """
+    JSON decoder used for the response bodies.
+    """
+
+    __slots__ = ("name", "loads")
+
+    def __init__(self, name: str, loads):
+
+        """
+
+        :param name: The name of the backend
+        :param loads: The function decoding a bytes body
+
+        """
+
+        self.name = name
+        self.loads = loads
+
+    def __repr__(self):
+        return f"JsonBackend({self.name!r})"
+
+
+def get_json_backend(backend="auto"):
+    """
+    Get a JSON backend.
+
+    :param backend: "orjson", "json" for the standard library, "auto" for orjson when it is installed
+    and json otherwise, or a function decoding a bytes body
+    :return: The JsonBackend
+    """
+    if callable(backend):
+        return JsonBackend(getattr(backend, "__module__", None) or "custom", backend)
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend {backend!r}, expected one of: {', '.join(BACKENDS)}")
+    if backend != "json":
+        try:
+            import orjson
+        except ImportError:
+            if backend == "orjson":
+                raise ImportError("The orjson JSON backend requires orjson, install it with: pip install orjson")
+        else:
+            return JsonBackend("orjson", orjson.loads)
+    return JsonBackend("json", json.loads)
@@ -0,0 +1,264 @@
+import codecs
+import json
+import re
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# The characters which may follow a number
+_NUMBER_END = frozenset(",]} \t\n\r")
+
+# Parser states
+_START = 0
+_KEY_OR_END = 1
+_KEY = 2
+_COLON = 3
+_VALUE = 4
+_AFTER_VALUE = 5
+_ITEM_OR_END = 6
+_ITEM = 7
+_AFTER_ITEM = 8
+_DONE = 9
+
+
+class JsonItemParser:
+    """
+    Incremental parser of an API response body, fed with the chunks of the body as they are received.
+    It returns the items of the ``response`` array as soon as each one is complete, and collects the
+    other keys of the body (get, parameters, errors, results, paging) in ``envelope``.
+
+    Only the item being received is buffered, so the memory used does not grow with the size of the body.
+    """
+
+    def __init__(self, key: str = "response"):
+
+        """
+
+        :param key: The key of the array whose items are returned
+
+        """
+
+        self.key = key
+        self.envelope = {}
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._current_key = None
+
+    @property
+    def done(self):
+        return self._state == _DONE
+
+    def feed(self, chunk: bytes):
+        """
+        :param chunk: The next bytes of the body
+        :return: The list of the items completed by the chunk
+        """
+        self._buffer = self._buffer[self._pos:] + self._utf8.decode(chunk)
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self):
+        """
+        Signal the end of the body.
+
+        :return: The list of the last items
+        :raise ValueError: When the body is truncated or is not a JSON object
+        """
+        self._buffer = self._buffer[self._pos:] + self._utf8.decode(b"", final=True)
+        self._pos = 0
+        items = self._parse(final=True)
+        if self._state != _DONE:
+            raise ValueError("Truncated JSON response body.")
+        return items
+
+    def _parse(self, final: bool):
+        items = []
+        buffer = self._buffer
+        size = len(buffer)
+        pos = self._pos
+        state = self._state
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos >= size:
+                break
+            char = buffer[pos]
+            if state == _START:
+                if char != "{":
+                    raise ValueError("The response body is not a JSON object.")
+                state = _KEY_OR_END
+                pos += 1
+            elif state == _KEY_OR_END and char == "}":
+                state = _DONE
+                pos += 1
+            elif state == _KEY_OR_END or state == _KEY:
+                key, end = self._decode(buffer, pos, final)
+                if end is None:
+                    break
+                if not isinstance(key, str):
+                    raise ValueError("Invalid key in the response body.")
+                self._current_key = key
+                state = _COLON
+                pos = end
+            elif state == _COLON:
+                if char != ":":
+                    raise ValueError("Invalid JSON in the response body.")
+                state = _VALUE
+                pos += 1
+            elif state == _VALUE:
+                if self._current_key == self.key and char == "[":
+                    state = _ITEM_OR_END
+                    pos += 1
+                    continue
+                value, end = self._decode(buffer, pos, final)
+                if end is None:
+                    break
+                self.envelope[self._current_key] = value
+                state = _AFTER_VALUE
+                pos = end
+            elif state == _AFTER_VALUE:
+                if char == ",":
+                    state = _KEY
+                elif char == "}":
+                    state = _DONE
+                else:
+                    raise ValueError("Invalid JSON in the response body.")
+                pos += 1
+            elif state == _ITEM_OR_END and char == "]":
+                state = _AFTER_VALUE
+                pos += 1
+            elif state == _ITEM_OR_END or state == _ITEM:
+                item, end = self._decode(buffer, pos, final)
+                if end is None:
+                    break
+                items.append(item)
+                state = _AFTER_ITEM
+                pos = end
+            elif state == _AFTER_ITEM:
+                if char == ",":
+                    state = _ITEM
+                elif char == "]":
+                    state = _AFTER_VALUE
+                else:
+                    raise ValueError("Invalid JSON in the response body.")
+                pos += 1
+            else:
+                raise ValueError("Extra data after the JSON response body.")
+        self._pos = pos
+        self._state = state
+        return items
+
+    def _decode(self, buffer: str, pos: int, final: bool):
+        """
+        :return: The decoded value and the position following it, or (None, None) when more data is needed
+        """
+        try:
+            value, end = self._decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None, None
+        # a number not followed by a delimiter may continue in the next chunk, e.g. "12." then "5"
+        if not final and isinstance(value, (int, float)) and not isinstance(value, bool) and \
+                (end == len(buffer) or buffer[end] not in _NUMBER_END):
+            return None, None
+        return value, end
+
+
+class ResponseStream:
+    """
+    Iterator over the items of the ``response`` array of an API response, decoded while the body is received.
+    The other keys of the body are available in ``envelope``, completely once the iteration is over.
+
+    The connection is released when the iteration ends or when the stream is closed.
+    """
+
+    def __init__(self, chunks, close=None, model=None):
+
+        """
+
+        :param chunks: An iterable of the bytes of the body
+        :param close: (optional) A function releasing the connection
+        :param model: (optional) The Model the items are converted into
+
+        """
+
+        self._chunks = chunks
+        self._close = close
+        self._model = model
+        self._parser = JsonItemParser()
+
+    @property
+    def envelope(self):
+        return self._parser.envelope
+
+    @property
+    def errors(self):
+        return self._parser.envelope.get("errors")
+
+    def __iter__(self):
+        model = self._model
+        try:
+            for chunk in self._chunks:
+                for item in self._parser.feed(chunk):
+                    yield item if model is None else model(item)
+            for item in self._parser.close():
+                yield item if model is None else model(item)
+        finally:
+            self.close()
+
+    def close(self):
+        if self._close is not None:
+            close, self._close = self._close, None
+            close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class AsyncResponseStream(ResponseStream):
+    """
+    Asynchronous iterator over the items of the ``response`` array of an API response,
+    decoded while the body is received.
+    """
+
+    def __init__(self, chunks, close=None, model=None):
+
+        """
+
+        :param chunks: An asynchronous iterable of the bytes of the body
+        :param close: (optional) A function releasing the connection
+        :param model: (optional) The Model the items are converted into
+
+        """
+
+        super().__init__(chunks, close=close, model=model)
+
+    def __iter__(self):
+        raise TypeError("AsyncResponseStream must be used with 'async for'.")
+
+    async def __aiter__(self):
+        model = self._model
+        try:
+            async for chunk in self._chunks:
+                for item in self._parser.feed(chunk):
+                    yield item if model is None else model(item)
+            for item in self._parser.close():
+                yield item if model is None else model(item)
+        finally:
+            await self.aclose()
+
+    async def aclose(self):
+        if hasattr(self._chunks, "aclose"):
+            await self._chunks.aclose()
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
@@ -0,0 +1,274 @@
+import json
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from footballAPIClient.helpers.CreditTracker import int_header
+
+# Per-minute rate-limit headers returned by the API with every call.
+LIMIT_MINUTE_HEADER = "x-ratelimit-limit"
+REMAINING_MINUTE_HEADER = "x-ratelimit-remaining"
+
+MINUTE = 60
+DAY = 24 * 60 * 60
+
+
+class TokenBucket:
+    """
+    Token bucket holding up to ``capacity`` tokens, refilled continuously over ``period`` seconds.
+    """
+
+    __slots__ = ("capacity", "period", "tokens", "updated")
+
+    def __init__(self, capacity: int, period: float, tokens: float = None, updated: float = None):
+        self.capacity = capacity
+        self.period = period
+        self.tokens = capacity if tokens is None else min(tokens, capacity)
+        self.updated = updated
+
+    def refill(self, now: float):
+        if self.updated is not None and now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.capacity / self.period)
+        self.updated = now
+
+    def wait_time(self, tokens: int = 1):
+        """
+        :return: Seconds until the bucket holds the requested tokens, 0 if it already does
+        """
+        if self.tokens >= tokens:
+            return 0
+        return (tokens - self.tokens) * self.period / self.capacity
+
+
+class DailyWindow:
+    """
+    Fixed window of ``capacity`` tokens, all given back at the daily reset of the quota, ``reset``
+    seconds after midnight UTC.
+    """
+
+    __slots__ = ("capacity", "reset", "tokens", "updated")
+
+    def __init__(self, capacity: int, reset: float = 0, tokens: float = None, updated: float = None):
+        self.capacity = capacity
+        self.reset = reset
+        self.tokens = capacity if tokens is None else min(tokens, capacity)
+        self.updated = updated
+
+    def window(self, now: float):
+        return (now - self.reset) // DAY
+
+    def refill(self, now: float):
+        if self.updated is not None and self.window(now) > self.window(self.updated):
+            self.tokens = self.capacity
+        self.updated = now
+
+    def wait_time(self, tokens: int = 1):
+        """
+        :return: Seconds until the next reset when the window is spent, 0 if it holds the requested tokens
+        """
+        if self.tokens >= tokens:
+            return 0
+        return (self.window(self.updated) + 1) * DAY + self.reset - self.updated
+
+
+class RateLimiter:
+    """
+    Client side rate limiter enforcing the per-minute and per-day limits of the API plan.
+    It is safe to share between threads, and worker processes using one API key can
+    coordinate through a shared state file.
+
+    When no per-minute limit is configured, it is learned from the rate-limit headers of the
+    responses. The remaining per-minute calls reported by the API are always taken into account.
+    """
+
+    def __init__(self, per_minute: int = None, per_day: int = None, state_file: str = None, day_reset: float = 0):
+
+        """
+
+        :param per_minute: The number of requests allowed per minute.
+        :param per_day: The number of requests allowed per day, until the daily reset of the quota.
+        :param state_file: (optional) Path of a file holding the bucket state shared by every
+        process using it. Requires a POSIX platform.
+        :param day_reset: The seconds after midnight UTC at which the daily quota resets.
+
+        """
+
+        if state_file is not None and fcntl is None:
+            raise OSError("A shared rate-limit state file requires a POSIX platform.")
+        self._lock = threading.Lock()
+        self._state_file = state_file
+        self._learn_per_minute = per_minute is None
+        self._buckets = {}
+        if per_minute:
+            self._buckets["minute"] = TokenBucket(per_minute, MINUTE)
+        if per_day:
+            self._buckets["day"] = DailyWindow(per_day, day_reset)
+        self.acquired = 0
+        self.waits = 0
+        self.timeouts = 0
+
+    @property
+    def per_minute(self):
+        bucket = self._buckets.get("minute")
+        return None if bucket is None else bucket.capacity
+
+    @property
+    def per_day(self):
+        bucket = self._buckets.get("day")
+        return None if bucket is None else bucket.capacity
+
+    def _try_acquire(self):
+        """
+        Take one token of every bucket, or none of them.
+
+        :return: 0 when acquired, else the seconds to wait before trying again
+        """
+        with self._lock, self._shared_state():
+            now = time.time()
+            wait = 0
+            for bucket in self._buckets.values():
+                bucket.refill(now)
+                wait = max(wait, bucket.wait_time())
+            if wait == 0:
+                for bucket in self._buckets.values():
+                    bucket.tokens -= 1
+                self.acquired += 1
+            return wait
+
+    def try_acquire(self):
+        """
+        Allow a request if possible, without waiting.
+
+        :return: 0 when the request is allowed, else the seconds to wait before trying again
+        """
+        return self._try_acquire()
+
+    def acquire(self, timeout: float = None):
+        """
+        Block until a request is allowed.
+
+        :param timeout: The maximum number of seconds to wait, None to wait as long as needed
+        :return: True if the request is allowed, False if the timeout elapsed first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._try_acquire()
+            if wait == 0:
+                return True
+            if not self._can_wait(deadline, wait):
+                return False
+            time.sleep(wait)
+
+    async def acquire_async(self, timeout: float = None):
+        """
+        Wait without blocking the event loop until a request is allowed.
+
+        :param timeout: The maximum number of seconds to wait, None to wait as long as needed
+        :return: True if the request is allowed, False if the timeout elapsed first
+        """
+        import asyncio
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._try_acquire()
+            if wait == 0:
+                return True
+            if not self._can_wait(deadline, wait):
+                return False
+            await asyncio.sleep(wait)
+
+    def _can_wait(self, deadline, wait):
+        if deadline is not None and time.monotonic() + wait > deadline:
+            with self._lock:
+                self.timeouts += 1
+            return False
+        with self._lock:
+            self.waits += 1
+        return True
+
+    def observe(self, headers):
+        """
+        Align the per-minute bucket with the rate-limit headers of a response.
+
+        :param headers: The response headers
+        """
+        limit = int_header(headers, LIMIT_MINUTE_HEADER)
+        remaining = int_header(headers, REMAINING_MINUTE_HEADER)
+        if limit is None and remaining is None:
+            return
+        with self._lock, self._shared_state():
+            bucket = self._buckets.get("minute")
+            if bucket is None:
+                if limit is None or not self._learn_per_minute:
+                    return
+                bucket = self._buckets["minute"] = TokenBucket(limit, MINUTE, updated=time.time())
+            elif limit is not None and self._learn_per_minute:
+                bucket.capacity = limit
+            if remaining is not None:
+                bucket.refill(time.time())
+                bucket.tokens = min(bucket.tokens, remaining)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "acquired": self.acquired,
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+                "per_minute": self.per_minute,
+                "per_day": self.per_day
+            }
+
+    def _shared_state(self):
+        if self._state_file is None:
+            return _NoState()
+        return _SharedState(self._state_file, self._buckets)
+
+
+class _NoState:
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class _SharedState:
+    """
+    Loads the bucket state from the shared file under an exclusive lock, and saves it back on exit.
+    """
+
+    def __init__(self, path: str, buckets: dict):
+        self._path = path
+        self._buckets = buckets
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self._path, "a+")
+        fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        self._file.seek(0)
+        content = self._file.read()
+        state = json.loads(content) if content else {}
+        for name, bucket in self._buckets.items():
+            if name in state:
+                bucket.tokens = min(state[name]["tokens"], bucket.capacity)
+                bucket.updated = state[name]["updated"]
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if exc_type is None:
+                state = {name: {"tokens": bucket.tokens, "updated": bucket.updated}
+                         for name, bucket in self._buckets.items()}
+                self._file.seek(0)
+                self._file.truncate()
+                self._file.write(json.dumps(state))
+                self._file.flush()
+        finally:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+        return False
@@ -0,0 +1,268 @@
+import contextlib
+import contextvars
+import itertools
+import threading
+import time
+
+from footballAPIClient.Exceptions.APILimitExceededError import APILimitExceededError
+
+# Priority classes, the most important first
+LIVE = "live"
+INTERACTIVE = "interactive"
+BACKFILL = "backfill"
+
+PRIORITIES = (LIVE, INTERACTIVE, BACKFILL)
+
+# Share of the daily quota reserved for each class: the classes below it stop when it is all that is left
+DEFAULT_FLOORS = {LIVE: 0.10, INTERACTIVE: 0.05}
+
+# The priority class and tenant of the calls of the current thread or task
+_priority = contextvars.ContextVar("footballAPI_priority", default=(None, None))
+
+
+@contextlib.contextmanager
+def priority(priority_class: str, tenant=None):
+    """
+    Set the priority class and tenant of the calls made inside the block, in this thread or task.
+    The threads and tasks started inside the block inherit them when they copy the context.
+
+    :param priority_class: LIVE, INTERACTIVE or BACKFILL
+    :param tenant: (optional) The hashable id of the tenant, sharing the requests of its class fairly with the others
+    """
+    if priority_class not in PRIORITIES:
+        raise ValueError(f"Unknown priority {priority_class!r}, expected one of: {', '.join(PRIORITIES)}")
+    token = _priority.set((priority_class, tenant))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority():
+    """
+    :return: The (priority class, tenant) set by ``priority`` for the current thread or task, (None, None) if unset
+    """
+    return _priority.get()
+
+
+class _Waiter:
+    __slots__ = ("rank", "tenant", "order")
+
+    def __init__(self, rank: int, tenant, order: int):
+        self.rank = rank
+        self.tenant = tenant
+        self.order = order
+
+
+class RequestScheduler:
+    """
+    Orders the billable calls of the clients sharing it by priority class, and keeps a floor of the
+    daily quota for the most important classes:
+
+    - a call waiting for the rate limiter is only let through when no call of a more important class waits,
+      and the tenants of a class take turns, in proportion to their weight;
+    - a call is deferred while the credits left are at or below the floors reserved for the classes above
+      it, e.g. with the default floors the backfill calls wait once 15% of the quota is left, the
+      interactive calls once 10% is left, and the live calls use the quota until the end.
+
+    Deferred calls wait until the quota is synced again after its daily reset, or until their timeout.
+    The class and tenant of a call are set with ``priority``, around the calls of a thread or task.
+
+    Usage::
+
+        scheduler = RequestScheduler(floors={"live": 500, "interactive": 200})
+        fp = FootballAPI("api-sports", api_key="YOUR_API_KEY", scheduler=scheduler)
+        with fp.priority("backfill", tenant="archive"):
+            fp.get_fixtures(league=39, season=2015)
+    """
+
+    def __init__(self,
+                 floors: dict = None,
+                 weights: dict = None,
+                 default_priority: str = INTERACTIVE,
+                 defer_timeout: float = None,
+                 recheck_interval: float = 60):
+
+        """
+
+        :param floors: (optional) The credits reserved for each class, as a number of credits or as a share of
+        the daily quota when below 1. DEFAULT_FLOORS by default.
+        :param weights: (optional) The weight of each tenant, 1 by default. A tenant of weight 2 gets twice the
+        requests of a tenant of weight 1 when both are waiting.
+        :param default_priority: The class of the calls made outside of ``priority``
+        :param defer_timeout: The maximum number of seconds a call is deferred for the floors before raising
+        APILimitExceededError, None to wait until the quota allows it
+        :param recheck_interval: The seconds between two checks of the quota by a deferred call
+
+        """
+
+        floors = dict(DEFAULT_FLOORS if floors is None else floors)
+        unknown = (set(floors) | {default_priority}) - set(PRIORITIES)
+        if unknown:
+            raise ValueError(f"Unknown priorities: {', '.join(sorted(unknown))}, expected: {', '.join(PRIORITIES)}")
+        self.floors = floors
+        self.weights = dict(weights or {})
+        self.default_priority = default_priority
+        self.defer_timeout = defer_timeout
+        self.recheck_interval = recheck_interval
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._waiting = []
+        self._order = itertools.count()
+        self._virtual_time = 0.0
+        self._tenant_time = {}
+        self.admitted = dict.fromkeys(PRIORITIES, 0)
+        self.deferred = dict.fromkeys(PRIORITIES, 0)
+        self.tenants = {}
+
+    def reserved(self, priority_class: str, max_credit: int):
+        """
+        :return: The credits a call of the class leaves to the more important classes
+        """
+        reserved = 0
+        for other in PRIORITIES[:PRIORITIES.index(priority_class)]:
+            floor = self.floors.get(other, 0)
+            reserved += floor * max_credit if isinstance(floor, float) and floor < 1 else floor
+        return reserved
+
+    def allowed(self, priority_class: str, credit):
+        """
+        :param priority_class: LIVE, INTERACTIVE or BACKFILL
+        :param credit: The CreditTracker of the client
+        :return: Whether the quota left allows a call of the class
+        """
+        if credit.available_credit is None or credit.max_credit is None:
+            return True
+        return credit.available_credit > self.reserved(priority_class, credit.max_credit)
+
+    def admit(self, credit, rate_limiter, timeout: float = None, refresh=None):
+        """
+        Block until the call of the current thread may be sent: its turn has come, the quota allows its
+        class, and the rate limiter allows a request.
+
+        :param credit: The CreditTracker of the client
+        :param rate_limiter: The RateLimiter of the client
+        :param timeout: The maximum number of seconds to wait for the rate limiter once the call is the next to go,
+        None to wait as long as needed. The time spent behind other calls is not counted.
+        :param refresh: (optional) A function syncing the quota, called while the call is deferred
+        :return: True when the call may be sent, False when the rate limiter timeout elapsed
+        :raise APILimitExceededError: When the call is deferred longer than defer_timeout
+        """
+        waiter, deferred_since, deadline = self._register(), None, None
+        refreshed = time.monotonic()
+        try:
+            while True:
+                wait, deferred_since, limited = self._step(waiter, credit, rate_limiter, deferred_since)
+                if wait == 0:
+                    return True
+                if deferred_since is not None:
+                    if refresh is not None and time.monotonic() - refreshed >= self.recheck_interval:
+                        refreshed = time.monotonic()
+                        refresh()
+                elif limited and timeout is not None:
+                    # the timeout runs from the first wait for the rate limiter, not while other calls go first
+                    if deadline is None:
+                        deadline = time.monotonic() + timeout
+                    if time.monotonic() + wait > deadline:
+                        return False
+                with self._changed:
+                    self._changed.wait(wait)
+        finally:
+            self._unregister(waiter)
+
+    async def admit_async(self, credit, rate_limiter, timeout: float = None, refresh=None):
+        """
+        Wait without blocking the event loop until the call of the current task may be sent.
+
+        :param credit: The CreditTracker of the client
+        :param rate_limiter: The RateLimiter of the client
+        :param timeout: The maximum number of seconds to wait for the rate limiter once the call is the next to go,
+        None to wait as long as needed. The time spent behind other calls is not counted.
+        :param refresh: (optional) A coroutine function syncing the quota, awaited while the call is deferred
+        :return: True when the call may be sent, False when the rate limiter timeout elapsed
+        :raise APILimitExceededError: When the call is deferred longer than defer_timeout
+        """
+        import asyncio
+
+        waiter, deferred_since, deadline = self._register(), None, None
+        refreshed = time.monotonic()
+        try:
+            while True:
+                wait, deferred_since, limited = self._step(waiter, credit, rate_limiter, deferred_since)
+                if wait == 0:
+                    return True
+                if deferred_since is not None:
+                    if refresh is not None and time.monotonic() - refreshed >= self.recheck_interval:
+                        refreshed = time.monotonic()
+                        await refresh()
+                elif limited and timeout is not None:
+                    # the timeout runs from the first wait for the rate limiter, not while other calls go first
+                    if deadline is None:
+                        deadline = time.monotonic() + timeout
+                    if time.monotonic() + wait > deadline:
+                        return False
+                # coroutines are not notified, they check again shortly
+                await asyncio.sleep(min(wait, 0.05))
+        finally:
+            self._unregister(waiter)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "admitted": dict(self.admitted),
+                "deferred": dict(self.deferred),
+                "waiting": len(self._waiting),
+                "tenants": dict(self.tenants)
+            }
+
+    def _register(self):
+        priority_class, tenant = _priority.get()
+        priority_class = priority_class or self.default_priority
+        with self._lock:
+            if all(waiter.tenant != tenant for waiter in self._waiting):
+                # an idle tenant starts from the current virtual time, it gets no credit for the time it was idle
+                self._tenant_time[tenant] = max(self._tenant_time.get(tenant, 0.0), self._virtual_time)
+            waiter = _Waiter(PRIORITIES.index(priority_class), tenant, next(self._order))
+            self._waiting.append(waiter)
+            return waiter
+
+    def _unregister(self, waiter: _Waiter):
+        with self._changed:
+            if waiter in self._waiting:
+                self._waiting.remove(waiter)
+            self._changed.notify_all()
+
+    def _step(self, waiter: _Waiter, credit, rate_limiter, deferred_since):
+        """
+        :return: The seconds to wait, 0 when the call is admitted, the time the call is deferred since, and
+        whether the wait is for the rate limiter
+        """
+        priority_class = PRIORITIES[waiter.rank]
+        with self._lock:
+            if not self.allowed(priority_class, credit):
+                now = time.monotonic()
+                if deferred_since is None:
+                    self.deferred[priority_class] += 1
+                    deferred_since = now
+                if self.defer_timeout is not None and now - deferred_since >= self.defer_timeout:
+                    raise APILimitExceededError(
+                        f"{priority_class} call deferred for {self.defer_timeout} second(s): the "
+                        f"{credit.available_credit} credit(s) left are reserved for the more important calls.")
+                return min(self.recheck_interval, 1.0), deferred_since, False
+            head = min((other for other in self._waiting if self.allowed(PRIORITIES[other.rank], credit)),
+                       key=self._turn)
+            if head is not waiter:
+                return 0.05, None, False
+            wait = rate_limiter.try_acquire()
+            if wait:
+                return wait, None, True
+            self._waiting.remove(waiter)
+            self._virtual_time = self._tenant_time.get(waiter.tenant, 0.0)
+            self._tenant_time[waiter.tenant] = self._virtual_time + 1.0 / self.weights.get(waiter.tenant, 1)
+            self.admitted[priority_class] += 1
+            self.tenants[waiter.tenant] = self.tenants.get(waiter.tenant, 0) + 1
+            self._changed.notify_all()
+            return 0, None, False
+
+    def _turn(self, waiter: _Waiter):
+        return waiter.rank, self._tenant_time.get(waiter.tenant, 0.0), waiter.order
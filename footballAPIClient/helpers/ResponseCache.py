@@ -0,0 +1,204 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# Default time to live (seconds) of the responses of each endpoint.
+# Endpoints not listed here are not cached unless a ttl is configured for them.
+DEFAULT_TTLS = {
+    "countries": 7 * DAY,
+    "timezone": 7 * DAY,
+    "leagues/seasons": DAY,
+    "teams/countries": DAY,
+    "teams/seasons": DAY,
+    "venues": DAY,
+    "fixtures/rounds": HOUR,
+}
+
+LIVE_FIXTURES_TTL = 15
+PAST_SEASON_TTL = 30 * DAY
+
+
+class ResponseCache:
+    """
+    Size bounded LRU cache of API responses, keyed on the endpoint path and its query parameters.
+    Cached responses are shared between callers and must not be modified.
+
+    An optional persistent backend (e.g. SqliteCache) is used as a second tier: misses in memory
+    are looked up in the backend and every stored response is written through to it.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttls: dict = None, default_ttl: float = 0, backend=None):
+
+        """
+
+        :param maxsize: The maximum number of responses kept, the least recently used is evicted first.
+        :param ttls: (optional) Time to live in seconds per endpoint path, merged over DEFAULT_TTLS.
+        A ttl of 0 disables caching for that endpoint.
+        :param default_ttl: Time to live of the endpoints without a configured ttl.
+        :param backend: (optional) A persistent backend shared across restarts and processes.
+
+        """
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._maxsize = maxsize
+        self._ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self._ttls.update(ttls)
+        self._default_ttl = default_ttl
+        self._backend = backend
+        self.hits = 0
+        self.backend_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(path: str, params: dict):
+        return path, tuple(sorted((k, str(v)) for k, v in params.items()))
+
+    def ttl_for(self, path: str, params: dict):
+        """
+        Get the time to live of a response.
+
+        :param path: The endpoint path
+        :param params: The query parameters of the request
+        :return: The ttl in seconds, 0 when the response must not be cached
+        """
+        if path == "fixtures" and "live" in params:
+            return self._ttls.get("fixtures?live", LIVE_FIXTURES_TTL)
+        if path == "fixtures/rounds" and params.get("season") is not None \
+                and int(params["season"]) < datetime.now(timezone.utc).year - 1:
+            return self._ttls.get("fixtures/rounds?past", PAST_SEASON_TTL)
+        return self._ttls.get(path, self._default_ttl)
+
+    @property
+    def backend(self):
+        return self._backend
+
+    def get(self, key):
+        """
+        Get a fresh response.
+
+        :param key: The cache key
+        :return: The cached response, or None when missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+        if self._backend is not None:
+            stored = self._backend.get(key)
+            if stored is not None:
+                with self._lock:
+                    self._store(key, stored)
+                    if stored[1] > time.time():
+                        self.backend_hits += 1
+                        return stored[0]
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def get_stale(self, key):
+        """
+        Get an expired response along with the validators needed to revalidate it.
+
+        :param key: The cache key
+        :return: A (value, validators) tuple, or None when no revalidation is possible
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None and self._backend is not None:
+            entry = self._backend.get(key)
+        if entry is None or not entry[2]:
+            return None
+        return entry[0], entry[2]
+
+    def set(self, key, value, ttl: float, validators: dict = None):
+        if ttl <= 0:
+            return
+        entry = (value, time.time() + ttl, validators or {})
+        with self._lock:
+            self._store(key, entry)
+        if self._backend is not None:
+            self._backend.set(key, value, ttl, validators)
+
+    def refresh(self, key, ttl: float):
+        """
+        Extend the lifetime of a response the server reported as not modified.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._store(key, (entry[0], time.time() + ttl, entry[2]))
+        if self._backend is not None:
+            self._backend.refresh(key, ttl)
+
+    def _store(self, key, entry):
+        if self._maxsize <= 0:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        if self._backend is not None:
+            self._backend.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "backend_hits": self.backend_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self._maxsize
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def response_validators(headers):
+    """
+    Extract the ETag/Last-Modified validators of a response.
+
+    :param headers: The response headers
+    :return: A dict of the validators found
+    """
+    validators = {}
+    if headers is None:
+        return validators
+    if headers.get("ETag"):
+        validators["etag"] = headers.get("ETag")
+    if headers.get("Last-Modified"):
+        validators["last_modified"] = headers.get("Last-Modified")
+    return validators
+
+
+def conditional_headers(validators):
+    """
+    Build the request headers revalidating a stored response.
+
+    :param validators: The validators returned by response_validators
+    :return: A dict of conditional request headers
+    """
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
@@ -0,0 +1,139 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed request is sent again and how long to wait before doing so.
+    Delays grow exponentially with full jitter, a Retry-After header sent by the API takes
+    precedence, and no retry is scheduled past the deadline of the call. A call asked to wait longer
+    than ``max_retry_after`` is not retried.
+    """
+
+    def __init__(self,
+                 max_attempts: int = 3,
+                 backoff_base: float = 0.5,
+                 backoff_max: float = 30,
+                 jitter: bool = True,
+                 retry_statuses=frozenset({429, 500, 502, 503, 504}),
+                 retry_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+                 respect_retry_after: bool = True,
+                 deadline: float = None,
+                 max_retry_after: float = None
+                 ):
+
+        """
+
+        :param max_attempts: The maximum number of attempts of a call, 1 disables retries.
+        :param backoff_base: The delay in seconds before the first retry, doubled on each retry.
+        :param backoff_max: The maximum delay in seconds between two attempts.
+        :param jitter: Pick a random delay between 0 and the backoff, spreading the retries of
+        concurrent callers.
+        :param retry_statuses: The HTTP status codes worth retrying.
+        :param retry_methods: The idempotent HTTP methods which can be retried.
+        :param respect_retry_after: Wait for the delay of the Retry-After header when present.
+        :param deadline: (optional) The maximum number of seconds a call may take, retries included.
+        :param max_retry_after: The longest Retry-After delay waited for, backoff_max by default. The calls
+        asked to wait longer give up with the response received.
+
+        """
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.respect_retry_after = respect_retry_after
+        self.deadline = deadline
+        self.max_retry_after = backoff_max if max_retry_after is None else max_retry_after
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.retried_statuses = 0
+        self.retried_errors = 0
+        self.give_ups = 0
+
+    def start(self):
+        """
+        :return: The monotonic deadline of a call starting now, or None
+        """
+        return None if self.deadline is None else time.monotonic() + self.deadline
+
+    def is_retryable_status(self, status_code: int):
+        return status_code in self.retry_statuses
+
+    def next_delay(self, method: str, attempt: int, deadline: float = None, headers=None, error: bool = False):
+        """
+        Get the delay before the next attempt of a failed call.
+
+        :param method: The HTTP method of the call
+        :param attempt: The number of attempts already made
+        :param deadline: The monotonic deadline returned by start()
+        :param headers: The headers of the failed response, if any
+        :param error: True when the attempt failed with a network error
+        :return: The delay in seconds, or None when the call must not be retried
+        """
+        if method.upper() not in self.retry_methods or attempt >= self.max_attempts:
+            return self._give_up()
+
+        delay = None
+        if self.respect_retry_after and headers is not None:
+            delay = parse_retry_after(headers.get("Retry-After"))
+            if delay is not None and delay > self.max_retry_after:
+                return self._give_up()
+        if delay is None:
+            delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+            if self.jitter:
+                delay = random.uniform(0, delay)
+
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            return self._give_up()
+
+        with self._lock:
+            self.retries += 1
+            if error:
+                self.retried_errors += 1
+            else:
+                self.retried_statuses += 1
+        return delay
+
+    def _give_up(self):
+        with self._lock:
+            self.give_ups += 1
+        return None
+
+    def stats(self):
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "retried_statuses": self.retried_statuses,
+                "retried_errors": self.retried_errors,
+                "give_ups": self.give_ups
+            }
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header given in seconds or as an HTTP date.
+
+    :param value: The header value
+    :return: The delay in seconds, or None when missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
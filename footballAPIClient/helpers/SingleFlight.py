@@ -0,0 +1,104 @@
+import threading
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls: while a call for a key is in flight, other callers
+    with the same key wait for it and share its result (or its exception) instead of sending
+    their own request. Works for threads and for coroutines of an event loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._async_calls = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        """
+        Run ``fn`` unless a call for the same key is already in flight in another thread.
+
+        :param key: The hashable key identifying the call
+        :param fn: The function to call
+        :return: The result of the call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key, coroutine_fn):
+        """
+        Await ``coroutine_fn()`` unless a call for the same key is already in flight on this event loop.
+
+        :param key: The hashable key identifying the call
+        :param coroutine_fn: The coroutine function to await
+        :return: The result of the call
+        """
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        loop_key = (id(loop), key)
+        future = self._async_calls.get(loop_key)
+        if future is not None:
+            with self._lock:
+                self.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = self._async_calls[loop_key] = loop.create_future()
+        with self._lock:
+            self.leaders += 1
+        try:
+            result = await coroutine_fn()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # mark the exception as retrieved when no other caller waited for it
+            future.exception()
+            raise
+        finally:
+            del self._async_calls[loop_key]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls) + len(self._async_calls)
+            }
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
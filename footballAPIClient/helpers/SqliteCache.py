@@ -0,0 +1,113 @@
+import json
+import sqlite3
+import threading
+import time
+import zlib
+
+
+class SqliteCache:
+    """
+    Persistent cache backend storing compressed API responses in a SQLite database.
+    The database runs in WAL mode, so several processes on one host can share the same file
+    and a restarted worker starts with the responses fetched before.
+    """
+
+    def __init__(self, path: str, compress_level: int = 6, busy_timeout: float = 30):
+
+        """
+
+        :param path: The path of the database file, created if missing.
+        :param compress_level: The zlib compression level of the stored payloads.
+        :param busy_timeout: Seconds to wait for a lock held by another process.
+
+        """
+
+        self._path = path
+        self._compress_level = compress_level
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=busy_timeout, check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " payload BLOB NOT NULL,"
+            " expires REAL NOT NULL,"
+            " etag TEXT,"
+            " last_modified TEXT)"
+        )
+
+    @property
+    def path(self):
+        return self._path
+
+    @staticmethod
+    def _encode_key(key):
+        return json.dumps(key, separators=(",", ":"))
+
+    def get(self, key):
+        """
+        Get a stored response, fresh or expired.
+
+        :param key: The cache key
+        :return: A (value, expires, validators) tuple where expires is a unix timestamp, or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, expires, etag, last_modified FROM responses WHERE key = ?",
+                (self._encode_key(key),)
+            ).fetchone()
+        if row is None:
+            return None
+        payload, expires, etag, last_modified = row
+        value = json.loads(zlib.decompress(payload))
+        return value, expires, _validators(etag, last_modified)
+
+    def set(self, key, value, ttl: float, validators: dict = None):
+        validators = validators or {}
+        payload = zlib.compress(json.dumps(value, separators=(",", ":"), default=_to_json).encode("utf-8"), self._compress_level)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, payload, expires, etag, last_modified)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (self._encode_key(key), payload, time.time() + ttl,
+                 validators.get("etag"), validators.get("last_modified"))
+            )
+
+    def refresh(self, key, ttl: float):
+        with self._lock:
+            self._conn.execute("UPDATE responses SET expires = ? WHERE key = ?",
+                               (time.time() + ttl, self._encode_key(key)))
+
+    def purge_expired(self):
+        """
+        Delete the expired responses which cannot be revalidated.
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE expires <= ? AND etag IS NULL AND last_modified IS NULL",
+                               (time.time(),))
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _validators(etag, last_modified):
+    validators = {}
+    if etag:
+        validators["etag"] = etag
+    if last_modified:
+        validators["last_modified"] = last_modified
+    return validators
+
+
+def _to_json(value):
+    # response models (see responseModels) are stored as the JSON they were built from
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,231 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from footballAPIClient._constants import FINISHED_STATUSES
+from footballAPIClient._constants import STOPPED_STATUSES
+from footballAPIClient.helpers.FixtureDetails import FIXTURE_DETAILS, detail_response
+
+# The client of a worker process, created by _init_worker
+_client = None
+
+
+class JsonLinesSink:
+    """
+    Sink writing the responses of each endpoint and shard to ``<directory>/<endpoint>/<league>-<season>.jsonl``,
+    one response per line. A shard written again replaces its files.
+    """
+
+    def __init__(self, directory: str):
+
+        """
+
+        :param directory: The directory of the files, created when needed
+
+        """
+
+        self.directory = directory
+
+    def write(self, path: str, responses, league: int = None, season: int = None):
+        directory = os.path.join(self.directory, path.replace("/", "_"))
+        os.makedirs(directory, exist_ok=True)
+        if isinstance(responses, dict) or hasattr(responses, "to_dict"):
+            responses = (responses,)
+        name = os.path.join(directory, f"{league}-{season}.jsonl")
+        with open(name + ".tmp", "w") as file:
+            for response in responses:
+                file.write(json.dumps(response.to_dict() if hasattr(response, "to_dict") else response))
+                file.write("\n")
+        os.replace(name + ".tmp", name)
+
+
+class IngestionRunner:
+    """
+    Mirrors leagues and seasons with a pool of worker processes. Each shard, a league and season, is
+    ingested by one worker: the teams, the fixtures, then the events, lineups, statistics and player
+    statistics of the finished fixtures, fetched 20 fixtures per request through the ids parameter.
+    The decoding and the writes to the sink happen in the workers, so they use every core.
+
+    The workers share one RateLimiter state file, so the per-minute limit and the optional credit
+    budget hold for the whole run. The state file is locked with fcntl, so the runner is POSIX-only.
+
+    Every ingested shard is recorded in a checkpoint file. A run started again skips the complete shards,
+    those whose fixtures are all over, and ingests the others again, e.g. the current seasons.
+
+    The sink is any picklable object with a ``write(path, responses, league=..., season=...)`` method,
+    such as a Dataset or a JsonLinesSink.
+
+    Usage::
+
+        runner = IngestionRunner("api-sports", api_key="YOUR_API_KEY", sink=Dataset("mirror"),
+                                 checkpoint="mirror/checkpoint.jsonl", per_minute=300, budget=20000)
+        for result in runner.run([(39, season) for season in range(2010, 2024)]):
+            print(result)
+    """
+
+    def __init__(self,
+                 account_type: str,
+                 sink,
+                 checkpoint: str,
+                 api_key: str = None,
+                 max_workers: int = None,
+                 per_minute: int = None,
+                 budget: int = None,
+                 details: bool = True,
+                 client_options: dict = None):
+
+        """
+
+        :param account_type: The account type of the clients of the workers: rapid-api or api-sports
+        :param sink: The object the responses are written to, in the workers
+        :param checkpoint: The path of the file recording the ingested shards. The rate-limit state shared
+        by the workers is kept next to it.
+        :param api_key: (optional) The API key, the API_KEY environment variable by default
+        :param max_workers: The number of worker processes, the number of cores by default
+        :param per_minute: (optional) The requests allowed per minute to the whole pool,
+        learned from the responses by default
+        :param budget: (optional) The requests allowed per day to the whole pool, across restarts
+        :param details: Whether the events, lineups and statistics of the finished fixtures are ingested
+        :param client_options: (optional) Other arguments of the FootballAPI clients of the workers
+
+        """
+
+        self.account_type = account_type
+        self.api_key = api_key
+        self.sink = sink
+        self.checkpoint = checkpoint
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.per_minute = per_minute
+        self.budget = budget
+        self.details = details
+        self.client_options = dict(client_options or {})
+
+    @property
+    def rate_limit_state(self):
+        return self.checkpoint + ".ratelimit"
+
+    def completed(self):
+        """
+        :return: The set of the complete (league, season) recorded in the checkpoint file
+        """
+        completed = set()
+        try:
+            with open(self.checkpoint) as file:
+                for line in file:
+                    if line.strip():
+                        entry = json.loads(line)
+                        if entry.get("complete", True):
+                            completed.add((entry["league"], entry["season"]))
+        except FileNotFoundError:
+            pass
+        return completed
+
+    def run(self, shards):
+        """
+        Ingest the shards not completed yet, yielding the result of each one as it completes: a dict holding
+        the league, the season, the number of teams, fixtures and requests, whether every fixture is over,
+        and the error of a failed shard. The failed shards are not recorded, and the shards with fixtures
+        still to be played are ingested again by the next run.
+
+        :param shards: An iterable of (league, season)
+        :return: A generator of the results
+        """
+        completed = self.completed()
+        pending = list(dict.fromkeys((int(league), int(season)) for league, season in shards
+                                     if (int(league), int(season)) not in completed))
+        if not pending:
+            return
+        directory = os.path.dirname(os.path.abspath(self.checkpoint))
+        os.makedirs(directory, exist_ok=True)
+        settings = (self.account_type, self.api_key, self.client_options,
+                    self.per_minute, self.budget, self.rate_limit_state)
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(pending)),
+                                 initializer=_init_worker, initargs=settings) as executor:
+            futures = {executor.submit(_ingest_shard, league, season, self.sink, self.details): (league, season)
+                       for league, season in pending}
+            for future in as_completed(futures):
+                league, season = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    yield {"league": league, "season": season, "error": repr(e)}
+                    continue
+                with open(self.checkpoint, "a") as file:
+                    file.write(json.dumps(result) + "\n")
+                yield result
+
+
+def shards_from_leagues(leagues, current: bool = False):
+    """
+    Get the shards of the leagues of a response of the leagues endpoint.
+
+    :param leagues: A response of the leagues endpoint
+    :param current: Whether only the current season of each league is taken
+    :return: The list of the (league, season)
+    """
+    if hasattr(leagues, "to_dict"):
+        leagues = leagues.to_dict()
+    return [(item["league"]["id"], season["year"])
+            for item in leagues.get("response") or ()
+            for season in item.get("seasons") or ()
+            if not current or season.get("current")]
+
+
+def _init_worker(account_type, api_key, client_options, per_minute, budget, rate_limit_state):
+    global _client
+    from footballAPIClient.footballAPI import FootballAPI
+    from footballAPIClient.helpers.RateLimiter import RateLimiter
+
+    rate_limiter = RateLimiter(per_minute=per_minute, per_day=budget, state_file=rate_limit_state)
+    _client = FootballAPI(account_type, api_key=api_key, rate_limiter=rate_limiter, lazy=True,
+                          **client_options)
+
+
+def _ingest_shard(league: int, season: int, sink, details: bool):
+    """
+    Ingest a league and season with the client of the worker process.
+
+    :return: The result of the shard
+    """
+    client = _client
+    started = time.time()
+    acquired = client.rate_limiter.acquired
+    teams = client.get_teams_information(league=league, season=season)
+    sink.write("teams", teams, league=league, season=season)
+    fixtures = client.get_fixtures(league=league, season=season)
+    sink.write("fixtures", fixtures, league=league, season=season)
+    if hasattr(fixtures, "to_dict"):
+        fixtures = fixtures.to_dict()
+    statuses = [item["fixture"]["status"]["short"] for item in fixtures.get("response") or ()]
+    finished = [item["fixture"]["id"] for item in fixtures.get("response") or ()
+                if item["fixture"]["status"]["short"] in FINISHED_STATUSES]
+    if details and finished:
+        items = client.get_fixtures_bulk(finished)
+        for key, path in FIXTURE_DETAILS:
+            sink.write(path, [detail_response(path, fixture_id, item, key)
+                              for fixture_id, item in items.items() if key in item],
+                       league=league, season=season)
+    return {
+        "league": league,
+        "season": season,
+        "teams": len(_response_items(teams)),
+        "fixtures": len(fixtures.get("response") or ()),
+        "detailed": len(finished) if details else 0,
+        "complete": bool(statuses) and all(_over(status) for status in statuses),
+        "requests": client.rate_limiter.acquired - acquired,
+        "seconds": round(time.time() - started, 3),
+        "pid": os.getpid(),
+    }
+
+
+def _over(status: str):
+    # the postponed fixtures are played later, the other stopped ones stay as they are
+    return status in FINISHED_STATUSES or status in STOPPED_STATUSES and status != "PST"
+
+
+def _response_items(response):
+    if hasattr(response, "to_dict"):
+        response = response.to_dict()
+    return response.get("response") or ()
+
@@ -0,0 +1,496 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections import Counter
+
+from footballAPIClient.Exceptions.InternalApiException import InternalApiException
+from footballAPIClient.helpers.FixtureDetails import chunk_fixture_ids
+
+# Delta kinds
+GOAL = "goal"
+CARD = "card"
+SUBSTITUTION = "substitution"
+VAR = "var"
+STATUS = "status"
+SCORE = "score"
+STAT = "stat"
+
+# Delta kind of each event type of the fixtures/events endpoint
+_EVENT_KINDS = {"goal": GOAL, "card": CARD, "subst": SUBSTITUTION, "var": VAR}
+
+_logger = logging.getLogger(__name__)
+
+
+class Delta:
+    """
+    A change of a live fixture: a new (or removed) event, a status or score change, or a statistic change.
+    """
+
+    __slots__ = ("kind", "fixture", "minute", "data", "removed")
+
+    def __init__(self, kind: str, fixture: int, minute=None, data=None, removed: bool = False):
+
+        """
+
+        :param kind: GOAL, CARD, SUBSTITUTION, VAR, STATUS, SCORE or STAT
+        :param fixture: The id of the fixture
+        :param minute: The elapsed minutes of the fixture, or of the event
+        :param data: The event item for the events, and the value and previous value for the other kinds
+        :param removed: True when the event was removed by the API, e.g. a goal cancelled after review
+
+        """
+
+        self.kind = kind
+        self.fixture = fixture
+        self.minute = minute
+        self.data = data if data is not None else {}
+        self.removed = removed
+
+    def to_dict(self):
+        return {"kind": self.kind, "fixture": self.fixture, "minute": self.minute, "data": self.data,
+                "removed": self.removed}
+
+    def __eq__(self, other):
+        if not isinstance(other, Delta):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        removed = ", removed=True" if self.removed else ""
+        return f"Delta({self.kind!r}, fixture={self.fixture}, minute={self.minute}, data={self.data!r}{removed})"
+
+
+class FixtureDiffer:
+    """
+    Keeps the last snapshot of each fixture, and returns the Delta between it and a new payload.
+    The snapshot only holds what is compared: the status, the score, the keys of the events and the statistics.
+    """
+
+    def __init__(self, initial: bool = True):
+
+        """
+
+        :param initial: Whether the state of a fixture seen for the first time is returned as deltas
+        (its status, score, events and statistics), or only recorded
+
+        """
+
+        self.initial = initial
+        self._status = {}
+        self._score = {}
+        self._events = {}
+        self._statistics = {}
+
+    @property
+    def fixtures(self):
+        return set(self._status)
+
+    def fixture(self, item: dict):
+        """
+        :param item: An item of the fixtures endpoint
+        :return: The list of the STATUS and SCORE deltas
+        """
+        fixture = item.get("fixture") or {}
+        fixture_id = fixture.get("id")
+        status = fixture.get("status") or {}
+        goals = item.get("goals") or {}
+        minute = status.get("elapsed")
+        score = (goals.get("home"), goals.get("away"))
+        new = fixture_id not in self._status
+        emit = self.initial or not new
+        deltas = []
+        previous = self._status.get(fixture_id)
+        if status.get("short") != previous:
+            self._status[fixture_id] = status.get("short")
+            if emit:
+                deltas.append(Delta(STATUS, fixture_id, minute, {
+                    "status": status.get("short"), "long": status.get("long"), "previous": previous}))
+        previous = self._score.get(fixture_id)
+        if score != previous and (previous is not None or score != (None, None)):
+            self._score[fixture_id] = score
+            if emit:
+                deltas.append(Delta(SCORE, fixture_id, minute, {
+                    "home": score[0], "away": score[1],
+                    "previous": {"home": previous[0], "away": previous[1]} if previous else None}))
+        return deltas
+
+    def events(self, fixture_id: int, items):
+        """
+        :param fixture_id: The id of the fixture
+        :param items: The items of the fixtures/events endpoint, or the events of a fixtures item
+        :return: The list of the deltas of the new and removed events
+        """
+        keys = Counter()
+        by_key = {}
+        for item in items or ():
+            key = _event_key(item)
+            keys[key] += 1
+            by_key.setdefault(key, []).append(item)
+        previous = self._events.get(fixture_id)
+        self._events[fixture_id] = (keys, by_key)
+        if previous is None and not self.initial:
+            return []
+        previous_keys, previous_items = previous or (Counter(), {})
+        deltas = []
+        for key, count in (previous_keys - keys).items():
+            deltas.extend(_event_delta(fixture_id, item, removed=True) for item in previous_items[key][-count:])
+        for key, count in (keys - previous_keys).items():
+            deltas.extend(_event_delta(fixture_id, item) for item in by_key[key][-count:])
+        deltas.sort(key=lambda delta: (delta.minute or 0, (delta.data.get("time") or {}).get("extra") or 0))
+        return deltas
+
+    def statistics(self, fixture_id: int, items, minute=None):
+        """
+        :param fixture_id: The id of the fixture
+        :param items: The items of the fixtures/statistics endpoint, or the statistics of a fixtures item
+        :param minute: (optional) The elapsed minutes of the fixture
+        :return: The list of the STAT deltas, one per changed statistic of a team
+        """
+        values = {}
+        for item in items or ():
+            team = (item.get("team") or {}).get("id")
+            for statistic in item.get("statistics") or ():
+                values[team, statistic.get("type")] = statistic.get("value")
+        previous = self._statistics.get(fixture_id)
+        self._statistics[fixture_id] = values
+        if previous is None and not self.initial:
+            return []
+        previous = previous or {}
+        return [Delta(STAT, fixture_id, minute, {"team": team, "type": type_, "value": value,
+                                                 "previous": previous.get((team, type_))})
+                for (team, type_), value in values.items() if previous.get((team, type_)) != value]
+
+    def forget(self, fixture_id: int):
+        for snapshots in (self._status, self._score, self._events, self._statistics):
+            snapshots.pop(fixture_id, None)
+
+    def clear(self):
+        for snapshots in (self._status, self._score, self._events, self._statistics):
+            snapshots.clear()
+
+
+class _Publisher:
+    """
+    Delivers the deltas to the subscribers: callbacks, queues and asynchronous iterators.
+    """
+
+    def __init__(self):
+        self._subscribers = []
+        self._subscribers_lock = threading.Lock()
+
+    def subscribe(self, callback):
+        """
+        :param callback: A function called with each Delta, in the thread polling the API
+        :return: A function removing the subscription
+        """
+        with self._subscribers_lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe():
+            with self._subscribers_lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def queue(self, maxsize: int = 0):
+        """
+        :param maxsize: The maximum number of deltas waiting in the queue, 0 for no limit. When the queue is
+        full, the oldest delta is dropped.
+        :return: A queue.Queue receiving the deltas
+        """
+        deltas = queue.Queue(maxsize)
+
+        def put(delta):
+            while True:
+                try:
+                    deltas.put_nowait(delta)
+                    return
+                except queue.Full:
+                    try:
+                        deltas.get_nowait()
+                    except queue.Empty:
+                        pass
+
+        self.subscribe(put)
+        return deltas
+
+    async def deltas(self):
+        """
+        Asynchronous iterator over the deltas, to be used with ``async for`` inside the running event loop.
+        The subscription ends when the iteration stops.
+        """
+        loop = asyncio.get_running_loop()
+        deltas = asyncio.Queue()
+        unsubscribe = self.subscribe(lambda delta: loop.call_soon_threadsafe(deltas.put_nowait, delta))
+        try:
+            while True:
+                yield await deltas.get()
+        finally:
+            unsubscribe()
+
+    def _publish(self, deltas):
+        with self._subscribers_lock:
+            subscribers = list(self._subscribers)
+        for delta in deltas:
+            for callback in subscribers:
+                try:
+                    callback(delta)
+                except Exception:
+                    _logger.exception("Live feed subscriber %r failed", callback)
+
+
+class _LiveFeedBase(_Publisher):
+
+    def __init__(self, client, live: str = "all", interval: float = 15, events: bool = True,
+                 statistics_interval: float = 60, initial: bool = True):
+        super().__init__()
+        self._client = client
+        self.live = live
+        self.interval = interval
+        self.events = events
+        self.statistics_interval = statistics_interval
+        self.differ = FixtureDiffer(initial=initial)
+        self._statistics_polled = {}
+        self._live = set()
+
+    def _update(self, data):
+        """
+        :param data: The response of the live fixtures
+        :return: The deltas of the fixtures, the ids of the fixtures whose events must be fetched, and the ids
+        and minutes of the fixtures whose statistics must be fetched
+        """
+        data = _to_dict(data)
+        if data.get("errors"):
+            raise InternalApiException(data["errors"])
+        deltas, events, statistics = [], [], []
+        now = time.monotonic()
+        for item in data.get("response") or ():
+            fixture_id = item["fixture"]["id"]
+            deltas.extend(self.differ.fixture(item))
+            if "events" in item:
+                deltas.extend(self.differ.events(fixture_id, item["events"]))
+            elif self.events:
+                events.append(fixture_id)
+            if self.statistics_interval is not None and \
+                    now - self._statistics_polled.get(fixture_id, -self.statistics_interval) >= self.statistics_interval:
+                self._statistics_polled[fixture_id] = now
+                statistics.append((fixture_id, _minute(item)))
+        self._live = {item["fixture"]["id"] for item in data.get("response") or ()}
+        return deltas, events, statistics
+
+    def _finished(self):
+        """
+        :return: The groups of the ids of the fixtures which left the live fixtures
+        """
+        return chunk_fixture_ids(sorted(self.differ.fixtures - self._live))
+
+    def _finish(self, data, ids: str):
+        """
+        :return: The last deltas of fixtures which left the live fixtures, whose snapshots are then dropped
+        """
+        deltas = []
+        for item in _to_dict(data).get("response") or ():
+            fixture_id = item["fixture"]["id"]
+            deltas.extend(self.differ.fixture(item))
+            if "events" in item:
+                deltas.extend(self.differ.events(fixture_id, item["events"]))
+            if "statistics" in item:
+                deltas.extend(self.differ.statistics(fixture_id, item["statistics"], _minute(item)))
+        for fixture_id in ids.split("-"):
+            self.differ.forget(int(fixture_id))
+            self._statistics_polled.pop(int(fixture_id), None)
+        return deltas
+
+
+class LiveFeed(_LiveFeedBase):
+    """
+    Polls the live fixtures and emits only what changed since the previous poll, as Delta objects:
+    the new goals, cards, substitutions and VAR decisions, and the status, score and statistic changes.
+
+    Each poll costs one request for the live fixtures, whose items already hold their events, plus one
+    request per live fixture every ``statistics_interval`` seconds for the statistics, and one request
+    per 20 fixtures which just left the live fixtures, for their final state.
+
+    Usage::
+
+        feed = LiveFeed(fp, interval=15)
+        feed.subscribe(print)
+        deltas = feed.queue()
+        feed.start()
+        ...
+        feed.stop()
+    """
+
+    def __init__(self, client, live: str = "all", interval: float = 15, events: bool = True,
+                 statistics_interval: float = 60, initial: bool = True):
+
+        """
+
+        :param client: The FootballAPI client
+        :param live: "all" or the ids of the followed leagues. Value: "id-id"
+        :param interval: The number of seconds between two polls
+        :param events: Whether the events are fetched from fixtures/events when the fixtures items have none
+        :param statistics_interval: The number of seconds between two polls of the statistics of a fixture,
+        None to never poll them
+        :param initial: Whether the state of a fixture seen for the first time is emitted, or only recorded
+
+        """
+
+        super().__init__(client, live=live, interval=interval, events=events,
+                         statistics_interval=statistics_interval, initial=initial)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def poll(self):
+        """
+        Poll the API once, and deliver the deltas to the subscribers.
+
+        :return: The list of the deltas
+        """
+        client = self._client
+        deltas, events, statistics = self._update(client.get_fixtures(live=self.live))
+        for fixture_id in events:
+            deltas.extend(self.differ.events(fixture_id, _items(client.get_fixture_events(fixture=fixture_id))))
+        for fixture_id, minute in statistics:
+            deltas.extend(self.differ.statistics(
+                fixture_id, _items(client.get_fixture_statistics(fixture=fixture_id)), minute))
+        for ids in self._finished():
+            deltas.extend(self._finish(client.get_fixtures(ids=ids), ids))
+        self._publish(deltas)
+        return deltas
+
+    def run(self):
+        """
+        Poll the API every ``interval`` seconds until ``stop`` is called. A failed poll is logged and retried
+        at the next interval.
+        """
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self.poll()
+            except Exception:
+                _logger.exception("Live feed poll failed")
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def start(self):
+        """
+        Run the polling loop in a background thread.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="LiveFeed", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+class AsyncLiveFeed(_LiveFeedBase):
+    """
+    LiveFeed of the AsyncFootballAPI client. The per fixture requests of a poll are sent concurrently.
+
+    Usage::
+
+        feed = AsyncLiveFeed(client, interval=15)
+        task = asyncio.ensure_future(feed.run())
+        async for delta in feed.deltas():
+            ...
+    """
+
+    def __init__(self, client, live: str = "all", interval: float = 15, events: bool = True,
+                 statistics_interval: float = 60, initial: bool = True):
+
+        """
+
+        :param client: The AsyncFootballAPI client
+        :param live: "all" or the ids of the followed leagues. Value: "id-id"
+        :param interval: The number of seconds between two polls
+        :param events: Whether the events are fetched from fixtures/events when the fixtures items have none
+        :param statistics_interval: The number of seconds between two polls of the statistics of a fixture,
+        None to never poll them
+        :param initial: Whether the state of a fixture seen for the first time is emitted, or only recorded
+
+        """
+
+        super().__init__(client, live=live, interval=interval, events=events,
+                         statistics_interval=statistics_interval, initial=initial)
+        self._running = False
+
+    async def poll(self):
+        """
+        Poll the API once, and deliver the deltas to the subscribers.
+
+        :return: The list of the deltas
+        """
+        client = self._client
+        deltas, events, statistics = self._update(await client.get_fixtures(live=self.live))
+        responses = await asyncio.gather(
+            *(client.get_fixture_events(fixture=fixture_id) for fixture_id in events),
+            *(client.get_fixture_statistics(fixture=fixture_id) for fixture_id, _ in statistics))
+        for fixture_id, data in zip(events, responses):
+            deltas.extend(self.differ.events(fixture_id, _items(data)))
+        for (fixture_id, minute), data in zip(statistics, responses[len(events):]):
+            deltas.extend(self.differ.statistics(fixture_id, _items(data), minute))
+        finished = self._finished()
+        for ids, data in zip(finished, await asyncio.gather(*(client.get_fixtures(ids=ids) for ids in finished))):
+            deltas.extend(self._finish(data, ids))
+        self._publish(deltas)
+        return deltas
+
+    async def run(self):
+        """
+        Poll the API every ``interval`` seconds until ``stop`` is called or the task is cancelled.
+        A failed poll is logged and retried at the next interval.
+        """
+        self._running = True
+        loop = asyncio.get_running_loop()
+        while self._running:
+            started = loop.time()
+            try:
+                await self.poll()
+            except Exception:
+                _logger.exception("Live feed poll failed")
+            await asyncio.sleep(max(0.0, self.interval - (loop.time() - started)))
+
+    def stop(self):
+        self._running = False
+
+
+def _to_dict(data):
+    return data.to_dict() if hasattr(data, "to_dict") else data
+
+
+def _items(data):
+    data = _to_dict(data)
+    if data.get("errors"):
+        raise InternalApiException(data["errors"])
+    return data.get("response") or ()
+
+
+def _minute(item: dict):
+    return ((item.get("fixture") or {}).get("status") or {}).get("elapsed")
+
+
+def _event_key(item: dict):
+    event_time = item.get("time") or {}
+    return (event_time.get("elapsed"), event_time.get("extra"), (item.get("team") or {}).get("id"),
+            (item.get("player") or {}).get("id"), item.get("type"), item.get("detail"))
+
+
+def _event_delta(fixture_id: int, item: dict, removed: bool = False):
+    kind = _EVENT_KINDS.get(str(item.get("type")).lower(), str(item.get("type")).lower())
+    return Delta(kind, fixture_id, (item.get("time") or {}).get("elapsed"), item, removed=removed)
@@ -0,0 +1,351 @@
+import logging
+import threading
+import time
+
+from footballAPIClient._constants import BREAK_STATUSES
+from footballAPIClient._constants import FINISHED_STATUSES
+from footballAPIClient._constants import IN_PLAY_STATUSES
+from footballAPIClient._constants import MAX_FIXTURE_IDS
+from footballAPIClient._constants import SCHEDULED_STATUSES
+from footballAPIClient._constants import STOPPED_STATUSES
+from footballAPIClient.Exceptions.InternalApiException import InternalApiException
+
+# Polling tasks
+STATUS = "status"
+LINEUPS = "lineups"
+EVENTS = "events"
+STATISTICS = "statistics"
+ODDS = "odds"
+
+TASKS = (STATUS, LINEUPS, EVENTS, STATISTICS, ODDS)
+
+# Seconds between two polls of a task, while it is polled
+DEFAULT_INTERVALS = {
+    STATUS: 60,
+    LINEUPS: 300,
+    EVENTS: 30,
+    STATISTICS: 120,
+    ODDS: 30,
+}
+
+# Seconds after the kickoff a fixture is expected to be over, for the budget
+_MATCH_DURATION = 2 * 3600
+
+_logger = logging.getLogger(__name__)
+
+
+class _Fixture:
+    __slots__ = ("id", "kickoff", "status", "due", "lineups", "final")
+
+    def __init__(self, fixture_id: int, kickoff: float, status: str):
+        self.id = fixture_id
+        self.kickoff = kickoff
+        self.status = status
+        self.due = {}
+        self.lineups = False
+        self.final = False
+
+
+class PollingScheduler:
+    """
+    Polls the fixtures of the day according to their status, inside a credit budget:
+
+    - ``NS``/``TBD``: the lineups from ``lineups_before`` seconds before the kickoff until they are published,
+      and the status from the kickoff on, to see the fixture start;
+    - ``1H``/``2H``/``ET``/``P``/``LIVE``: the events, statistics and in-play odds, each at its interval;
+    - ``HT``/``BT``/``SUSP``/``INT``: only the status, nothing else changes during a break;
+    - ``FT``/``AET``/``PEN``/``AWD``/``WO``: the events and statistics once more, then nothing;
+    - ``PST``/``CANC``/``ABD``: nothing.
+
+    The statuses are refreshed in groups of 20 fixtures through the ids parameter, one credit per group.
+    When the polls planned until the end of the last fixture would exceed the remaining budget, every
+    interval is stretched by the same factor. When the status refreshes alone would use up the remaining
+    budget, the scheduler is ``exhausted``: only the statuses are polled, the other tasks are skipped.
+
+    Usage::
+
+        scheduler = PollingScheduler(fp, budget=2000, on_result=handle)
+        scheduler.add(fp.get_fixtures(date="2024-05-19", league=39, season=2023))
+        scheduler.run()
+    """
+
+    def __init__(self,
+                 client,
+                 budget: int = None,
+                 on_result=None,
+                 tasks=(STATUS, LINEUPS, EVENTS, STATISTICS, ODDS),
+                 intervals: dict = None,
+                 lineups_before: float = 3600,
+                 clock=time.time):
+
+        """
+
+        :param client: The FootballAPI client
+        :param budget: (optional) The maximum number of credits spent, the remaining daily quota by default
+        :param on_result: (optional) A function called with the task, the fixture id and the response of each poll.
+        The status task is called with the fixtures item.
+        :param tasks: The tasks polled, among STATUS, LINEUPS, EVENTS, STATISTICS and ODDS
+        :param intervals: (optional) The seconds between two polls of each task, merged with DEFAULT_INTERVALS
+        :param lineups_before: The seconds before the kickoff from which the lineups are polled
+        :param clock: The function returning the current UTC timestamp
+
+        """
+
+        unknown = set(tasks) - set(TASKS)
+        if unknown:
+            raise ValueError(f"Unknown polling tasks: {', '.join(sorted(unknown))}")
+        self._client = client
+        self.budget = budget
+        self.on_result = on_result
+        self.tasks = frozenset(tasks) | {STATUS}
+        self.intervals = dict(DEFAULT_INTERVALS, **(intervals or {}))
+        self.lineups_before = lineups_before
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._fixtures = {}
+        self._stop = threading.Event()
+        self.spent = 0
+        self.polls = dict.fromkeys(TASKS, 0)
+        self.stretch = 1.0
+        self.exhausted = False
+
+    @property
+    def fixtures(self):
+        """
+        :return: The status of each scheduled fixture, by id
+        """
+        with self._lock:
+            return {fixture.id: fixture.status for fixture in self._fixtures.values()}
+
+    @property
+    def done(self):
+        with self._lock:
+            return not any(fixture.due for fixture in self._fixtures.values())
+
+    def add(self, fixtures):
+        """
+        Schedule fixtures.
+
+        :param fixtures: A response of the fixtures endpoint, or an iterable of its items
+        """
+        if hasattr(fixtures, "to_dict"):
+            fixtures = fixtures.to_dict()
+        if isinstance(fixtures, dict):
+            fixtures = fixtures.get("response") or ()
+        now = self._clock()
+        with self._lock:
+            for item in fixtures:
+                if hasattr(item, "to_dict"):
+                    item = item.to_dict()
+                fixture = item["fixture"]
+                scheduled = self._fixtures.get(fixture["id"])
+                if scheduled is None:
+                    scheduled = self._fixtures[fixture["id"]] = _Fixture(
+                        fixture["id"], fixture.get("timestamp") or now, None)
+                self._update(scheduled, item, now)
+
+    def remove(self, fixture_id: int):
+        with self._lock:
+            self._fixtures.pop(fixture_id, None)
+
+    def next_due(self):
+        """
+        :return: The timestamp of the next poll, None when there is nothing left to poll
+        """
+        with self._lock:
+            return min((due for fixture in self._fixtures.values() for task, due in fixture.due.items()
+                        if task == STATUS or not self.exhausted), default=None)
+
+    def run_pending(self):
+        """
+        Send the polls which are due.
+
+        :return: The number of credits spent
+        """
+        now = self._clock()
+        with self._lock:
+            self._plan(now)
+            statuses, polls = [], []
+            for fixture in self._fixtures.values():
+                for task, due in list(fixture.due.items()):
+                    if due > now:
+                        continue
+                    if task == STATUS:
+                        statuses.append(fixture.id)
+                    elif not self.exhausted:
+                        polls.append((fixture, task))
+            if statuses:
+                # fill the groups with the statuses due before the next interval
+                soon = sorted((fixture.due[STATUS], fixture.id) for fixture in self._fixtures.values()
+                              if now < fixture.due.get(STATUS, now) <= now + self.intervals[STATUS])
+                room = -len(statuses) % MAX_FIXTURE_IDS
+                statuses.extend(fixture_id for _, fixture_id in soon[:room])
+        spent = 0
+        for start in range(0, len(statuses), MAX_FIXTURE_IDS):
+            if not self._afford():
+                return spent
+            ids = statuses[start:start + MAX_FIXTURE_IDS]
+            data = self._call(STATUS, self._client.get_fixtures, ids="-".join(str(i) for i in ids))
+            spent += 1
+            now = self._clock()
+            with self._lock:
+                for item in data.get("response") or ():
+                    fixture = self._fixtures.get(item["fixture"]["id"])
+                    if fixture is not None:
+                        self._update(fixture, item, now)
+                for fixture_id in ids:
+                    fixture = self._fixtures.get(fixture_id)
+                    if fixture is not None and STATUS in fixture.due and \
+                            fixture.due[STATUS] <= now + self.intervals[STATUS]:
+                        fixture.due[STATUS] = now + self._interval(STATUS)
+            if self.on_result is not None:
+                for item in data.get("response") or ():
+                    self.on_result(STATUS, item["fixture"]["id"], item)
+        for fixture, task in polls:
+            if not self._afford():
+                return spent
+            data = self._poll(fixture, task)
+            spent += 1
+            now = self._clock()
+            with self._lock:
+                self._polled(fixture, task, data, now)
+            if self.on_result is not None:
+                self.on_result(task, fixture.id, data)
+        return spent
+
+    def run(self):
+        """
+        Send the polls when they are due, until every fixture is over, the budget is spent or ``stop`` is called.
+        """
+        self._stop.clear()
+        while not self._stop.is_set():
+            try:
+                self.run_pending()
+            except InternalApiException:
+                _logger.exception("Polling failed")
+            due = self.next_due()
+            if due is None or not self._afford():
+                return
+            self._stop.wait(max(0.0, due - self._clock()))
+
+    def stop(self):
+        self._stop.set()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "fixtures": len(self._fixtures),
+                "spent": self.spent,
+                "budget": self.budget,
+                "stretch": self.stretch,
+                "exhausted": self.exhausted,
+                "polls": dict(self.polls)
+            }
+
+    def _poll(self, fixture: _Fixture, task: str):
+        client = self._client
+        if task == LINEUPS:
+            return self._call(task, client.get_fixture_lineups, fixture=fixture.id)
+        if task == EVENTS:
+            return self._call(task, client.get_fixture_events, fixture=fixture.id)
+        if task == STATISTICS:
+            return self._call(task, client.get_fixture_statistics, fixture=fixture.id)
+        return self._call(task, client.get_in_play_odds, fixture=fixture.id)
+
+    def _call(self, task: str, method, **kwargs):
+        with self._lock:
+            self.spent += 1
+            self.polls[task] += 1
+        data = method(**kwargs)
+        return data.to_dict() if hasattr(data, "to_dict") else data
+
+    def _afford(self):
+        remaining = self._remaining()
+        return remaining is None or remaining > 0
+
+    def _remaining(self):
+        available = getattr(self._client, "available_credits", None)
+        if self.budget is not None:
+            budget = self.budget - self.spent
+            return budget if available is None else min(budget, available)
+        return available
+
+    def _interval(self, task: str):
+        # the statuses cost one credit per 20 fixtures and drive every other task, they are not stretched
+        if task == STATUS:
+            return self.intervals[task]
+        return self.intervals[task] * self.stretch
+
+    def _update(self, fixture: _Fixture, item: dict, now: float):
+        """
+        Record the status of a fixture, and schedule its tasks accordingly.
+        """
+        status = ((item.get("fixture") or {}).get("status") or {}).get("short")
+        timestamp = (item.get("fixture") or {}).get("timestamp")
+        if timestamp:
+            fixture.kickoff = timestamp
+        if status == fixture.status and fixture.due:
+            return
+        followed = fixture.status is not None
+        fixture.status = status
+        due = {}
+        if status in SCHEDULED_STATUSES or status is None:
+            due[STATUS] = max(now, fixture.kickoff)
+            if not fixture.lineups:
+                due[LINEUPS] = max(now, fixture.kickoff - self.lineups_before)
+        elif status in IN_PLAY_STATUSES:
+            due[STATUS] = now + self._interval(STATUS)
+            for task in (EVENTS, STATISTICS, ODDS):
+                due[task] = fixture.due.get(task, now)
+            if not fixture.lineups:
+                due[LINEUPS] = fixture.due.get(LINEUPS, now)
+        elif status in BREAK_STATUSES:
+            due[STATUS] = now + self._interval(STATUS)
+        elif status in FINISHED_STATUSES and not fixture.final:
+            # the final events and statistics of the fixtures followed until the end
+            fixture.final = True
+            if followed:
+                due[EVENTS] = now
+                due[STATISTICS] = now
+        elif status not in STOPPED_STATUSES and status not in FINISHED_STATUSES:
+            due[STATUS] = now + self._interval(STATUS)
+        fixture.due = {task: when for task, when in due.items() if task in self.tasks}
+
+    def _polled(self, fixture: _Fixture, task: str, data: dict, now: float):
+        if task == LINEUPS and data.get("response"):
+            fixture.lineups = True
+        if fixture.final or task == LINEUPS and fixture.lineups:
+            fixture.due.pop(task, None)
+        elif task in fixture.due:
+            fixture.due[task] = now + self._interval(task)
+
+    def _plan(self, now: float):
+        """
+        Stretch the intervals when the polls planned until the end of the last fixture exceed the remaining budget,
+        or mark the scheduler exhausted when the remaining budget is only enough for the statuses.
+        """
+        remaining = self._remaining()
+        if remaining is None:
+            self.stretch = 1.0
+            self.exhausted = False
+            return
+        planned = statuses = 0.0
+        for fixture in self._fixtures.values():
+            end = fixture.kickoff + _MATCH_DURATION
+            if not fixture.due or end <= now and fixture.status not in IN_PLAY_STATUSES:
+                planned += len(fixture.due)
+                continue
+            start = max(now, fixture.kickoff)
+            duration = max(end - start, self.intervals[EVENTS])
+            for task in (EVENTS, STATISTICS, ODDS):
+                if task in self.tasks:
+                    planned += duration / self.intervals[task]
+            statuses += duration / self.intervals[STATUS]
+            if LINEUPS in self.tasks and not fixture.lineups:
+                planned += 1
+            if not fixture.final:
+                planned += (EVENTS in self.tasks) + (STATISTICS in self.tasks)
+        remaining -= statuses / MAX_FIXTURE_IDS
+        self.exhausted = remaining <= 0
+        if not self.exhausted:
+            self.stretch = max(1.0, planned / remaining)
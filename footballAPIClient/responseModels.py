@@ -0,0 +1,438 @@
+import sys
+
+
+class Model:
+    """
+    Base class of the typed response models.
+
+    A model stores the fields of one JSON object in ``__slots__`` instead of a dict, with string
+    values interned so the names, codes and logo URLs repeated across a response are stored once.
+    Fields declared in ``_types`` hold nested objects converted into their own model, or lists of
+    them when the type is given as ``[Model]``. Keys of the object which are not declared are kept
+    aside, so ``to_dict`` gives back the original payload and ``model["key"]`` still finds them.
+
+    Models support ``model["key"]`` and ``model.get("key")`` like the dicts they replace.
+    """
+
+    __slots__ = ("_extra",)
+    _types = {}
+    _fields = ()
+    _decoders = ()
+    _field_set = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = tuple(cls.__dict__.get("__slots__", ()))
+        cls._field_set = frozenset(cls._fields)
+        cls._decoders = tuple((name, cls._types.get(name)) for name in cls._fields)
+
+    def __init__(self, data: dict):
+        for name, kind in self._decoders:
+            value = data.get(name, _MISSING)
+            if value is _MISSING:
+                continue
+            if value is not None:
+                value = intern_json(value) if kind is None else _convert(kind, value)
+            setattr(self, name, value)
+        if self._field_set.issuperset(data):
+            self._extra = None
+        else:
+            self._extra = {key: value for key, value in data.items() if key not in self._field_set}
+
+    def to_dict(self):
+        """
+        :return: The JSON object the model was built from
+        """
+        data = {}
+        for name in self._fields:
+            value = _slot_value(self, name)
+            if value is not _MISSING:
+                data[name] = _to_json(value)
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def __getattr__(self, name):
+        # a declared field missing from the JSON object reads as None
+        if name in self._field_set:
+            return None
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            return getattr(self, key)
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __getstate__(self):
+        return tuple(_slot_value(self, name) for name in self._fields) + (self._extra,)
+
+    def __setstate__(self, state):
+        for name, value in zip(self._fields, state):
+            if value is not _MISSING:
+                setattr(self, name, value)
+        self._extra = state[-1]
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields[:3])
+        return f"{type(self).__name__}({fields})"
+
+
+class Country(Model):
+    __slots__ = ("name", "code", "flag")
+
+
+class Venue(Model):
+    __slots__ = ("id", "name", "address", "city", "country", "capacity", "surface", "image")
+
+
+class Team(Model):
+    __slots__ = ("id", "name", "code", "country", "founded", "national", "logo", "winner", "colors", "goals")
+
+
+class Coach(Model):
+    __slots__ = ("id", "name", "firstname", "lastname", "age", "nationality", "photo")
+
+
+class Player(Model):
+    __slots__ = ("id", "name", "firstname", "lastname", "age", "birth", "nationality", "height", "weight",
+                 "injured", "photo", "number", "pos", "position", "grid", "type", "reason")
+
+
+class Standing(Model):
+    __slots__ = ("rank", "team", "points", "goalsDiff", "group", "form", "status", "description",
+                 "all", "home", "away", "update")
+    _types = {"team": Team}
+
+
+class Season(Model):
+    __slots__ = ("year", "start", "end", "current", "coverage")
+
+
+class League(Model):
+    __slots__ = ("id", "name", "type", "country", "logo", "flag", "season", "round", "standings")
+    _types = {"standings": [[Standing]]}
+
+
+class LeagueInformation(Model):
+    __slots__ = ("league", "country", "seasons")
+    _types = {"league": League, "country": Country, "seasons": [Season]}
+
+
+class TeamInformation(Model):
+    __slots__ = ("team", "venue")
+    _types = {"team": Team, "venue": Venue}
+
+
+class Standings(Model):
+    __slots__ = ("league",)
+    _types = {"league": League}
+
+
+class Periods(Model):
+    __slots__ = ("first", "second")
+
+
+class Status(Model):
+    __slots__ = ("long", "short", "elapsed")
+
+
+class FixtureInformation(Model):
+    __slots__ = ("id", "referee", "timezone", "date", "timestamp", "periods", "venue", "status")
+    _types = {"periods": Periods, "venue": Venue, "status": Status}
+
+
+class Teams(Model):
+    __slots__ = ("home", "away")
+    _types = {"home": Team, "away": Team}
+
+
+class Goals(Model):
+    __slots__ = ("home", "away")
+
+
+class Score(Model):
+    __slots__ = ("halftime", "fulltime", "extratime", "penalty")
+    _types = {"halftime": Goals, "fulltime": Goals, "extratime": Goals, "penalty": Goals}
+
+
+class Time(Model):
+    __slots__ = ("elapsed", "extra")
+
+
+class Event(Model):
+    __slots__ = ("time", "team", "player", "assist", "type", "detail", "comments")
+    _types = {"time": Time, "team": Team, "player": Player, "assist": Player}
+
+
+class LineupPlayer(Model):
+    __slots__ = ("player",)
+    _types = {"player": Player}
+
+
+class Lineup(Model):
+    __slots__ = ("team", "formation", "startXI", "substitutes", "coach")
+    _types = {"team": Team, "startXI": [LineupPlayer], "substitutes": [LineupPlayer], "coach": Coach}
+
+
+class Statistic(Model):
+    __slots__ = ("type", "value")
+
+
+class TeamStatistics(Model):
+    __slots__ = ("team", "statistics")
+    _types = {"team": Team, "statistics": [Statistic]}
+
+
+class Statistics(Model):
+    __slots__ = ("team", "league", "games", "substitutes", "shots", "goals", "passes", "tackles", "duels",
+                 "dribbles", "fouls", "cards", "penalty", "offsides")
+    _types = {"team": Team, "league": League}
+
+
+class PlayerStatistics(Model):
+    __slots__ = ("player", "statistics")
+    _types = {"player": Player, "statistics": [Statistics]}
+
+
+class FixturePlayers(Model):
+    __slots__ = ("team", "players")
+    _types = {"team": Team, "players": [PlayerStatistics]}
+
+
+class Fixture(Model):
+    __slots__ = ("fixture", "league", "teams", "goals", "score", "events", "lineups", "statistics", "players")
+    _types = {"fixture": FixtureInformation, "league": League, "teams": Teams, "goals": Goals, "score": Score,
+              "events": [Event], "lineups": [Lineup], "statistics": [TeamStatistics], "players": [FixturePlayers]}
+
+    @property
+    def id(self):
+        return self.fixture.id
+
+
+class Injury(Model):
+    __slots__ = ("player", "team", "fixture", "league")
+    _types = {"player": Player, "team": Team, "fixture": FixtureInformation, "league": League}
+
+
+class Squad(Model):
+    __slots__ = ("team", "players")
+    _types = {"team": Team, "players": [Player]}
+
+
+class OddValue(Model):
+    __slots__ = ("value", "odd", "handicap", "main", "suspended")
+
+
+class Bet(Model):
+    __slots__ = ("id", "name", "values")
+    _types = {"values": [OddValue]}
+
+
+class Odds(Model):
+    __slots__ = ("fixture", "league", "teams", "status", "update", "odds")
+    _types = {"fixture": FixtureInformation, "league": League, "teams": Teams, "odds": [Bet]}
+
+
+# Model of the items of the response of each endpoint. The responses of the other endpoints
+# are left as decoded JSON.
+MODELS = {
+    "countries": Country,
+    "leagues": LeagueInformation,
+    "teams": TeamInformation,
+    "venues": Venue,
+    "standings": Standings,
+    "fixtures": Fixture,
+    "fixtures/headtohead": Fixture,
+    "fixtures/statistics": TeamStatistics,
+    "fixtures/events": Event,
+    "fixtures/lineups": Lineup,
+    "fixtures/players": FixturePlayers,
+    "injuries": Injury,
+    "coachs": Coach,
+    "players": PlayerStatistics,
+    "players/squads": Squad,
+    "players/topscorers": PlayerStatistics,
+    "players/topassists": PlayerStatistics,
+    "players/topyellowcards": PlayerStatistics,
+    "players/topredcards": PlayerStatistics,
+    "odds/live": Odds,
+}
+
+
+class ApiResponse:
+    """
+    Response of an endpoint, holding the items of its ``response`` as models.
+    The items are converted on first access of ``response``, so a response which is only
+    checked for its ``results`` or ``paging``, or kept in the cache without being read, is not converted.
+
+    Like the models, it supports ``data["response"]`` and ``data.get("errors")``.
+    """
+
+    __slots__ = ("endpoint", "parameters", "errors", "results", "paging", "_response")
+
+    _KEYS = {"get": "endpoint", "parameters": "parameters", "errors": "errors", "results": "results",
+             "paging": "paging", "response": "response"}
+
+    def __init__(self, data: dict, model=None):
+
+        """
+
+        :param data: The decoded JSON response
+        :param model: (optional) The Model of the items of the response
+
+        """
+
+        self.endpoint = data.get("get")
+        self.parameters = data.get("parameters")
+        self.errors = data.get("errors")
+        self.results = data.get("results")
+        self.paging = data.get("paging")
+        response = data.get("response")
+        if model is not None and isinstance(response, list):
+            response = _Pending(model, response)
+        self._response = response
+
+    @classmethod
+    def from_dict(cls, path: str, data: dict):
+        """
+        :param path: The endpoint path
+        :param data: The decoded JSON response
+        :return: The ApiResponse of the endpoint
+        """
+        return cls(data, MODELS.get(path))
+
+    @property
+    def response(self):
+        response = self._response
+        if type(response) is _Pending:
+            response = [response.model(item) for item in response.items]
+            self._response = response
+        return response
+
+    def to_dict(self):
+        """
+        :return: The JSON response the ApiResponse was built from
+        """
+        return {
+            "get": self.endpoint,
+            "parameters": self.parameters,
+            "errors": self.errors,
+            "results": self.results,
+            "paging": self.paging,
+            "response": _to_json(self._response),
+        }
+
+    def __getitem__(self, key):
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, self._KEYS[key])
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __len__(self):
+        return len(self.response)
+
+    def __iter__(self):
+        return iter(self.response)
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        self.__init__(state, MODELS.get(state.get("get")))
+
+    def __repr__(self):
+        return f"ApiResponse(endpoint={self.endpoint!r}, results={self.results!r})"
+
+
+class _Missing:
+    __slots__ = ()
+
+    def __reduce__(self):
+        return "_MISSING"
+
+    def __repr__(self):
+        return "<missing>"
+
+
+_MISSING = _Missing()
+
+
+class _Pending:
+    __slots__ = ("model", "items")
+
+    def __init__(self, model, items):
+        self.model = model
+        self.items = items
+
+
+def _slot_value(model, name):
+    try:
+        return object.__getattribute__(model, name)
+    except AttributeError:
+        return _MISSING
+
+
+def _convert(kind, value):
+    if isinstance(kind, list):
+        if not isinstance(value, list):
+            return value
+        return [_convert(kind[0], item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return kind(value)
+
+
+def intern_json(value):
+    """
+    Copy decoded JSON with its strings interned, so equal strings share one object.
+
+    :param value: The decoded JSON value
+    :return: The interned copy
+    """
+    if type(value) is str:
+        return sys.intern(value)
+    if type(value) is dict:
+        return {key: intern_json(item) for key, item in value.items()}
+    if type(value) is list:
+        return [intern_json(item) for item in value]
+    return value
+
+
+def _to_json(value):
+    if isinstance(value, (Model, ApiResponse)):
+        return value.to_dict()
+    if type(value) is _Pending:
+        return value.items
+    if isinstance(value, list):
+        return [_to_json(item) for item in value]
+    return value
+
+
+def to_json(value):
+    """
+    Convert a response, a model or a list of models back into plain JSON types.
+
+    :param value: The value to convert
+    :return: The value made of dicts and lists
+    """
+    return _to_json(value)
@@ -0,0 +1,249 @@
+import json
+import logging
+import os
+import threading
+import time
+
+from footballAPIClient._constants import FINISHED_STATUSES
+from footballAPIClient._constants import MAX_FIXTURE_IDS
+from footballAPIClient._constants import SCHEDULED_STATUSES
+from footballAPIClient._constants import STOPPED_STATUSES
+from footballAPIClient.helpers.FixtureDetails import FIXTURE_DETAILS, detail_response
+
+# Seconds after the kickoff a fixture is expected to be over
+_MATCH_DURATION = 2 * 3600
+
+_logger = logging.getLogger(__name__)
+
+
+class SeasonSync:
+    """
+    Keeps a mirror of league seasons up to date, fetching again only the fixtures which may have changed.
+
+    The state of each fixture, its kickoff, status, score, and the time it was last fetched, is kept in a
+    JSON file. A sync:
+
+    - lists the fixtures of a season, one request, when it was not listed for ``list_interval`` seconds,
+      to see the new fixtures and the changes of dates, statuses and scores;
+    - fetches by id, with their events, lineups, statistics and player statistics, the fixtures under way,
+      those whose kickoff has passed, and those the listing found changed, 20 fixtures per request, the
+      fixtures of every season sharing the requests;
+    - never fetches a final fixture again: one fetched finished at least ``settle`` seconds after its end.
+
+    The scheduled fixtures are only read from the listing, and the postponed, cancelled and abandoned ones
+    only fetched again when the listing shows them changed.
+
+    The fixtures and their details are written to the sink, a ``write(path, responses, league=..., season=...)``
+    method which must keep the rows of the previous writes, such as a Dataset.
+
+    Usage::
+
+        sync = SeasonSync(fp, Dataset("mirror"), state="mirror/sync.json")
+        sync.sync([(39, 2023), (140, 2023), (135, 2023)])
+    """
+
+    def __init__(self,
+                 client,
+                 sink,
+                 state: str,
+                 list_interval: float = 86400,
+                 settle: float = 3600,
+                 details: bool = True,
+                 clock=time.time):
+
+        """
+
+        :param client: The FootballAPI client
+        :param sink: The object the fixtures and their details are written to
+        :param state: The path of the JSON file keeping the state of the fixtures
+        :param list_interval: The seconds between two listings of the fixtures of a season
+        :param settle: The seconds after the end of a fixture during which it is still fetched again,
+        for the corrections of its events and statistics
+        :param details: Whether the events, lineups and statistics of the fixtures are written
+        :param clock: The function returning the current UTC timestamp
+
+        """
+
+        self._client = client
+        self.sink = sink
+        self.state = state
+        self.list_interval = list_interval
+        self.settle = settle
+        self.details = details
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._seasons = self._load()
+        self.requests = 0
+        self.fetched = 0
+
+    def fixtures(self, league: int, season: int):
+        """
+        :return: The state of the fixtures of a season, by id: kickoff, status, goals, updated and final
+        """
+        with self._lock:
+            fixtures = self._seasons.get(_key(league, season), {}).get("fixtures", {})
+            return {int(fixture_id): dict(fixture) for fixture_id, fixture in fixtures.items()}
+
+    def sync(self, shards, force_list: bool = False):
+        """
+        Bring the seasons up to date, and save the state.
+
+        :param shards: An iterable of (league, season)
+        :param force_list: Whether the fixtures of every season are listed, whatever ``list_interval``
+        :return: A list of dicts holding the league, the season, whether it was listed, the number of
+        fixtures fetched by id and the number of final fixtures
+        """
+        shards = list(dict.fromkeys((int(league), int(season)) for league, season in shards))
+        listed, owners = set(), {}
+        for league, season in shards:
+            now = self._clock()
+            with self._lock:
+                entry = self._seasons.setdefault(_key(league, season), {"listed": None, "fixtures": {}})
+                due = force_list or entry["listed"] is None or now - entry["listed"] >= self.list_interval
+            if due:
+                self._list(league, season, entry)
+                listed.add((league, season))
+            with self._lock:
+                for fixture_id in self._stale(entry, now, (league, season) in listed):
+                    owners[fixture_id] = (league, season)
+        fetched = self._fetch(owners)
+        self._save()
+        results = []
+        with self._lock:
+            for league, season in shards:
+                fixtures = self._seasons[_key(league, season)]["fixtures"]
+                results.append({
+                    "league": league,
+                    "season": season,
+                    "listed": (league, season) in listed,
+                    "fetched": fetched.get((league, season), 0),
+                    "final": sum(1 for fixture in fixtures.values() if fixture["final"]),
+                })
+        return results
+
+    def stats(self):
+        with self._lock:
+            fixtures = [fixture for entry in self._seasons.values() for fixture in entry["fixtures"].values()]
+            return {
+                "seasons": len(self._seasons),
+                "fixtures": len(fixtures),
+                "final": sum(1 for fixture in fixtures if fixture["final"]),
+                "requests": self.requests,
+                "fetched": self.fetched
+            }
+
+    def _list(self, league: int, season: int, entry: dict):
+        data = self._client.get_fixtures(league=league, season=season)
+        if hasattr(data, "to_dict"):
+            data = data.to_dict()
+        now = self._clock()
+        changed = []
+        with self._lock:
+            self.requests += 1
+            entry["listed"] = now
+            for item in data.get("response") or ():
+                if hasattr(item, "to_dict"):
+                    item = item.to_dict()
+                fixture = entry["fixtures"].get(str(item["fixture"]["id"]))
+                if fixture is not None and fixture["final"]:
+                    continue
+                snapshot = _snapshot(item)
+                if fixture is None or any(fixture[name] != value for name, value in snapshot.items()):
+                    entry["fixtures"][str(item["fixture"]["id"])] = dict(
+                        fixture or {"updated": None, "final": False}, changed=True, **snapshot)
+                    changed.append(item)
+        if changed:
+            self.sink.write("fixtures", {"response": changed}, league=league, season=season)
+
+    def _stale(self, entry: dict, now: float, listed: bool):
+        """
+        :return: The ids of the fixtures of a season to fetch again
+        """
+        stale = []
+        for fixture_id, fixture in entry["fixtures"].items():
+            changed = fixture.pop("changed", False)
+            if fixture["final"]:
+                continue
+            status = fixture["status"]
+            if status in SCHEDULED_STATUSES:
+                # the listing tells when they start, else they are fetched once their kickoff has passed
+                if listed or fixture["kickoff"] is None or fixture["kickoff"] > now:
+                    continue
+            elif status in STOPPED_STATUSES and not changed:
+                continue
+            stale.append(int(fixture_id))
+        return stale
+
+    def _fetch(self, owners: dict):
+        """
+        Fetch the fixtures by id, write them with their details, and record their state.
+
+        :param owners: The (league, season) of each fixture id
+        :return: The number of fixtures fetched, by (league, season)
+        """
+        if not owners:
+            return {}
+        items = self._client.get_fixtures_bulk(owners)
+        now = self._clock()
+        shards = {}
+        with self._lock:
+            self.requests += -(-len(owners) // MAX_FIXTURE_IDS)
+            self.fetched += len(items)
+            for fixture_id, item in items.items():
+                if hasattr(item, "to_dict"):
+                    item = item.to_dict()
+                league, season = owners[fixture_id]
+                fixture = self._seasons[_key(league, season)]["fixtures"][str(fixture_id)]
+                fixture.update(_snapshot(item), updated=now)
+                fixture["final"] = fixture["status"] in FINISHED_STATUSES and \
+                    now >= (fixture["kickoff"] or 0) + _MATCH_DURATION + self.settle
+                shards.setdefault((league, season), {})[fixture_id] = item
+            for fixture_id in owners.keys() - items.keys():
+                # no longer served by the API, it is fetched again only if a listing shows it again
+                league, season = owners[fixture_id]
+                del self._seasons[_key(league, season)]["fixtures"][str(fixture_id)]
+                _logger.warning("Fixture %s of league %s season %s not found, dropped from the sync",
+                                fixture_id, league, season)
+        for (league, season), fixtures in shards.items():
+            self.sink.write("fixtures", {"response": list(fixtures.values())}, league=league, season=season)
+            if not self.details:
+                continue
+            for key, path in FIXTURE_DETAILS:
+                responses = [detail_response(path, fixture_id, item, key)
+                             for fixture_id, item in fixtures.items() if key in item]
+                if responses:
+                    self.sink.write(path, responses, league=league, season=season)
+        return {shard: len(fixtures) for shard, fixtures in shards.items()}
+
+    def _load(self):
+        try:
+            with open(self.state) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def _save(self):
+        with self._lock:
+            content = json.dumps(self._seasons)
+        directory = os.path.dirname(os.path.abspath(self.state))
+        os.makedirs(directory, exist_ok=True)
+        with open(self.state + ".tmp", "w") as file:
+            file.write(content)
+        os.replace(self.state + ".tmp", self.state)
+
+
+def _key(league: int, season: int):
+    return f"{league}-{season}"
+
+
+def _snapshot(item: dict):
+    """
+    :return: The fields of a fixtures item whose change makes the fixture fetched again
+    """
+    fixture = item.get("fixture") or {}
+    goals = item.get("goals") or {}
+    return {
+        "kickoff": fixture.get("timestamp"),
+        "status": (fixture.get("status") or {}).get("short"),
+        "goals": [goals.get("home"), goals.get("away")],
+    }
@@ -0,0 +1,63 @@
+import json
+import threading
+
+HEADERS = {"x-ratelimit-requests-limit": "75000", "x-ratelimit-requests-remaining": "70000"}
+
+STATUS = {"get": "status", "parameters": [], "errors": [], "results": 1, "paging": {"current": 1, "total": 1},
+          "response": {"requests": {"current": 0, "limit_day": 75000}}}
+
+
+def response(path: str, items, page: int = 1, total: int = 1):
+    return {"get": path, "parameters": {}, "errors": [], "results": len(items),
+            "paging": {"current": page, "total": total}, "response": items}
+
+
+class FakeResponse:
+
+    def __init__(self, body, status_code: int = 200, headers: dict = None):
+        self.status_code = status_code
+        self.headers = dict(HEADERS, **(headers or {}))
+        self.content = json.dumps(body).encode("utf-8")
+        self.closed = False
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int = 1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+class FakeTransport:
+    """
+    Answers the status endpoint, and every other call with the body returned by handler(path, params),
+    or with the FakeResponse it returns.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+        self.headers = {}
+        self._lock = threading.Lock()
+
+    def request(self, method, url, headers=None, params=None, data=None, **kwargs):
+        path = url.split(".io/", 1)[-1]
+        with self._lock:
+            self.calls.append((path, dict(params or {})))
+            self.headers = dict(headers or {})
+        if path == "status":
+            return FakeResponse(STATUS)
+        body = self.handler(path, dict(params or {}))
+        return body if isinstance(body, FakeResponse) else FakeResponse(body)
+
+    def paths(self):
+        """
+        :return: The paths requested, the status endpoint aside
+        """
+        return [path for path, _ in self.calls if path != "status"]
+
+    def close(self):
+        pass
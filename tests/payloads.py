@@ -0,0 +1,57 @@
+"""
+Small payloads shaped like the responses of the Football API.
+"""
+KICKOFF = 1_700_000_000
+
+
+def team(team_id: int, **fields):
+    return dict({"id": team_id, "name": f"Team {team_id}", "logo": f"https://media.api-sports.io/{team_id}.png"},
+                **fields)
+
+
+def fixture(fixture_id: int, home: int = 33, away: int = 34, goals=(2, 1), status: str = "FT",
+            league: int = 39, season: int = 2023, timestamp: int = KICKOFF, **fields):
+    home_goals, away_goals = goals
+    played = home_goals is not None and away_goals is not None
+    return dict({
+        "fixture": {
+            "id": fixture_id,
+            "referee": "M. Oliver",
+            "timezone": "UTC",
+            "date": "2023-11-14T22:13:20+00:00",
+            "timestamp": timestamp,
+            "periods": {"first": timestamp, "second": timestamp + 3600},
+            "venue": {"id": 500 + home, "name": f"Stadium {home}", "city": f"City {home}"},
+            "status": {"long": "Match Finished", "short": status, "elapsed": 90},
+        },
+        "league": {"id": league, "name": "Premier League", "country": "England", "logo": None, "flag": None,
+                   "season": season, "round": "Regular Season - 12"},
+        "teams": {"home": team(home, winner=home_goals > away_goals if played else None),
+                  "away": team(away, winner=away_goals > home_goals if played else None)},
+        "goals": {"home": home_goals, "away": away_goals},
+        "score": {"halftime": {"home": 1, "away": 0}, "fulltime": {"home": home_goals, "away": away_goals},
+                  "extratime": {"home": None, "away": None}, "penalty": {"home": None, "away": None}},
+    }, **fields)
+
+
+def event(elapsed: int, team_id: int = 33, player_id: int = 7, kind: str = "Goal", detail: str = "Normal Goal"):
+    return {"time": {"elapsed": elapsed, "extra": None}, "team": team(team_id),
+            "player": {"id": player_id, "name": f"Player {player_id}"}, "assist": {"id": None, "name": None},
+            "type": kind, "detail": detail, "comments": None}
+
+
+def statistics(team_id: int, shots: int = 10, possession: str = "50%", expected_goals: str = "1.20"):
+    return {"team": team(team_id), "statistics": [
+        {"type": "Shots on Goal", "value": shots // 2},
+        {"type": "Total Shots", "value": shots},
+        {"type": "Ball Possession", "value": possession},
+        {"type": "expected_goals", "value": expected_goals},
+    ]}
+
+
+def standing(rank: int, team_id: int, points: int):
+    return {"rank": rank, "team": team(team_id), "points": points, "goalsDiff": points - 10, "group": "Premier League",
+            "form": "WWDLW", "status": "same", "description": None,
+            "all": {"played": 12, "win": points // 3, "draw": points % 3, "lose": 12 - points // 3 - points % 3,
+                    "goals": {"for": 20, "against": 10}},
+            "update": "2023-11-14T00:00:00+00:00"}
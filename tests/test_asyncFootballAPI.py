@@ -0,0 +1,84 @@
+import asyncio
+from http.client import HTTPException
+
+import pytest
+
+from footballAPIClient.asyncFootballAPI import AsyncFootballAPI
+from tests.fakes import FakeResponse, FakeTransport, response
+
+
+class AsyncTransport:
+    """
+    Wraps a FakeTransport, recording the pages requested and the largest number of requests in flight at once.
+    """
+
+    def __init__(self, handler):
+        self.sync = FakeTransport(handler)
+        self.pages = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def request(self, method, url, params=None, **kwargs):
+        if url.endswith("/players"):
+            self.pages.append(params["page"])
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self.sync.request(method, url, params=params, **kwargs)
+
+    async def close(self):
+        pass
+
+
+def _players(path, params):
+    page = int(params.get("page", 1))
+    return response(path, [{"player": {"id": page}}], page=page, total=4)
+
+
+async def _iter_players(prefetch: int):
+    transport = AsyncTransport(_players)
+    api = AsyncFootballAPI("api-sports", api_key="test", transport=transport, cache_size=0)
+    ids = []
+    async for item in api.iter_players(league=39, season=2023, prefetch=prefetch):
+        ids.append(item["player"]["id"])
+        # let the requests scheduled in the background start
+        await asyncio.sleep(0.05)
+        if prefetch == 0:
+            assert len(transport.pages) == item["player"]["id"]
+    return ids, transport.peak
+
+
+def test_iter_players_without_prefetch():
+    ids, peak = asyncio.run(_iter_players(0))
+    assert ids == [1, 2, 3, 4]
+    assert peak == 1
+
+
+def test_iter_players_prefetch():
+    ids, peak = asyncio.run(_iter_players(2))
+    assert ids == [1, 2, 3, 4]
+    assert peak == 2
+
+
+async def _batch(calls, return_exceptions: bool = True):
+    def handler(path, params):
+        if str(params.get("fixture")) == "404":
+            return FakeResponse({"message": "not found"}, status_code=404)
+        return response(path, [{"path": path, "params": params}])
+
+    api = AsyncFootballAPI("api-sports", api_key="test", transport=AsyncTransport(handler), cache_size=0)
+    return await api.batch(calls, return_exceptions=return_exceptions)
+
+
+def test_batch():
+    fixture, events, error = asyncio.run(_batch([
+        ("get_fixtures", {"id": 1}),
+        ("get_fixture_events", {"fixture": 1}),
+        ("get_fixture_events", {"fixture": 404}),
+    ]))
+    assert fixture["response"][0]["path"] == "fixtures"
+    assert events["response"][0] == {"path": "fixtures/events", "params": {"fixture": 1}}
+    assert isinstance(error, HTTPException)
+    with pytest.raises(HTTPException):
+        asyncio.run(_batch([("get_fixture_events", {"fixture": 404})], return_exceptions=False))
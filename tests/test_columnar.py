@@ -0,0 +1,85 @@
+import math
+
+import numpy
+import pytest
+
+from footballAPIClient.columnar import TableBuilder, goals_per_team, player_minutes, shot_ratios, to_table
+from tests.fakes import response
+from tests.payloads import fixture, statistics, team
+
+
+def _fixture_response(path, fixture_id, items):
+    data = response(path, items)
+    data["parameters"] = {"fixture": str(fixture_id)}
+    return data
+
+
+def test_fixtures_are_flattened_into_typed_columns():
+    builder = TableBuilder("fixtures")
+    assert builder.append(response("fixtures", [fixture(1), fixture(2, 35, 33, goals=(None, None), status="NS")])) == 2
+    builder.append(response("fixtures", [fixture(3, 34, 35, goals=(1, 1))]))
+    table = builder.build()
+    assert len(table) == 3 and len(builder) == 3
+    assert table["fixture_id"].tolist() == [1, 2, 3]
+    assert table["fixture_id"].dtype == numpy.int64
+    assert table["status"].tolist() == ["FT", "NS", "FT"]
+    assert table["goals_home"][0] == 2 and math.isnan(table["goals_home"][1])
+    assert table["home_winner"].tolist()[0] == 1.0
+    assert table["venue_id"][1] == 535
+    assert len(table.filter(table["status"] == "FT")) == 2
+
+
+def test_unknown_endpoint():
+    with pytest.raises(ValueError):
+        TableBuilder("odds")
+
+
+def test_goals_per_team_skips_unplayed_fixtures():
+    table = to_table("fixtures", response("fixtures", [
+        fixture(1, 33, 34, goals=(2, 1)),
+        fixture(2, 34, 33, goals=(3, 3)),
+        fixture(3, 33, 35, goals=(None, None), status="NS"),
+    ]))
+    totals = goals_per_team(table)
+    assert totals["team_id"].tolist() == [33, 34]
+    assert totals["played"].tolist() == [2, 2]
+    assert totals["goals_for"].tolist() == [5, 4]
+    assert totals["goals_against"].tolist() == [4, 5]
+    assert totals["goal_difference"].tolist() == [1, -1]
+    assert totals["goals_for_per_match"].tolist() == [2.5, 2.0]
+
+
+def test_shot_ratios_parse_percentages_and_expected_goals():
+    table = to_table("fixtures/statistics", [
+        _fixture_response("fixtures/statistics", 1, [statistics(33, shots=10, possession="60%"),
+                                                    statistics(34, shots=4, possession="40%", expected_goals=None)]),
+        _fixture_response("fixtures/statistics", 2, [statistics(33, shots=20, possession="50%")]),
+    ])
+    assert table["fixture_id"].tolist() == [1, 1, 2]
+    ratios = shot_ratios(table)
+    assert ratios["team_id"].tolist() == [33, 34]
+    assert ratios["matches"].tolist() == [2, 1]
+    assert ratios["total_shots"].tolist() == [30, 4]
+    assert ratios["on_target_ratio"].tolist() == [0.5, 0.5]
+    assert ratios["possession"].tolist() == [55.0, 40.0]
+    assert ratios["expected_goals"][0] == pytest.approx(2.4)
+    assert math.isnan(ratios["expected_goals"][1])
+
+
+def test_player_minutes_counts_appearances_with_minutes():
+    def player(player_id, minutes, goals, assists):
+        return {"player": {"id": player_id, "name": f"Player {player_id}"},
+                "statistics": [{"games": {"minutes": minutes},
+                                "goals": {"total": goals, "assists": assists}}]}
+
+    table = to_table("fixtures/players", [
+        _fixture_response("fixtures/players", 1, [{"team": team(33), "players": [player(7, 90, 1, None),
+                                                                                 player(8, None, None, None)]}]),
+        _fixture_response("fixtures/players", 2, [{"team": team(33), "players": [player(7, 45, 0, 1)]}]),
+    ])
+    minutes = player_minutes(table)
+    assert minutes["player_id"].tolist() == [7, 8]
+    assert minutes["appearances"].tolist() == [2, 0]
+    assert minutes["minutes"].tolist() == [135, 0]
+    assert minutes["goals_per_90"][0] == pytest.approx(90 / 135)
+    assert minutes["goal_involvements_per_90"][0] == pytest.approx(2 * 90 / 135)
@@ -0,0 +1,84 @@
+import os
+
+import pytest
+
+from footballAPIClient.dataset import Dataset
+from tests.fakes import response
+from tests.payloads import KICKOFF, event, fixture
+
+DAY = 86400
+
+
+def _events(fixture_id, items):
+    data = response("fixtures/events", items)
+    data["parameters"] = {"fixture": str(fixture_id)}
+    return data
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    dataset = Dataset(str(tmp_path))
+    dataset.write("fixtures", response("fixtures", [
+        fixture(1, 33, 34, timestamp=KICKOFF),
+        fixture(2, 35, 36, timestamp=KICKOFF + 7 * DAY),
+        fixture(3, 33, 35, season=2022, timestamp=KICKOFF - 365 * DAY),
+        fixture(4, 40, 41, league=140, timestamp=KICKOFF),
+    ]))
+    return dataset
+
+
+def test_rows_are_partitioned_by_league_and_season(dataset):
+    assert sorted(dataset.partitions("fixtures")) == [("fixtures", 39, 2022, 1), ("fixtures", 39, 2023, 1),
+                                                      ("fixtures", 140, 2023, 1)]
+    assert sorted(dataset.read("fixtures")["fixture_id"].tolist()) == [1, 2, 3, 4]
+    assert sorted(dataset.read("fixtures", league=39, season=2023)["fixture_id"].tolist()) == [1, 2]
+    assert dataset.read("fixtures", league=140)["home_name"].tolist() == ["Team 40"]
+
+
+def test_team_and_date_filters(dataset):
+    assert sorted(dataset.read("fixtures", team=33)["fixture_id"].tolist()) == [1, 3]
+    assert sorted(dataset.read("fixtures", team={35, 40})["fixture_id"].tolist()) == [2, 3, 4]
+    assert sorted(dataset.read("fixtures", date_from="2023-11-01", date_to="2023-11-14")["fixture_id"].tolist()) == [1, 4]
+    assert dataset.read("fixtures", team=33, date_from="2023-01-01")["fixture_id"].tolist() == [1]
+
+
+def test_parts_not_matching_the_filters_are_not_opened(dataset):
+    dataset.write("fixtures", response("fixtures", [fixture(5, 50, 51)]))
+    directory = os.path.join(dataset.root, "endpoint=fixtures", "league=39", "season=2023")
+    newest = sorted(name for name in os.listdir(directory) if name.startswith("part-"))[-1]
+    os.remove(os.path.join(directory, newest, "home_name.npy"))
+    assert sorted(dataset.read("fixtures", league=39, season=2023, team=33)["fixture_id"].tolist()) == [1]
+
+
+def test_newer_rows_of_a_key_replace_the_older_ones(dataset):
+    dataset.write("fixtures/events", [_events(1, [event(10), event(20)]), _events(2, [event(30, team_id=35)])],
+                  league=39, season=2023)
+    dataset.write("fixtures/events", _events(1, [event(10), event(20), event(25, kind="Card", detail="Yellow Card")]),
+                  league=39, season=2023)
+    dataset.write("fixtures", response("fixtures", [fixture(1, 33, 34, goals=(3, 1), timestamp=KICKOFF)]))
+
+    events = dataset.read("fixtures/events", league=39, season=2023)
+    assert sorted(zip(events["fixture_id"].tolist(), events["elapsed"].tolist())) == \
+        [(1, 10), (1, 20), (1, 25), (2, 30)]
+    fixtures = dataset.read("fixtures", league=39, season=2023, columns=("fixture_id", "goals_home"))
+    assert fixtures.names == ("fixture_id", "goals_home")
+    assert sorted(zip(fixtures["fixture_id"].tolist(), fixtures["goals_home"].tolist())) == [(1, 3), (2, 2)]
+
+    # the endpoints without a timestamp are filtered on the dates of their fixtures
+    late = dataset.read("fixtures/events", date_from="2023-11-20")
+    assert late["fixture_id"].tolist() == [2]
+
+    assert dataset.compact("fixtures/events") == 1
+    assert dataset.partitions("fixtures/events") == [("fixtures/events", 39, 2023, 1)]
+    assert len(dataset.read("fixtures/events")) == 4
+
+
+def test_errors(dataset):
+    with pytest.raises(ValueError):
+        dataset.write("fixtures/events", _events(1, [event(10)]))
+    with pytest.raises(ValueError):
+        dataset.read("fixtures", columns=("fixture_id", "unknown"))
+    with pytest.raises(ValueError):
+        dataset.read("odds")
+    empty = dataset.read("fixtures", league=61)
+    assert len(empty) == 0 and empty["fixture_id"].dtype == "int64"
@@ -0,0 +1,48 @@
+import pytest
+
+from footballAPIClient.Exceptions.MissingParametersError import MissingParametersError
+from footballAPIClient.helpers.Endpoints import ENDPOINTS
+
+
+def test_query_parameters_use_the_api_names():
+    params = ENDPOINTS["fixtures"].build({"league": 39, "season": 2023, "from_": "2024-01-01", "next_": None})
+    assert params == {"league": 39, "season": 2023, "from": "2024-01-01"}
+
+
+def test_required_parameters():
+    with pytest.raises(MissingParametersError, match="The fixture field is required"):
+        ENDPOINTS["fixtures/events"].build({"team": 33})
+
+
+def test_at_least_one_parameter():
+    with pytest.raises(MissingParametersError):
+        ENDPOINTS["teams"].build({})
+    assert ENDPOINTS["teams"].build({"id": 33}) == {"id": 33}
+
+
+def test_parameters_used_alone():
+    assert ENDPOINTS["fixtures"].build({"ids": "1-2-3"}) == {"ids": "1-2-3"}
+    with pytest.raises(MissingParametersError, match="The ids field must be used alone"):
+        ENDPOINTS["fixtures"].build({"ids": "1-2-3", "timezone": "Europe/London"})
+    with pytest.raises(MissingParametersError, match="The id field must be used alone"):
+        ENDPOINTS["fixtures"].build({"id": 1, "league": 39})
+
+
+def test_parameters_requiring_another_one():
+    with pytest.raises(MissingParametersError, match="season field requires at least one of"):
+        ENDPOINTS["standings"].build({"season": 2023})
+    assert ENDPOINTS["standings"].build({"season": 2023, "team": 33}) == {"season": 2023, "team": 33}
+
+
+def test_types_and_values_are_validated():
+    with pytest.raises(TypeError):
+        ENDPOINTS["fixtures"].build({"league": "39"})
+    with pytest.raises(ValueError):
+        ENDPOINTS["fixtures"].build({"date": "2024-13-01"})
+    with pytest.raises(TypeError, match="unexpected parameter"):
+        ENDPOINTS["countries"].build({"country": "England"})
+
+
+def test_whole_call_checks():
+    with pytest.raises(ValueError, match="'team' requires"):
+        ENDPOINTS["players"].build({"team": 33})
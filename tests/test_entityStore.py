@@ -0,0 +1,65 @@
+from footballAPIClient.entityStore import EntityStore
+from footballAPIClient.footballAPI import FootballAPI
+from tests.fakes import FakeTransport, response
+from tests.payloads import fixture, standing
+
+
+def test_entities_are_stored_once_and_joined_back():
+    store = EntityStore()
+    items = [fixture(1, 33, 34), fixture(2, 34, 35, goals=(0, 0), status="NS")]
+    store.add("fixtures", response("fixtures", items))
+    assert store.fixture(1) == items[0]
+    assert store.fixtures(team=34, status="NS") == [items[1]]
+    assert store.fixtures(league=39, season=2023, status={"FT", "NS"}) == items
+    assert store.team(34) == {"id": 34, "name": "Team 34", "logo": "https://media.api-sports.io/34.png"}
+    assert store.stats()["teams"] == 3 and store.stats()["venues"] == 2
+
+
+def test_newer_values_replace_the_older_ones():
+    store = EntityStore()
+    store.add("fixtures", response("fixtures", [fixture(1)]))
+    renamed = fixture(1, status="AET")
+    renamed["teams"]["home"]["name"] = "Manchester United"
+    store.add("fixtures", response("fixtures", [renamed]))
+    assert store.fixture(1)["fixture"]["status"]["short"] == "AET"
+    assert store.team(33)["name"] == "Manchester United"
+
+
+def test_standings_are_joined_with_their_teams():
+    store = EntityStore()
+    data = response("standings", [{"league": {"id": 39, "name": "Premier League", "season": 2023,
+                                              "standings": [[standing(1, 33, 30), standing(2, 34, 28)]]}}])
+    store.add("standings", data)
+    assert store.team(34)["name"] == "Team 34"
+    assert store.stats()["standings"] == 1
+
+
+def test_equal_values_of_other_types_are_not_shared():
+    store = EntityStore()
+    assert store._dedupe({"a": 1}) == {"a": 1}
+    assert type(store._dedupe({"a": True})["a"]) is bool
+    assert type(store._dedupe({"a": 1.0})["a"]) is float
+    assert store._dedupe({"a": 1}) is store._dedupe({"a": 1})
+
+
+def test_shared_objects_are_bounded():
+    store = EntityStore(max_shared=10)
+    for goals in range(25):
+        store._dedupe({"home": goals, "away": 0})
+    assert store.stats()["shared"] <= 10
+
+
+def test_reads_are_copies():
+    store = EntityStore()
+    store.add("fixtures", response("fixtures", [fixture(1), fixture(2)]))
+    store.fixture(1)["goals"]["home"] = 9
+    assert store.fixture(1)["goals"]["home"] == 2
+    assert store.fixture(2)["goals"]["home"] == 2
+
+
+def test_client_merges_its_responses():
+    store = EntityStore()
+    transport = FakeTransport(lambda path, params: response(path, [fixture(1)]))
+    client = FootballAPI("api-sports", api_key="test", transport=transport, lazy=True, entity_store=store)
+    client.get_fixtures(id=1)
+    assert client.entity_store.fixture(1)["fixture"]["id"] == 1
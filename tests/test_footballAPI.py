@@ -0,0 +1,58 @@
+import time
+from http.client import HTTPException
+
+import pytest
+
+from footballAPIClient.footballAPI import FootballAPI
+from tests.fakes import FakeResponse, FakeTransport, response
+
+
+def _players(path, params):
+    page = int(params.get("page", 1))
+    return response(path, [{"player": {"id": page * 10 + i}} for i in range(2)], page=page, total=4)
+
+
+def test_iter_players_prefetch():
+    transport = FakeTransport(_players)
+    with FootballAPI("api-sports", api_key="test", transport=transport, lazy=True) as client:
+        for prefetch in (0, 2):
+            ids = [item["player"]["id"] for item in client.iter_players(league=39, season=2023, prefetch=prefetch)]
+            assert ids == [10, 11, 20, 21, 30, 31, 40, 41]
+
+
+def _batch_handler(path, params):
+    if path == "fixtures/events" and str(params["fixture"]) == "404":
+        return FakeResponse({"message": "not found"}, status_code=404)
+    # the first calls answer last
+    time.sleep(0.02 if path == "fixtures" else 0)
+    return response(path, [{"path": path, "params": params}])
+
+
+def test_batch_results_in_call_order():
+    transport = FakeTransport(_batch_handler)
+    with FootballAPI("api-sports", api_key="test", transport=transport, lazy=True, cache_size=0) as client:
+        fixture, events, lineups = client.batch([
+            ("get_fixtures", {"id": 1}),
+            ("get_fixture_events", {"fixture": 1}),
+            ("get_fixture_lineups", {"fixture": 1}),
+        ])
+    assert fixture["response"][0]["path"] == "fixtures"
+    assert events["response"][0] == {"path": "fixtures/events", "params": {"fixture": 1}}
+    assert lineups["response"][0]["path"] == "fixtures/lineups"
+    assert sorted(transport.paths()) == ["fixtures", "fixtures/events", "fixtures/lineups"]
+
+
+def test_batch_exceptions():
+    transport = FakeTransport(_batch_handler)
+    calls = [("get_fixture_events", {"fixture": 1}), ("get_fixture_events", {"fixture": 404})]
+    with FootballAPI("api-sports", api_key="test", transport=transport, lazy=True, cache_size=0) as client:
+        events, error = client.batch(calls)
+        assert events["results"] == 1
+        assert isinstance(error, HTTPException)
+        with pytest.raises(HTTPException):
+            client.batch(calls, return_exceptions=False)
+        with pytest.raises(ValueError):
+            client.batch(["get_fixtures_bulk"])
+        with pytest.raises(ValueError):
+            client.batch([("close", {})])
+        assert client.batch([]) == []
@@ -0,0 +1,85 @@
+import json
+import os
+
+import pytest
+
+from footballAPIClient import ingestion
+from footballAPIClient.ingestion import IngestionRunner, JsonLinesSink
+from tests.fakes import response
+from tests.payloads import event, fixture, team
+
+
+def test_json_lines_sink_round_trip(tmp_path):
+    sink = JsonLinesSink(str(tmp_path))
+    teams = response("teams", [{"team": {"id": 33, "name": "Manchester United"}}])
+    events = [response("fixtures/events", [{"type": "Goal"}]), response("fixtures/events", [])]
+    sink.write("teams", teams, league=39, season=2023)
+    sink.write("fixtures/events", events, league=39, season=2023)
+
+    with open(os.path.join(str(tmp_path), "teams", "39-2023.jsonl")) as file:
+        assert [json.loads(line) for line in file] == [teams]
+    with open(os.path.join(str(tmp_path), "fixtures_events", "39-2023.jsonl")) as file:
+        assert [json.loads(line) for line in file] == events
+
+
+class _Limiter:
+    acquired = 0
+
+
+class _Client:
+    """
+    Serves the teams and fixtures of a season whose fixtures have the given statuses.
+    """
+
+    rate_limiter = _Limiter()
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.bulk = []
+
+    def get_teams_information(self, league, season):
+        return response("teams", [{"team": team(33)}, {"team": team(34)}])
+
+    def get_fixtures(self, league, season):
+        return response("fixtures", [fixture(i, status=status, league=league, season=season)
+                                     for i, status in enumerate(self.statuses, 1)])
+
+    def get_fixtures_bulk(self, ids):
+        self.bulk.append(list(ids))
+        return {fixture_id: dict(fixture(fixture_id), events=[event(10)]) for fixture_id in ids}
+
+
+def _ingest(monkeypatch, tmp_path, statuses):
+    client = _Client(statuses)
+    monkeypatch.setattr(ingestion, "_client", client)
+    return ingestion._ingest_shard(39, 2023, JsonLinesSink(str(tmp_path)), details=True), client
+
+
+@pytest.mark.parametrize("statuses, complete", [
+    (["FT", "AET", "CANC"], True),
+    (["FT", "NS"], False),
+    (["FT", "PST"], False),
+    ([], False),
+])
+def test_shard_is_complete_once_every_fixture_is_over(monkeypatch, tmp_path, statuses, complete):
+    result, _ = _ingest(monkeypatch, tmp_path, statuses)
+    assert result["complete"] is complete
+
+
+def test_details_of_the_finished_fixtures(monkeypatch, tmp_path):
+    result, client = _ingest(monkeypatch, tmp_path, ["FT", "NS", "PEN"])
+    assert client.bulk == [[1, 3]]
+    assert (result["teams"], result["fixtures"], result["detailed"]) == (2, 3, 2)
+    with open(os.path.join(str(tmp_path), "fixtures_events", "39-2023.jsonl")) as file:
+        assert [json.loads(line)["parameters"] for line in file] == [{"fixture": "1"}, {"fixture": "3"}]
+
+
+def test_incomplete_shards_are_ingested_again(tmp_path):
+    checkpoint = os.path.join(str(tmp_path), "checkpoint.jsonl")
+    with open(checkpoint, "w") as file:
+        file.write(json.dumps({"league": 39, "season": 2022, "complete": True}) + "\n")
+        file.write(json.dumps({"league": 39, "season": 2023, "complete": False}) + "\n")
+        # recorded before the complete field existed
+        file.write(json.dumps({"league": 140, "season": 2021}) + "\n")
+    runner = IngestionRunner("api-sports", sink=JsonLinesSink(str(tmp_path)), checkpoint=checkpoint, api_key="test")
+    assert runner.completed() == {(39, 2022), (140, 2021)}
@@ -0,0 +1,39 @@
+import json
+
+import pytest
+
+from footballAPIClient.helpers.JsonStream import JsonItemParser
+
+BODY = b'{"get":"players","response":[12.5,-3e2,{"id":7,"rating":6.75},true,null],"results":5}'
+
+
+def _parse(chunks):
+    parser = JsonItemParser()
+    items = []
+    for chunk in chunks:
+        items.extend(parser.feed(chunk))
+    items.extend(parser.close())
+    return items, parser.envelope
+
+
+def test_number_split_at_chunk_boundary():
+    items, _ = _parse([b'{"response":[12.', b'5]}'])
+    assert items == [12.5]
+    items, envelope = _parse([b'{"results":1', b'0,"response":[1e', b'-2, -', b'4]}'])
+    assert items == [0.01, -4]
+    assert envelope == {"results": 10}
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7])
+def test_every_chunk_size(size):
+    items, envelope = _parse([BODY[start:start + size] for start in range(0, len(BODY), size)])
+    expected = json.loads(BODY)
+    assert items == expected["response"]
+    assert envelope == {"get": "players", "results": 5}
+
+
+def test_truncated_body():
+    parser = JsonItemParser()
+    parser.feed(b'{"response":[12.')
+    with pytest.raises(ValueError):
+        parser.close()
@@ -0,0 +1,84 @@
+from footballAPIClient.helpers.FixtureDetails import chunk_fixture_ids
+from footballAPIClient.liveFeed import CARD, GOAL, SCORE, STAT, STATUS, Delta, FixtureDiffer, LiveFeed
+from tests.fakes import response
+from tests.payloads import event, fixture, statistics
+
+
+def _live(fixture_id, goals=(0, 0), status="1H", elapsed=10, events=()):
+    item = fixture(fixture_id, goals=goals, status=status)
+    item["fixture"]["status"]["elapsed"] = elapsed
+    item["events"] = list(events)
+    return item
+
+
+def test_chunk_fixture_ids():
+    groups = chunk_fixture_ids(list(range(45)) + [3, 4])
+    assert [len(group.split("-")) for group in groups] == [20, 20, 5]
+    assert groups[0].startswith("0-1-2-")
+
+
+def test_first_snapshot_and_changes():
+    differ = FixtureDiffer()
+    first = differ.fixture(_live(1, goals=(0, 0)))
+    assert [delta.kind for delta in first] == [STATUS, SCORE]
+    assert differ.fixture(_live(1, goals=(0, 0), elapsed=11)) == []
+    assert differ.fixture(_live(1, goals=(1, 0), status="HT", elapsed=45)) == [
+        Delta(STATUS, 1, 45, {"status": "HT", "long": "Match Finished", "previous": "1H"}),
+        Delta(SCORE, 1, 45, {"home": 1, "away": 0, "previous": {"home": 0, "away": 0}}),
+    ]
+
+
+def test_events_added_and_removed():
+    differ = FixtureDiffer(initial=False)
+    goal = event(12)
+    assert differ.events(1, [goal]) == []
+    card = event(20, kind="Card", detail="Yellow Card")
+    deltas = differ.events(1, [goal, card])
+    assert [(delta.kind, delta.minute, delta.removed) for delta in deltas] == [(CARD, 20, False)]
+    deltas = differ.events(1, [card])
+    assert [(delta.kind, delta.minute, delta.removed) for delta in deltas] == [(GOAL, 12, True)]
+
+
+def test_statistics_changes():
+    differ = FixtureDiffer()
+    assert len(differ.statistics(1, [statistics(33, shots=4)], minute=20)) == 4
+    deltas = differ.statistics(1, [statistics(33, shots=6)], minute=30)
+    assert [(delta.kind, delta.data["type"], delta.data["value"], delta.data["previous"]) for delta in deltas] == [
+        (STAT, "Shots on Goal", 3, 2), (STAT, "Total Shots", 6, 4)]
+    differ.forget(1)
+    assert differ.fixtures == set()
+
+
+class _Client:
+
+    def __init__(self):
+        self.live = []
+        self.final = {}
+        self.calls = []
+
+    def get_fixtures(self, live=None, ids=None):
+        self.calls.append(("fixtures", live or ids))
+        if ids is not None:
+            return response("fixtures", [self.final[int(fixture_id)] for fixture_id in ids.split("-")])
+        return response("fixtures", self.live)
+
+
+def test_live_feed_emits_deltas_and_finishes_fixtures():
+    client = _Client()
+    feed = LiveFeed(client, statistics_interval=None, initial=False)
+    received = []
+    feed.subscribe(received.append)
+
+    client.live = [_live(1), _live(2)]
+    assert feed.poll() == []
+    client.live = [_live(1, goals=(1, 0), elapsed=30, events=[event(30)]), _live(2, elapsed=30)]
+    scored = feed.poll()
+    assert [(delta.kind, delta.fixture) for delta in scored] == [(SCORE, 1), (GOAL, 1)]
+
+    client.live = [_live(1, goals=(1, 0), elapsed=70, events=[event(30)])]
+    client.final[2] = _live(2, goals=(0, 1), status="FT", elapsed=90, events=[event(88, team_id=34)])
+    deltas = feed.poll()
+    assert [(delta.kind, delta.fixture) for delta in deltas] == [(STATUS, 2), (SCORE, 2), (GOAL, 2)]
+    assert client.calls[-1] == ("fixtures", "2")
+    assert feed.differ.fixtures == {1}
+    assert received == scored + deltas
@@ -0,0 +1,40 @@
+import pytest
+
+from footballAPIClient.helpers.ParameterValidator import ParameterValidator as validator
+
+
+@pytest.mark.parametrize("check, valid, invalid", [
+    (validator.validate_search_field, "eng", "en"),
+    (validator.validate_player_search_field, "kane", "kan"),
+    (validator.validate_last_field, 10, 100),
+    (validator.validate_next_field, 99, 100),
+    (validator.validate_h2h_field, "33-34", "33-34-35"),
+    (validator.validate_season_field, 2023, 123),
+    (validator.validate_season_field, "2023", "23"),
+    (validator.validate_date_field, "2024-02-29", "2023-02-29"),
+    (validator.validate_ids_field, "-".join(str(i) for i in range(20)), "-".join(str(i) for i in range(21))),
+    (validator.validate_live_field, "all", "some"),
+    (validator.validate_status_field, "NS-PST-FT", "NS-XX"),
+    (validator.validate_code_field, "gb", "zz"),
+])
+def test_valid_and_invalid_values(check, valid, invalid):
+    check(valid)
+    with pytest.raises((ValueError, LookupError)):
+        check(invalid)
+
+
+def test_validate_many_checks_each_distinct_value_once():
+    seen = []
+
+    def check(value):
+        seen.append(value)
+        validator.validate_date_field(value)
+
+    dates = ["2024-01-01", "2024-01-02", "2024-01-01"]
+    assert validator.validate_many(check, dates) == dates
+    assert seen == ["2024-01-01", "2024-01-02"]
+
+
+def test_validate_many_reports_every_invalid_value():
+    with pytest.raises(ValueError, match=r"7 invalid value\(s\): .* and 2 more"):
+        validator.validate_many(validator.validate_date_field, [f"2024-13-0{day}" for day in range(1, 8)])
@@ -0,0 +1,89 @@
+import pytest
+
+from footballAPIClient.pollingScheduler import EVENTS, LINEUPS, ODDS, STATISTICS, STATUS, PollingScheduler
+from tests.payloads import KICKOFF
+
+
+class MatchDay:
+    """
+    Fixtures kicking off at KICKOFF, whose status follows the clock of the test.
+    """
+
+    def __init__(self, fixtures: int, now: float = KICKOFF - 3600):
+        self.now = now
+        self.ids = list(range(1, fixtures + 1))
+
+    def item(self, fixture_id: int):
+        elapsed = self.now - KICKOFF
+        status = "NS" if elapsed < 0 else "1H" if elapsed < 2700 else "HT" if elapsed < 3600 \
+            else "2H" if elapsed < 6300 else "FT"
+        return {"fixture": {"id": fixture_id, "timestamp": KICKOFF, "status": {"short": status}}}
+
+    def get_fixtures(self, ids: str):
+        return {"errors": [], "response": [self.item(int(fixture_id)) for fixture_id in ids.split("-")]}
+
+    def get_fixture_lineups(self, fixture: int):
+        return {"errors": [], "response": [{}] if self.now >= KICKOFF - 1800 else []}
+
+    def get_fixture_events(self, fixture: int):
+        return {"errors": [], "response": []}
+
+    get_fixture_statistics = get_in_play_odds = get_fixture_events
+
+
+def _follow(day: MatchDay, scheduler: PollingScheduler):
+    scheduler.add([day.item(fixture_id) for fixture_id in day.ids])
+    while True:
+        scheduler.run_pending()
+        due = scheduler.next_due()
+        if due is None or scheduler.budget is not None and scheduler.spent >= scheduler.budget:
+            return scheduler.stats()
+        day.now = max(day.now + 1, due)
+
+
+def test_tasks_follow_the_status():
+    day = MatchDay(3)
+    results = []
+    stats = _follow(day, PollingScheduler(day, clock=lambda: day.now,
+                                          on_result=lambda task, fixture_id, data: results.append((task, fixture_id))))
+    polls = stats["polls"]
+    # the lineups every 5 minutes from an hour before the kickoff until their publication half an hour before
+    assert polls[LINEUPS] == 3 * 7
+    # 3 fixtures share one status request a minute from the kickoff to the end
+    assert polls[STATUS] == 106
+    assert len([task for task, _ in results if task == STATUS]) == 3 * 106
+    # every 30 seconds (2 minutes for the statistics) of both halves, nothing during the break,
+    # then the final events and statistics once more
+    assert polls[ODDS] == 3 * 2 * 90
+    assert polls[EVENTS] == 3 * (2 * 90 + 1)
+    assert polls[STATISTICS] == 3 * (2 * 23 + 1)
+    assert stats["spent"] == sum(polls.values())
+    assert not stats["exhausted"] and stats["stretch"] == 1.0
+
+
+def test_intervals_are_stretched_to_fit_the_budget():
+    day = MatchDay(3)
+    stats = _follow(day, PollingScheduler(day, budget=400, clock=lambda: day.now))
+    assert stats["spent"] <= 400
+    assert stats["stretch"] > 1.0 and not stats["exhausted"]
+    assert stats["polls"][EVENTS] < 3 * 180
+
+
+def test_exhausted_budget_only_polls_the_statuses():
+    day = MatchDay(60, now=KICKOFF + 600)
+    scheduler = PollingScheduler(day, budget=50, clock=lambda: day.now)
+    scheduler.add([day.item(fixture_id) for fixture_id in day.ids])
+    # the statuses of the rest of the fixtures alone would cost more than the budget
+    assert scheduler.run_pending() == 0
+    assert scheduler.exhausted and scheduler.stretch == 1.0
+    # the skipped tasks are not reported as due, the next poll is the next status refresh
+    assert scheduler.next_due() == day.now + 60
+    day.now += 60
+    assert scheduler.run_pending() == 3
+    assert scheduler.polls == {STATUS: 3, LINEUPS: 0, EVENTS: 0, STATISTICS: 0, ODDS: 0}
+    assert scheduler.next_due() == day.now + 60
+
+
+def test_unknown_task():
+    with pytest.raises(ValueError):
+        PollingScheduler(MatchDay(1), tasks=(STATUS, "injuries"))
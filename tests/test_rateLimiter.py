@@ -0,0 +1,67 @@
+import pytest
+
+from footballAPIClient.helpers import RateLimiter as rate_limiter
+from footballAPIClient.helpers.RateLimiter import DAY, RateLimiter
+
+MIDNIGHT = 1_699_920_000  # 2023-11-14 00:00 UTC
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [MIDNIGHT + 22 * 3600]
+    monkeypatch.setattr(rate_limiter.time, "time", lambda: now[0])
+    return now
+
+
+def test_per_minute_bucket_refills_continuously(clock):
+    limiter = RateLimiter(per_minute=2)
+    assert limiter.try_acquire() == 0
+    assert limiter.try_acquire() == 0
+    assert limiter.try_acquire() == pytest.approx(30)
+    clock[0] += 30
+    assert limiter.try_acquire() == 0
+    assert limiter.stats()["acquired"] == 3
+
+
+def test_daily_quota_resets_at_midnight(clock):
+    limiter = RateLimiter(per_day=3)
+    assert [limiter.try_acquire() for _ in range(3)] == [0, 0, 0]
+    # spent until the reset, however long the day has left
+    assert limiter.try_acquire() == pytest.approx(2 * 3600)
+    clock[0] += 3600
+    assert limiter.try_acquire() == pytest.approx(3600)
+    clock[0] += 3600
+    assert [limiter.try_acquire() for _ in range(3)] == [0, 0, 0]
+    assert limiter.try_acquire() == pytest.approx(DAY)
+
+
+def test_daily_reset_time(clock):
+    limiter = RateLimiter(per_day=1, day_reset=23 * 3600)
+    assert limiter.try_acquire() == 0
+    assert limiter.try_acquire() == pytest.approx(3600)
+
+
+def test_per_minute_limit_is_learned_from_the_headers(clock):
+    limiter = RateLimiter()
+    assert limiter.per_minute is None
+    limiter.observe({"x-ratelimit-limit": "10", "x-ratelimit-remaining": "1"})
+    assert limiter.per_minute == 10
+    assert limiter.try_acquire() == 0
+    assert limiter.try_acquire() > 0
+
+
+def test_acquire_timeout(clock):
+    limiter = RateLimiter(per_minute=1)
+    assert limiter.acquire(timeout=1)
+    assert not limiter.acquire(timeout=1)
+    assert limiter.stats()["timeouts"] == 1
+
+
+@pytest.mark.skipif(rate_limiter.fcntl is None, reason="the shared state file requires fcntl")
+def test_state_file_is_shared(clock, tmp_path):
+    path = str(tmp_path / "rate-limit.json")
+    first, second = RateLimiter(per_minute=2, state_file=path), RateLimiter(per_minute=2, state_file=path)
+    assert first.try_acquire() == 0
+    assert second.try_acquire() == 0
+    assert first.try_acquire() > 0
+    assert second.try_acquire() > 0
@@ -0,0 +1,146 @@
+import threading
+import time
+
+import pytest
+
+from footballAPIClient.Exceptions.APILimitExceededError import APILimitExceededError
+from footballAPIClient.helpers.RequestScheduler import BACKFILL, INTERACTIVE, LIVE, RequestScheduler, priority
+
+
+class Credit:
+
+    def __init__(self, available: int, maximum: int = 1000):
+        self.available_credit = available
+        self.max_credit = maximum
+
+
+class Limiter:
+    """
+    Lets a request through for each token released by the test.
+    """
+
+    def __init__(self, tokens: int = 0):
+        self.tokens = tokens
+        self._lock = threading.Lock()
+
+    def release(self, tokens: int = 1):
+        with self._lock:
+            self.tokens += tokens
+
+    def try_acquire(self):
+        with self._lock:
+            if self.tokens:
+                self.tokens -= 1
+                return 0
+            return 0.01
+
+
+def _wait_for(condition, timeout: float = 5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def _start(scheduler, limiter, calls, admitted, timeouts=None):
+    """
+    Start one thread per (priority class, tenant) call, each waiting in the scheduler in turn.
+    """
+    credit = Credit(1000)
+    timeouts = timeouts or {}
+    results = {}
+    threads = []
+
+    def call(index, priority_class, tenant):
+        with priority(priority_class, tenant):
+            results[index] = scheduler.admit(credit, limiter, timeout=timeouts.get(index))
+        admitted.append((priority_class, tenant))
+
+    for index, (priority_class, tenant) in enumerate(calls):
+        thread = threading.Thread(target=call, args=(index, priority_class, tenant), daemon=True)
+        thread.start()
+        threads.append(thread)
+        _wait_for(lambda: scheduler.stats()["waiting"] == index + 1)
+    return threads, results
+
+
+def _release_one_by_one(limiter, admitted, count):
+    for done in range(1, count + 1):
+        limiter.release()
+        _wait_for(lambda: len(admitted) == done)
+
+
+def test_reserved_credits():
+    scheduler = RequestScheduler(floors={LIVE: 0.10, INTERACTIVE: 50})
+    assert scheduler.reserved(LIVE, 1000) == 0
+    assert scheduler.reserved(INTERACTIVE, 1000) == 100
+    assert scheduler.reserved(BACKFILL, 1000) == 150
+    assert scheduler.allowed(BACKFILL, Credit(151)) and not scheduler.allowed(BACKFILL, Credit(150))
+    assert scheduler.allowed(LIVE, Credit(1))
+    with pytest.raises(ValueError):
+        RequestScheduler(floors={"batch": 10})
+
+
+def test_calls_below_the_floor_are_deferred():
+    scheduler = RequestScheduler(defer_timeout=0.05, recheck_interval=0.01)
+    credit = Credit(120)
+    with priority(BACKFILL):
+        with pytest.raises(APILimitExceededError):
+            scheduler.admit(credit, Limiter(1))
+    with priority(LIVE):
+        assert scheduler.admit(credit, Limiter(1))
+    stats = scheduler.stats()
+    assert stats["deferred"][BACKFILL] == 1 and stats["admitted"] == {LIVE: 1, INTERACTIVE: 0, BACKFILL: 0}
+
+
+def test_deferred_call_goes_once_the_quota_is_synced():
+    scheduler = RequestScheduler(recheck_interval=0.01)
+    credit = Credit(100)
+
+    def refresh():
+        credit.available_credit = 1000
+
+    with priority(BACKFILL):
+        assert scheduler.admit(credit, Limiter(1), refresh=refresh)
+
+
+def test_more_important_classes_go_first():
+    scheduler, limiter, admitted = RequestScheduler(), Limiter(), []
+    calls = [(BACKFILL, None), (INTERACTIVE, None), (BACKFILL, None), (LIVE, None)]
+    threads, _ = _start(scheduler, limiter, calls, admitted)
+    _release_one_by_one(limiter, admitted, len(calls))
+    for thread in threads:
+        thread.join()
+    assert [priority_class for priority_class, _ in admitted] == [LIVE, INTERACTIVE, BACKFILL, BACKFILL]
+
+
+def test_tenants_take_turns_by_weight():
+    scheduler, limiter, admitted = RequestScheduler(weights={"a": 2}), Limiter(), []
+    calls = [(BACKFILL, "a")] * 4 + [(BACKFILL, "b")] * 2
+    threads, _ = _start(scheduler, limiter, calls, admitted)
+    _release_one_by_one(limiter, admitted, len(calls))
+    for thread in threads:
+        thread.join()
+    assert [tenant for _, tenant in admitted] == ["a", "b", "a", "a", "b", "a"]
+    assert scheduler.stats()["tenants"] == {"a": 4, "b": 2}
+
+
+def test_timeout_only_counts_the_rate_limiter_waits():
+    scheduler, limiter, admitted = RequestScheduler(), Limiter(), []
+    threads, results = _start(scheduler, limiter, [(LIVE, None), (BACKFILL, None)], admitted,
+                                timeouts={1: 0.1})
+    # the backfill call waits behind the live call longer than its timeout
+    time.sleep(0.2)
+    assert results == {}
+    limiter.release(2)
+    for thread in threads:
+        thread.join()
+    assert results == {0: True, 1: True}
+
+
+def test_timeout_of_the_rate_limiter():
+    class Throttled:
+        def try_acquire(self):
+            return 1.0
+
+    assert RequestScheduler().admit(Credit(1000), Throttled(), timeout=0.1) is False
@@ -0,0 +1,54 @@
+from footballAPIClient.footballAPI import FootballAPI
+from footballAPIClient.helpers import ResponseCache as response_cache
+from footballAPIClient.helpers.ResponseCache import PAST_SEASON_TTL, ResponseCache
+from tests.fakes import FakeTransport, response
+
+
+class Clock:
+
+    def __init__(self, now: float = 1_700_000_000):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_their_ttl(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(response_cache.time, "time", clock)
+    cache = ResponseCache()
+    key = cache.make_key("countries", {"name": "england"})
+    cache.set(key, {"response": []}, ttl=60)
+    assert cache.get(key) == {"response": []}
+    clock.now += 61
+    assert cache.get(key) is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(maxsize=2)
+    first, second, third = (cache.make_key("venues", {"id": i}) for i in range(3))
+    cache.set(first, 1, ttl=60)
+    cache.set(second, 2, ttl=60)
+    cache.get(first)
+    cache.set(third, 3, ttl=60)
+    assert cache.get(second) is None
+    assert (cache.get(first), cache.get(third)) == (1, 3)
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttls_by_endpoint():
+    cache = ResponseCache(ttls={"venues": 0})
+    assert cache.ttl_for("countries", {}) == 7 * response_cache.DAY
+    assert cache.ttl_for("venues", {"id": 1}) == 0
+    assert cache.ttl_for("fixtures", {"live": "all"}) == response_cache.LIVE_FIXTURES_TTL
+    assert cache.ttl_for("fixtures", {"league": 39}) == 0
+    assert cache.ttl_for("fixtures/rounds", {"league": 39, "season": 2010}) == PAST_SEASON_TTL
+
+
+def test_client_serves_cached_responses():
+    transport = FakeTransport(lambda path, params: response(path, [{"name": "England"}]))
+    client = FootballAPI("api-sports", api_key="test", transport=transport, lazy=True)
+    assert client.get_countries(name="england") == client.get_countries(name="england")
+    client.get_countries(name="france")
+    assert transport.paths() == ["countries", "countries"]
@@ -0,0 +1,42 @@
+import copy
+import pickle
+
+from footballAPIClient.footballAPI import FootballAPI
+from footballAPIClient.responseModels import ApiResponse, Fixture
+from tests.fakes import FakeTransport, response
+from tests.payloads import event, fixture, standing, statistics
+
+
+def test_to_dict_gives_back_the_payload():
+    payloads = {
+        "fixtures": [fixture(1, events=[event(10)], statistics=[statistics(33)], extra_key={"kept": True})],
+        "fixtures/events": [event(10), event(20, kind="Card", detail="Yellow Card")],
+        "standings": [{"league": {"id": 39, "season": 2023, "standings": [[standing(1, 33, 30)]]}}],
+        "timezone": ["Europe/London"],
+    }
+    for path, items in payloads.items():
+        data = response(path, items)
+        expected = copy.deepcopy(data)
+        assert ApiResponse.from_dict(path, data).to_dict() == expected
+
+
+def test_models_read_like_dicts():
+    item = ApiResponse.from_dict("fixtures", response("fixtures", [fixture(7, goals=(3, 0))])).response[0]
+    assert isinstance(item, Fixture)
+    assert item.id == 7 and item.goals.home == 3
+    assert item["teams"]["home"]["name"] == "Team 33"
+    assert item.get("missing", "default") == "default"
+    assert item.events is None
+
+
+def test_pickled_response_is_equal():
+    data = ApiResponse.from_dict("fixtures", response("fixtures", [fixture(1)]))
+    assert pickle.loads(pickle.dumps(data)).to_dict() == data.to_dict()
+
+
+def test_client_returns_models():
+    transport = FakeTransport(lambda path, params: response(path, [fixture(1)]))
+    client = FootballAPI("api-sports", api_key="test", transport=transport, lazy=True, models=True)
+    data = client.get_fixtures(id=1)
+    assert isinstance(data, ApiResponse)
+    assert data.response[0].fixture.status.short == "FT"
@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.client import HTTPException
+
+import pytest
+
+from footballAPIClient.footballAPI import FootballAPI
+from footballAPIClient.helpers.RetryPolicy import RetryPolicy, parse_retry_after
+from tests.fakes import FakeResponse, FakeTransport, response
+
+
+def test_backoff_doubles_up_to_its_maximum():
+    policy = RetryPolicy(max_attempts=6, backoff_base=0.5, backoff_max=3, jitter=False)
+    assert [policy.next_delay("GET", attempt) for attempt in range(1, 6)] == [0.5, 1, 2, 3, 3]
+    assert policy.next_delay("GET", 6) is None
+    assert policy.stats()["retries"] == 5 and policy.stats()["give_ups"] == 1
+
+
+def test_jitter_stays_below_the_backoff():
+    policy = RetryPolicy(max_attempts=10, backoff_base=1, jitter=True)
+    assert all(0 <= policy.next_delay("GET", 3) <= 4 for _ in range(50))
+
+
+def test_non_idempotent_methods_are_not_retried():
+    assert RetryPolicy().next_delay("POST", 1) is None
+
+
+def test_retry_after_takes_precedence():
+    policy = RetryPolicy(backoff_max=30)
+    assert policy.next_delay("GET", 1, headers={"Retry-After": "7"}) == 7
+    # a longer wait than max_retry_after gives up with the response received
+    assert policy.next_delay("GET", 1, headers={"Retry-After": "86400"}) is None
+    assert RetryPolicy(max_retry_after=3600).next_delay("GET", 1, headers={"Retry-After": "600"}) == 600
+
+
+def test_no_retry_past_the_deadline():
+    policy = RetryPolicy(deadline=1)
+    assert policy.next_delay("GET", 1, policy.start(), headers={"Retry-After": "5"}) is None
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("12") == 12
+    assert parse_retry_after("-3") == 0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=120), usegmt=True)
+    assert 100 < parse_retry_after(later) <= 120
+
+
+def _client(statuses):
+    def handler(path, params):
+        status = statuses.pop(0)
+        return FakeResponse(response(path, [{"name": "England"}]) if status == 200 else {"message": "busy"},
+                            status_code=status)
+
+    transport = FakeTransport(handler)
+    client = FootballAPI("api-sports", api_key="test", transport=transport, lazy=True, cache_size=0,
+                         retry_policy=RetryPolicy(backoff_base=0, jitter=False))
+    return client, transport
+
+
+def test_retries_go_through_the_rate_limiter_and_the_quota():
+    client, transport = _client([503, 503, 200])
+    assert client.get_countries()["response"] == [{"name": "England"}]
+    assert transport.paths() == ["countries"] * 3
+    assert client.rate_limiter.stats()["acquired"] == 3
+    assert client.retry_policy.stats()["retried_statuses"] == 2
+
+
+def test_last_failure_is_raised():
+    client, transport = _client([503, 503, 503])
+    with pytest.raises(HTTPException):
+        client.get_countries()
+    assert transport.paths() == ["countries"] * 3
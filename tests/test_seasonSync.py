@@ -0,0 +1,47 @@
+from footballAPIClient.seasonSync import SeasonSync
+
+KICKOFF = 1_700_000_000
+
+
+class Client:
+    """
+    A season of three finished fixtures, the third one no longer served by id.
+    """
+
+    def __init__(self):
+        self.ids = []
+
+    @staticmethod
+    def item(fixture_id: int):
+        return {"fixture": {"id": fixture_id, "timestamp": KICKOFF, "status": {"short": "FT"}},
+                "goals": {"home": 1, "away": 0}, "events": [{"type": "Goal"}]}
+
+    def get_fixtures(self, league: int, season: int):
+        return {"response": [self.item(fixture_id) for fixture_id in (1, 2, 3)]}
+
+    def get_fixtures_bulk(self, ids):
+        self.ids.append(sorted(ids))
+        return {fixture_id: self.item(fixture_id) for fixture_id in ids if fixture_id != 3}
+
+
+class Sink:
+
+    def __init__(self):
+        self.writes = []
+
+    def write(self, path, responses, league=None, season=None):
+        self.writes.append(path)
+
+
+def test_final_and_missing_fixtures_are_not_fetched_again(tmp_path):
+    client, state = Client(), str(tmp_path / "sync.json")
+    sync = SeasonSync(client, Sink(), state=state, list_interval=0, clock=lambda: KICKOFF + 86400)
+    assert sync.sync([(39, 2023)])[0]["final"] == 2
+    assert client.ids == [[1, 2, 3]]
+    assert sorted(sync.fixtures(39, 2023)) == [1, 2]
+
+    # only a listing showing the missing fixture again has it fetched once more
+    sync = SeasonSync(client, Sink(), state=state, list_interval=0, clock=lambda: KICKOFF + 86400)
+    sync.sync([(39, 2023)])
+    assert client.ids == [[1, 2, 3], [3]]
+    assert sorted(sync.fixtures(39, 2023)) == [1, 2]
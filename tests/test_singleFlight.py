@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from footballAPIClient.helpers.SingleFlight import SingleFlight
+
+
+def test_concurrent_threads_share_one_call():
+    flight, started, release = SingleFlight(), threading.Event(), threading.Event()
+    calls, results = [], []
+
+    def fn():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "fixtures"
+
+    leader = threading.Thread(target=lambda: results.append(flight.do("key", fn)))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(flight.do("key", fn))) for _ in range(4)]
+    for thread in followers:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while flight.stats()["coalesced"] < 4 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join(5)
+    assert calls == [1]
+    assert results == ["fixtures"] * 5
+    assert flight.stats() == {"leaders": 1, "coalesced": 4, "in_flight": 0}
+
+
+def test_the_error_is_shared_and_the_key_released():
+    flight = SingleFlight()
+    with pytest.raises(ValueError):
+        flight.do("key", lambda: (_ for _ in ()).throw(ValueError("boom")))
+    assert flight.do("key", lambda: 2) == 2
+
+
+def test_concurrent_coroutines_share_one_call():
+    flight, calls = SingleFlight(), []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "fixtures"
+
+    async def main():
+        return await asyncio.gather(*(flight.do_async("key", fetch) for _ in range(5)),
+                                    flight.do_async("other", fetch))
+
+    assert asyncio.run(main()) == ["fixtures"] * 6
+    assert calls == [1, 1]
+    assert flight.stats()["coalesced"] == 4
+
+
+def test_coroutines_share_the_error():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(*(flight.do_async("key", fail) for _ in range(3)), return_exceptions=True)
+
+    errors = asyncio.run(main())
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert flight.stats()["in_flight"] == 0
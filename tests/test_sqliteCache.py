@@ -0,0 +1,45 @@
+from footballAPIClient.footballAPI import FootballAPI
+from footballAPIClient.helpers.SqliteCache import SqliteCache
+from tests.fakes import FakeResponse, FakeTransport, response
+
+
+def test_responses_survive_a_restart(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = SqliteCache(path)
+    key = ("countries", (("name", "england"),))
+    cache.set(key, {"response": [{"name": "England"}]}, ttl=60, validators={"etag": '"v1"'})
+    cache.close()
+
+    cache = SqliteCache(path)
+    value, expires, validators = cache.get(key)
+    assert value == {"response": [{"name": "England"}]}
+    assert validators == {"etag": '"v1"'}
+    assert cache.get(("countries", ())) is None
+
+
+def test_purge_keeps_the_revalidable_responses(tmp_path):
+    cache = SqliteCache(str(tmp_path / "cache.db"))
+    cache.set("expired", 1, ttl=-1)
+    cache.set("revalidable", 2, ttl=-1, validators={"last_modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    cache.purge_expired()
+    assert cache.get("expired") is None
+    assert cache.get("revalidable")[0] == 2
+
+
+def test_expired_response_is_revalidated(tmp_path, monkeypatch):
+    now = [1_700_000_000]
+    monkeypatch.setattr("time.time", lambda: now[0])
+    statuses = [200, 304]
+
+    def handler(path, params):
+        return FakeResponse(response(path, [{"name": "England"}]) if statuses[0] == 200 else {},
+                            status_code=statuses.pop(0), headers={"ETag": '"v1"'})
+
+    transport = FakeTransport(handler)
+    client = FootballAPI("api-sports", api_key="test", transport=transport, lazy=True,
+                         cache_backend=SqliteCache(str(tmp_path / "cache.db")), cache_ttls={"countries": 60})
+    first = client.get_countries(name="england")
+    now[0] += 61
+    assert client.get_countries(name="england") == first
+    assert transport.headers["If-None-Match"] == '"v1"'
+    assert transport.paths() == ["countries", "countries"]
@@ -0,0 +1,38 @@
+from http.client import HTTPException
+
+import pytest
+
+from footballAPIClient.footballAPI import FootballAPI
+from tests.fakes import FakeResponse, FakeTransport, response
+
+
+def _client(handler):
+    transport = FakeTransport(handler)
+    return FootballAPI("api-sports", api_key="test", transport=transport, lazy=True, cache_size=0), transport
+
+
+def test_stream_items():
+    client, transport = _client(lambda path, params: response(path, [{"fixture": {"id": i}} for i in range(5)]))
+    with client:
+        ids = [item["fixture"]["id"] for item in client.stream("fixtures", chunk_size=7, league=39, season=2023)]
+    assert ids == [0, 1, 2, 3, 4]
+    assert transport.paths() == ["fixtures"]
+
+
+def test_stream_raw_closes_response():
+    body = response("fixtures", [{"fixture": {"id": 1}}])
+    sent = FakeResponse(body)
+    client, _ = _client(lambda path, params: sent)
+    with client:
+        raw = b"".join(client.stream_raw("fixtures", chunk_size=5, league=39, season=2023))
+    assert raw == sent.content
+    assert sent.closed
+
+
+def test_stream_error_closes_response():
+    sent = FakeResponse({"message": "not found"}, status_code=404)
+    client, _ = _client(lambda path, params: sent)
+    with client:
+        with pytest.raises(HTTPException):
+            client.stream("fixtures", league=39, season=2023)
+    assert sent.closed